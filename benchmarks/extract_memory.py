@@ -0,0 +1,79 @@
+"""Peak-RSS benchmark: buffered vs streaming PDF text extraction.
+
+Usage:
+    python benchmarks/extract_memory.py [--pages 10 50 100 200] [--lines 50]
+
+Generates text-heavy PDFs of growing length and extracts each one in a
+fresh interpreter, so the reported peak resident set size belongs to that
+run alone. ``buffered`` is the previous path (pdfplumber document open
+across all pages, text accumulated by string concatenation); ``streaming``
+is CVExtractor, which releases every page's caches after extracting it.
+"""
+
+import argparse
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import List
+
+# Shares the test suite's PDF writer
+sys.path.insert(0, str(Path(__file__).parent.parent / "tests"))
+from conftest import make_pdf  # noqa: E402
+
+BUFFERED = """
+import pdfplumber
+with pdfplumber.open(PATH) as pdf:
+    text = ""
+    for page in pdf.pages:
+        page_text = page.extract_text()
+        if page_text:
+            text += page_text + "\\n"
+"""
+
+STREAMING = """
+from resume_ats.extractors import CVExtractor
+text = CVExtractor(PATH).text
+"""
+
+REPORT = """
+import resource
+print(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss, len(text))
+"""
+
+
+def peak_rss(code: str, path: Path) -> List[int]:
+    """Peak RSS in KiB and extracted characters of one fresh run."""
+    script = f"PATH = {str(path)!r}\n{code}{REPORT}"
+    result = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, check=True
+    )
+    return [int(value) for value in result.stdout.split()]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, nargs="+", default=[10, 50, 100, 200])
+    parser.add_argument("--lines", type=int, default=50)
+    args = parser.parse_args()
+
+    directory = Path(tempfile.mkdtemp())
+    print(f"{'pages':>6} {'buffered':>12} {'streaming':>12}")
+    for pages in args.pages:
+        path = directory / f"{pages}.pdf"
+        lines = [
+            [
+                f"Page {page} line {line}: Kubernetes, Terraform and Python"
+                for line in range(args.lines)
+            ]
+            for page in range(pages)
+        ]
+        make_pdf(path, lines, compress=True)
+        buffered, buffered_chars = peak_rss(BUFFERED, path)
+        streaming, streaming_chars = peak_rss(STREAMING, path)
+        assert buffered_chars == streaming_chars
+        print(f"{pages:>6} {buffered / 1024:>8.0f} MiB {streaming / 1024:>8.0f} MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,215 @@
+"""Trusted construction and frozen render views vs the validated path.
+
+Usage:
+    python benchmarks/model_construct.py [--jobs 10 2000] [--repeat 5]
+
+Data that was validated once (cached, queued or retried) does not strictly
+need Pydantic validation again. This compares, per resume size:
+
+* ``validate``: ``ResumeData.model_validate()`` of the raw dict, as
+  load_resume() does
+* ``validate_json``: ``ResumeData.model_validate_json()``, as the NDJSON
+  stream and the spool do
+* ``construct``: recursive ``model_construct()``, skipping validation
+* ``trusted``: the same with the field walk precompiled per model and the
+  instances assembled without ``model_construct()``
+
+and, for rendering the LaTeX template:
+
+* ``models``: the Pydantic models passed to Jinja as they are
+* ``view``: a frozen, slotted namedtuple view built from the models; the
+  time includes building the view
+
+Best of ``--repeat`` runs is reported.
+"""
+
+import argparse
+import time
+import typing
+from collections import namedtuple
+from functools import cache
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Type
+
+from pydantic import BaseModel
+
+from resume_ats import ResumeBuilder
+from resume_ats.models import BuildConfig, ResumeData
+
+ROOT = Path(__file__).parent.parent
+TEMPLATE = "awesomecv.tex.j2"
+
+Converter = Optional[Callable[[Any], Any]]
+
+
+def synthetic_raw(jobs: int) -> Dict[str, Any]:
+    """Raw data of a resume with ``jobs`` positions, as loaded from YAML."""
+    return {
+        "basics": {
+            "name": "Bench Mark",
+            "email": "bench@example.com",
+            "label": "SRE",
+            "location": {"city": "Paris", "countryCode": "FR"},
+            "profiles": [
+                {"network": "GitHub", "username": "bench", "url": "https://x.y"}
+            ],
+        },
+        "work": [
+            {
+                "company": f"Company {i}",
+                "position": "Site Reliability Engineer",
+                "startDate": "2020-01",
+                "endDate": "2021-01",
+                "highlights": [
+                    f"Ran **Kubernetes** clusters #{i}-{j} with 99.99% uptime"
+                    for j in range(10)
+                ],
+            }
+            for i in range(jobs)
+        ],
+        "education": [
+            {"institution": "MIT", "area": "CS", "studyType": "MSc"}
+            for _ in range(max(1, jobs // 10))
+        ],
+        "skills": [{"name": "Ops", "keywords": ["Kubernetes", "Terraform"]}, "Go"]
+        * max(1, jobs // 10),
+        "languages": [{"language": "English", "fluency": "Native"}, "French"],
+    }
+
+
+def construct(annotation: Any, value: Any) -> Any:
+    """Recursive model_construct() following the field annotations."""
+    if value is None:
+        return value
+    origin = typing.get_origin(annotation)
+    if origin is typing.Union:
+        if isinstance(value, dict):
+            for arg in typing.get_args(annotation):
+                if isinstance(arg, type) and issubclass(arg, BaseModel):
+                    return construct(arg, value)
+        return value
+    if origin is list:
+        (item,) = typing.get_args(annotation)
+        return [construct(item, v) for v in value]
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return annotation.model_construct(
+            **{
+                name: construct(field.annotation, value[name])
+                for name, field in annotation.model_fields.items()
+                if name in value
+            }
+        )
+    return value
+
+
+def compile_trusted(annotation: Any) -> Converter:
+    """Precompiled trusted constructor; None if values pass through."""
+    origin = typing.get_origin(annotation)
+    if origin is typing.Union:
+        models = [
+            a
+            for a in typing.get_args(annotation)
+            if isinstance(a, type) and issubclass(a, BaseModel)
+        ]
+        if not models:
+            return None
+        inner = compile_trusted(models[0])
+        return lambda v: inner(v) if isinstance(v, dict) else v
+    if origin is list:
+        inner = compile_trusted(typing.get_args(annotation)[0])
+        return list if inner is None else (lambda v: [inner(x) for x in v])
+    if not (isinstance(annotation, type) and issubclass(annotation, BaseModel)):
+        return None
+
+    model: Type[BaseModel] = annotation
+    fields = [
+        (name, compile_trusted(field.annotation), field)
+        for name, field in model.model_fields.items()
+    ]
+
+    def build(value: Dict[str, Any]) -> BaseModel:
+        state = {}
+        for name, convert, field in fields:
+            if name in value:
+                v = value[name]
+                state[name] = convert(v) if convert and v is not None else v
+            else:
+                state[name] = field.get_default(call_default_factory=True)
+        instance = model.__new__(model)
+        object.__setattr__(instance, "__dict__", state)
+        object.__setattr__(instance, "__pydantic_fields_set__", set(value))
+        object.__setattr__(instance, "__pydantic_extra__", None)
+        object.__setattr__(instance, "__pydantic_private__", None)
+        return instance
+
+    return build
+
+
+@cache
+def view_type(model: Type[BaseModel]) -> Type[tuple]:
+    """Frozen, slotted namedtuple mirroring a model's fields."""
+    return namedtuple(f"{model.__name__}View", list(model.model_fields))
+
+
+def freeze(value: Any) -> Any:
+    """Frozen view of a model tree; lists become tuples."""
+    if isinstance(value, BaseModel):
+        fields = type(value).model_fields
+        return view_type(type(value))(*(freeze(getattr(value, n)) for n in fields))
+    if isinstance(value, list):
+        return tuple(freeze(v) for v in value)
+    return value
+
+
+def best(repeat: int, run: Callable[[], Any]) -> float:
+    """Best wall time of ``repeat`` runs, in milliseconds."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        times.append(time.perf_counter() - start)
+    return min(times) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--jobs", type=int, nargs="+", default=[10, 2000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    trusted = compile_trusted(ResumeData)
+    assert trusted is not None
+    for jobs in args.jobs:
+        raw = synthetic_raw(jobs)
+        data = ResumeData.model_validate(raw)
+        text = data.model_dump_json()
+        assert construct(ResumeData, raw) == data == trusted(raw)
+
+        print(f"\n{jobs} jobs")
+        for label, run in (
+            ("validate", lambda: ResumeData.model_validate(raw)),
+            ("validate_json", lambda: ResumeData.model_validate_json(text)),
+            ("construct", lambda: construct(ResumeData, raw)),
+            ("trusted", lambda: trusted(raw)),
+        ):
+            print(f"{label:<14} {best(args.repeat, run):>9.2f} ms")
+
+        builder = ResumeBuilder.from_data(
+            data, BuildConfig(template_dir=ROOT / "templates")
+        )
+        template = builder.jinja_env.get_template(TEMPLATE)
+
+        def render_view() -> str:
+            view = freeze(data)
+            return template.render(dict(zip(view._fields, view)))
+
+        assert render_view() == template.render(builder._render_context({}))
+        for label, run in (
+            ("render models", lambda: template.render(builder._render_context({}))),
+            ("render view", render_view),
+        ):
+            print(f"{label:<14} {best(args.repeat, run):>9.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""Worker start-up benchmark: cold spawned workers vs forks of a warm parent.
+
+Usage:
+    python benchmarks/pool_startup.py [--workers 4]
+
+A cold worker starts a fresh interpreter, imports resume_ats (pdfplumber,
+Jinja2, Pydantic, rich), compiles the templates and loads the skill
+taxonomy. A WarmPool worker is forked from a parent that already did all
+of that. Reported times run from pool creation until every worker has
+answered a first job.
+"""
+
+import argparse
+import multiprocessing
+import os
+import time
+from pathlib import Path
+from typing import Callable
+
+from resume_ats import metrics, pool
+
+ROOT = Path(__file__).parent.parent
+TEMPLATES = ROOT / "templates"
+
+
+def ready(_: int) -> int:
+    """First job of a worker: report its pid once warm."""
+    return os.getpid()
+
+
+def cold_init() -> None:
+    """Worker initializer of the cold baseline."""
+    pool._init_worker(TEMPLATES, metrics.REGISTRY.enabled)
+
+
+def until_ready(workers: int, make_pool: Callable[[], "multiprocessing.pool.Pool"]):
+    """Seconds from pool creation until every worker served a job."""
+    start = time.perf_counter()
+    with make_pool() as workers_pool:
+        pids = set()
+        while len(pids) < workers:
+            # One blocking job per worker, so every worker has to start
+            pids.update(workers_pool.map(ready, range(workers), chunksize=1))
+        elapsed = time.perf_counter() - start
+        workers_pool.terminate()
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    cold = until_ready(
+        args.workers,
+        lambda: multiprocessing.get_context("spawn").Pool(
+            args.workers, initializer=cold_init
+        ),
+    )
+
+    start = time.perf_counter()
+    warm_pool = pool.WarmPool(TEMPLATES, processes=args.workers)
+    parent = time.perf_counter() - start
+    warm = until_ready(args.workers, lambda: warm_pool._pool) + parent
+
+    print(f"{args.workers} workers")
+    print(f"{'cold':<10} {cold * 1000:>8.1f} ms total")
+    print(
+        f"{'warm':<10} {warm * 1000:>8.1f} ms total ({parent * 1000:.1f} ms parent warm-up)"
+    )
+    print(
+        f"{'per worker':<10} cold {cold / args.workers * 1000:.1f} ms, "
+        f"warm {(warm - parent) / args.workers * 1000:.1f} ms after warm-up"
+    )
+
+
+if __name__ == "__main__":
+    main()
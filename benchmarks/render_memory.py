@@ -0,0 +1,90 @@
+"""Peak-memory benchmark: string rendering vs streaming to a file.
+
+Usage:
+    python benchmarks/render_memory.py [--jobs 2000] [--highlights 10]
+
+Compares the previous path (``model_dump()`` + ``template.render()`` +
+``write_text()``) with ``ResumeBuilder.write_template()``, which passes the
+models to Jinja and writes ``generate()`` chunks straight to the file.
+"""
+
+import argparse
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable
+
+from resume_ats import ResumeBuilder
+from resume_ats.models import BuildConfig, ResumeData
+
+ROOT = Path(__file__).parent.parent
+
+
+def synthetic_resume(jobs: int, highlights: int) -> ResumeData:
+    """Build a large resume."""
+    return ResumeData(
+        basics={"name": "Bench Mark", "email": "bench@example.com", "label": "SRE"},
+        work=[
+            {
+                "company": f"Company {i}",
+                "position": "Site Reliability Engineer",
+                "startDate": "2020-01",
+                "endDate": "2021-01",
+                "highlights": [
+                    f"Ran **Kubernetes** clusters #{i}-{j} with 99.99% uptime & more"
+                    for j in range(highlights)
+                ],
+            }
+            for i in range(jobs)
+        ],
+        skills=[{"name": "Ops", "keywords": ["Kubernetes", "Terraform"]}],
+    )
+
+
+def measure(label: str, run: Callable[[], None]) -> None:
+    """Print wall time and peak traced allocation of one run."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    run()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<10} peak {peak / 1024:>10.0f} KiB   {elapsed * 1000:>8.1f} ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--jobs", type=int, default=2000)
+    parser.add_argument("--highlights", type=int, default=10)
+    args = parser.parse_args()
+
+    data = synthetic_resume(args.jobs, args.highlights)
+    output = Path(tempfile.mkdtemp())
+    builder = ResumeBuilder.from_data(
+        data, BuildConfig(template_dir=ROOT / "templates", output_dir=output)
+    )
+
+    for template in ("awesomecv.tex.j2", "simple.html.j2"):
+        # Compile the template outside the measurement
+        builder.jinja_env.get_template(template)
+        target = output / template.replace(".j2", "")
+
+        def string() -> None:
+            jinja_template = builder.jinja_env.get_template(template)
+            content = jinja_template.render(**data.model_dump())
+            target.write_text(content, encoding="utf-8")
+
+        def stream() -> None:
+            builder.write_template(template, target)
+
+        size = 0
+        print(f"\n{template} ({args.jobs} jobs x {args.highlights} highlights)")
+        for label, run in (("string", string), ("stream", stream)):
+            measure(label, run)
+            size = target.stat().st_size
+        print(f"{'output':<10} size {size / 1024:>10.0f} KiB")
+
+
+if __name__ == "__main__":
+    main()
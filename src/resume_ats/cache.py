@@ -0,0 +1,64 @@
+"""On-disk cache helpers shared by the compiled indexes."""
+
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+
+
+def cache_dir(*parts: str) -> Path:
+    """Return (and create) a directory inside the resume-ats cache.
+
+    The cache root is ``$RESUME_ATS_CACHE_DIR`` if set, otherwise
+    ``$XDG_CACHE_HOME/resume-ats`` (``~/.cache/resume-ats`` by default).
+
+    Args:
+        *parts: Optional sub-directory components
+
+    Returns:
+        Path to the cache directory
+    """
+    root = os.environ.get("RESUME_ATS_CACHE_DIR")
+    if root:
+        path = Path(root)
+    else:
+        xdg = os.environ.get("XDG_CACHE_HOME")
+        path = (Path(xdg) if xdg else Path.home() / ".cache") / "resume-ats"
+
+    path = path.joinpath(*parts)
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Write bytes to a file so readers never observe a partial file.
+
+    Args:
+        path: Destination path
+        data: Content to write
+    """
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+def file_digest(path: Path, chunk_size: int = 1 << 20) -> str:
+    """Hash a file's content for content-addressed caching.
+
+    Args:
+        path: File to hash
+        chunk_size: Read size in bytes
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
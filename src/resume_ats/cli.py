@@ -1,18 +1,32 @@
 """Command-line interface for resume-ats."""
 
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 import typer
 from rich.console import Console
+from rich.markup import escape
 from rich.panel import Panel
 from rich.table import Table
 
-from . import __version__
-from .core import ResumeBuilder
+from . import __version__, metrics
+from .consensus import BACKENDS, consensus
+from .core import ResumeBuilder, iter_resumes, load_resume
 from .exceptions import ResumeATSError
+from .export import COMPRESSIONS, EXPORT_FORMATS, BulkExporter
 from .extractors import CVExtractor
-from .models import BuildConfig
+from .formats import FORMATS
+from .journal import JOURNAL_NAME, BuildJournal, settings_digest
+from .latex import describe_failure
+from .models import BuildConfig, CompileResult, JobStatus, ValidationReport
+from .pool import WarmPool
+from .precheck import precheck, render_ats_text
+from .preflight import preflight as run_preflight
+from .reports import REPORT_FORMATS, ReportWriter
+from .search import ResumeIndex, iter_pdfs
+from .site import SiteBuilder
+from .spool import Spool, SpoolWorker
+from .validation import validate_pdf
 
 app = typer.Typer(
     name="resume-ats",
@@ -20,6 +34,8 @@ app = typer.Typer(
     rich_markup_mode="rich",
 )
 console = Console()
+# Diagnostics that must not mix with reports written to stdout
+err_console = Console(stderr=True)
 
 
 def version_callback(value: bool) -> None:
@@ -38,9 +54,66 @@ def main(
         callback=version_callback,
         help="Show version and exit.",
     ),
+    metrics_port: Optional[int] = typer.Option(
+        None,
+        "--metrics-port",
+        help="Serve OpenMetrics on http://127.0.0.1:PORT/metrics while running.",
+    ),
+    metrics_textfile: Optional[Path] = typer.Option(
+        None,
+        "--metrics-textfile",
+        help="Write OpenMetrics to this node-exporter textfile (.prom).",
+    ),
 ) -> None:
     """Resume ATS - Generate professional, ATS-friendly resumes."""
-    pass
+    if metrics_port is not None:
+        metrics.serve(metrics_port)
+    if metrics_textfile is not None:
+        metrics.start_textfile_writer(metrics_textfile)
+
+
+def print_validation_report(
+    report: ValidationReport, show_skills: bool = False
+) -> None:
+    """Print a validation report as rich tables."""
+    table = Table(title="ATS Validation Results")
+    table.add_column("Field", style="cyan")
+    table.add_column("Expected", style="blue")
+    table.add_column("Found", style="yellow")
+    table.add_column("Status", style="bold")
+
+    for result in report.fields:
+        status = "[green]✅ PASS[/green]" if result.passed else "[red]❌ FAIL[/red]"
+        table.add_row(result.name, result.expected, result.found, status)
+
+    console.print(table)
+
+    if show_skills and report.skills:
+        skills_table = Table(title="Skill Matches")
+        skills_table.add_column("Skill", style="cyan")
+        skills_table.add_column("Match", style="bold")
+        skills_table.add_column("Matched", style="yellow")
+        skills_table.add_column("Score", justify="right")
+
+        for match in report.skills:
+            style = "red" if match.match_type == "missing" else "green"
+            skills_table.add_row(
+                match.skill,
+                f"[{style}]{match.match_type}[/{style}]",
+                match.matched or "",
+                f"{match.score:.2f}",
+            )
+
+        console.print(skills_table)
+
+    if report.passed:
+        console.print(
+            "\n[green]🎉 All validations passed! Your resume is ATS-friendly.[/green]"
+        )
+    else:
+        console.print(
+            "\n[red]⚠️  Some validations failed. Check the results above.[/red]"
+        )
 
 
 @app.command()
@@ -53,7 +126,7 @@ def build(
         dir_okay=False,
     ),
     formats: List[str] = typer.Option(
-        ["pdf"], "--format", "-f", help="Output formats to generate."
+        ["pdf"], "--format", "-f", help=f"Output formats: {', '.join(FORMATS)}."
     ),
     output_dir: Path = typer.Option(
         Path("build"), "--output", "-o", help="Output directory for generated files."
@@ -64,6 +137,29 @@ def build(
     template_dir: Path = typer.Option(
         Path("templates"), "--templates", "-t", help="Template directory path."
     ),
+    validate_output: bool = typer.Option(
+        False,
+        "--validate",
+        help="Validate generated PDFs against the resume data in-process.",
+    ),
+    timeout: float = typer.Option(
+        120.0, "--timeout", help="Wall-clock limit of each XeLaTeX run in seconds."
+    ),
+    check: bool = typer.Option(
+        False,
+        "--check",
+        help="Check the LaTeX with a fast XDV-only run before compiling the PDF.",
+    ),
+    optimize: bool = typer.Option(
+        False,
+        "--optimize",
+        help="Linearize and compact the PDF for the web (pikepdf or qpdf).",
+    ),
+    preflight: bool = typer.Option(
+        False,
+        "--preflight/--no-preflight",
+        help="Check that LaTeX packages and fonts are installed before compiling.",
+    ),
 ) -> None:
     """Build resume in specified formats."""
     try:
@@ -72,6 +168,11 @@ def build(
             output_dir=output_dir,
             clean_build=clean,
             formats=formats,
+            validate_output=validate_output,
+            compile_timeout=timeout,
+            check_latex=check,
+            optimize_pdf=optimize,
+            preflight=preflight,
         )
 
         builder = ResumeBuilder.from_yaml(yaml_file, config)
@@ -88,9 +189,203 @@ def build(
         console.print(table)
 
     except ResumeATSError as e:
-        console.print(f"[red]❌ Build failed: {e}[/red]")
+        console.print(f"[red]❌ Build failed: {escape(str(e))}[/red]")
+        raise typer.Exit(code=1)
+
+    for report in builder.validation_reports.values():
+        print_validation_report(report)
+    if not all(r.passed for r in builder.validation_reports.values()):
+        raise typer.Exit(code=1)
+
+
+@app.command()
+def batch(
+    source: Path = typer.Argument(
+        help="Multi-document YAML stream or NDJSON (.jsonl/.ndjson) file.",
+        exists=True,
+        file_okay=True,
+        dir_okay=False,
+    ),
+    formats: List[str] = typer.Option(
+        ["pdf"], "--format", "-f", help=f"Output formats: {', '.join(FORMATS)}."
+    ),
+    output_dir: Path = typer.Option(
+        Path("build"), "--output", "-o", help="Parent directory of the outputs."
+    ),
+    template_dir: Path = typer.Option(
+        Path("templates"), "--templates", "-t", help="Template directory path."
+    ),
+    validate_output: bool = typer.Option(
+        False,
+        "--validate",
+        help="Validate generated PDFs against the resume data in-process.",
+    ),
+    timeout: float = typer.Option(
+        120.0, "--timeout", help="Wall-clock limit of each XeLaTeX run in seconds."
+    ),
+    workers: int = typer.Option(
+        1, "--workers", "-j", help="Build in this many pre-warmed worker processes."
+    ),
+    preflight: bool = typer.Option(
+        False,
+        "--preflight/--no-preflight",
+        help="Check that LaTeX packages and fonts are installed before compiling.",
+    ),
+    resume: bool = typer.Option(
+        False,
+        "--resume",
+        help="Skip resumes the journal records as built from identical input.",
+    ),
+    journal_path: Optional[Path] = typer.Option(
+        None,
+        "--journal",
+        help=f"Build journal. Defaults to OUTPUT/{JOURNAL_NAME}.",
+    ),
+) -> None:
+    """Build every resume of a multi-document stream."""
+    config = BuildConfig(
+        template_dir=template_dir,
+        output_dir=output_dir,
+        formats=formats,
+        validate_output=validate_output,
+        compile_timeout=timeout,
+        preflight=preflight,
+    )
+    failures = 0
+
+    def skip(index: int, error: Exception) -> None:
+        nonlocal failures
+        failures += 1
+        console.print(f"[red]❌ #{index}: invalid resume: {error}[/red]")
+
+    journal = BuildJournal(
+        journal_path or output_dir / JOURNAL_NAME,
+        settings_digest(formats, template_dir),
+        resume=resume,
+    )
+    resumes = journal.pending(iter_resumes(source, on_error=skip))
+    pool = WarmPool(template_dir, processes=workers) if workers > 1 else None
+    if pool:
+        items = pool.build_stream(resumes, config)
+    else:
+        items = ResumeBuilder(config).build_stream(resumes)
+
+    try:
+        for item in items:
+            journal.record(item)
+            if item.error:
+                failures += 1
+                console.print(
+                    f"[red]❌ #{item.index} {item.name}: {escape(item.error)}[/red]"
+                )
+            elif not item.passed:
+                failures += 1
+                console.print(
+                    f"[yellow]⚠️  #{item.index} {item.name}: validation failed[/yellow]"
+                )
+            else:
+                console.print(f"✅ #{item.index} {item.name}: {item.output_dir}")
+    except ResumeATSError as e:
+        console.print(f"[red]❌ Batch build failed: {escape(str(e))}[/red]")
+        raise typer.Exit(code=1)
+    finally:
+        journal.close()
+        if pool:
+            pool.close()
+
+    if journal.skipped:
+        console.print(f"⏭️  {journal.skipped} unchanged resume(s) skipped")
+    if failures:
+        console.print(f"[red]{failures} resume(s) failed[/red]")
+        raise typer.Exit(code=1)
+
+
+@app.command()
+def export(
+    source: Path = typer.Argument(
+        help="Resume YAML, multi-document YAML stream or NDJSON file.",
+        exists=True,
+        file_okay=True,
+        dir_okay=False,
+    ),
+    output: Path = typer.Argument(help="Export file, e.g. resumes.ndjson.zst."),
+    export_format: str = typer.Option(
+        "ndjson", "--format", "-f", help=f"Format: {', '.join(EXPORT_FORMATS)}."
+    ),
+    compression: Optional[str] = typer.Option(
+        None,
+        "--compression",
+        "-c",
+        help=f"{', '.join(COMPRESSIONS)} (default: from the file suffix).",
+    ),
+    level: int = typer.Option(3, "--level", help="Compression level."),
+) -> None:
+    """Export many resumes into one NDJSON or MessagePack stream."""
+    skipped = 0
+
+    def skip(index: int, error: Exception) -> None:
+        nonlocal skipped
+        skipped += 1
+        console.print(f"[yellow]⚠️  #{index}: invalid resume skipped: {error}[/yellow]")
+
+    try:
+        with BulkExporter(output, export_format, compression, level) as exporter:
+            exporter.write_all(r for _, r in iter_resumes(source, on_error=skip))
+    except ResumeATSError as e:
+        console.print(f"[red]❌ Export failed: {escape(str(e))}[/red]")
+        raise typer.Exit(code=1)
+
+    console.print(
+        f"📦 Exported {exporter.count} resume(s) to {output}"
+        + (f" ({skipped} skipped)" if skipped else "")
+    )
+
+
+@app.command()
+def site(
+    source: Path = typer.Argument(
+        help="Resume YAML, multi-document YAML stream or NDJSON file.",
+        exists=True,
+        file_okay=True,
+        dir_okay=False,
+    ),
+    output_dir: Path = typer.Option(
+        Path("site"), "--output", "-o", help="Root directory of the site."
+    ),
+    template_dir: Path = typer.Option(
+        Path("templates"), "--templates", "-t", help="Template directory path."
+    ),
+    logos_dir: Path = typer.Option(
+        Path("logos"), "--logos", help="Directory of the logos used by resumes."
+    ),
+    compress: bool = typer.Option(
+        True, "--compress/--no-compress", help="Write .gz/.br siblings."
+    ),
+) -> None:
+    """Render many resumes into one static HTML site with shared assets."""
+    builder = SiteBuilder(
+        output_dir, template_dir=template_dir, logos_dir=logos_dir, compress=compress
+    )
+    pages = 0
+
+    def page(index: int, path: str) -> None:
+        nonlocal pages
+        pages += 1
+
+    def skip(index: int, error: Exception) -> None:
+        console.print(f"[yellow]⚠️  #{index}: invalid resume skipped: {error}[/yellow]")
+
+    try:
+        manifest = builder.build(iter_resumes(source, on_error=skip), on_page=page)
+    except ResumeATSError as e:
+        console.print(f"[red]❌ Site build failed: {e}[/red]")
         raise typer.Exit(code=1)
 
+    assets = sum(1 for path in manifest if path.startswith("assets/"))
+    console.print(
+        f"🌐 Site written to {output_dir}: {pages} page(s), {assets} shared asset(s)"
+    )
+
 
 @app.command()
 def extract(
@@ -103,10 +398,16 @@ def extract(
     output_format: str = typer.Option(
         "table", "--format", "-f", help="Output format: table, json, yaml."
     ),
+    max_pages: Optional[int] = typer.Option(
+        None, "--max-pages", help="Read at most this many pages."
+    ),
+    max_bytes: Optional[int] = typer.Option(
+        None, "--max-bytes", help="Keep at most this many bytes of text."
+    ),
 ) -> None:
     """Extract data from generated PDF for ATS validation."""
     try:
-        extractor = CVExtractor(pdf_file)
+        extractor = CVExtractor(pdf_file, max_pages=max_pages, max_bytes=max_bytes)
         data = extractor.extract_all()
 
         if output_format == "table":
@@ -147,6 +448,77 @@ def extract(
         raise typer.Exit(code=1)
 
 
+@app.command("consensus")
+def consensus_command(
+    pdf_file: Path = typer.Argument(
+        help="PDF file to parse.",
+        exists=True,
+        file_okay=True,
+        dir_okay=False,
+    ),
+    backends: Optional[List[str]] = typer.Option(
+        None,
+        "--backend",
+        "-b",
+        help=f"Text backends to compare (default: all of {', '.join(BACKENDS)}).",
+    ),
+    min_agreement: float = typer.Option(
+        0.0,
+        "--min-agreement",
+        help="Fail if any field's agreement is below this share (0-1).",
+    ),
+) -> None:
+    """Compare the fields several PDF parsers extract from one resume."""
+    try:
+        report = consensus(pdf_file, backends)
+    except ResumeATSError as e:
+        console.print(f"[red]❌ Consensus check failed: {escape(str(e))}[/red]")
+        raise typer.Exit(code=1)
+
+    parsers = Table(title=f"Parsers for {pdf_file.name}")
+    parsers.add_column("Backend", style="cyan")
+    parsers.add_column("Time", justify="right")
+    parsers.add_column("Status")
+    for parser in report.parsers:
+        if parser.data:
+            status = "[green]ok[/green]"
+        elif parser.skipped:
+            status = f"[yellow]skipped, {escape(parser.error or '')}[/yellow]"
+        else:
+            status = f"[red]failed, {escape(parser.error or '')}[/red]"
+        parsers.add_row(parser.backend, f"{parser.seconds * 1000:.0f} ms", status)
+    console.print(parsers)
+
+    counted = sum(not p.skipped for p in report.parsers)
+    fields = Table(
+        title="Field agreement",
+        caption=f"Across {counted} backend(s); failed backends count as empty, "
+        "skipped ones are not counted",
+    )
+    fields.add_column("Field", style="cyan")
+    fields.add_column("Agreement", justify="right")
+    fields.add_column("Consensus value")
+    for field in report.fields:
+        value = field.value if isinstance(field.value, str) else ", ".join(field.value)
+        color = "green" if field.agreement == 1.0 else "yellow"
+        if field.missing:
+            color, value = "red", "[red]not extracted by any backend[/red]"
+        else:
+            value = escape(value)
+        fields.add_row(field.field, f"[{color}]{field.agreement:.0%}[/{color}]", value)
+    console.print(fields)
+
+    total = sum(p.seconds for p in report.parsers)
+    console.print(
+        f"⚡ Wall time {report.wall_time * 1000:.0f} ms "
+        f"(parsers took {total * 1000:.0f} ms in total)"
+    )
+    if not any(p.data for p in report.parsers) or any(
+        f.agreement < min_agreement for f in report.fields
+    ):
+        raise typer.Exit(code=1)
+
+
 @app.command()
 def validate(
     yaml_file: Path = typer.Argument(
@@ -156,137 +528,507 @@ def validate(
         file_okay=True,
         dir_okay=False,
     ),
-    pdf_file: Path = typer.Argument(
-        help="Generated PDF file to validate.",
+    pdf_files: List[Path] = typer.Argument(
+        help="Generated PDF file(s) to validate.",
         exists=True,
         file_okay=True,
         dir_okay=False,
     ),
+    show_skills: bool = typer.Option(
+        False, "--show-skills", help="Show how each expected skill was matched."
+    ),
+    coverage: float = typer.Option(
+        0.1, "--coverage", help="Fraction of expected skills that must be found."
+    ),
+    partial_threshold: float = typer.Option(
+        0.0,
+        "--partial-threshold",
+        help="Minimum length ratio for a partial (substring) skill match.",
+    ),
+    fuzzy_threshold: float = typer.Option(
+        0.85, "--fuzzy-threshold", help="Minimum similarity for a fuzzy skill match."
+    ),
+    report_format: Optional[str] = typer.Option(
+        None, "--report", help="Machine-readable report: json, jsonl or junit."
+    ),
+    report_file: Path = typer.Option(
+        Path("-"),
+        "--report-file",
+        help="Report destination (jsonl appends). Defaults to stdout.",
+    ),
 ) -> None:
-    """Validate generated PDF against source YAML data."""
+    """Validate generated PDF(s) against source YAML data."""
+    if report_format is not None and report_format not in REPORT_FORMATS:
+        err_console.print(f"[red]Unknown report format: {report_format}[/red]")
+        raise typer.Exit(code=1)
+
+    try:
+        resume = load_resume(yaml_file)
+    except ResumeATSError as e:
+        err_console.print(f"[red]❌ Validation failed: {e}[/red]")
+        raise typer.Exit(code=1)
+
+    all_passed = True
+    writer = ReportWriter(report_format, report_file) if report_format else None
     try:
-        import yaml
+        for pdf_file in pdf_files:
+            try:
+                report = validate_pdf(
+                    resume,
+                    pdf_file,
+                    coverage_threshold=coverage,
+                    partial_threshold=partial_threshold,
+                    fuzzy_threshold=fuzzy_threshold,
+                )
+            except Exception as e:
+                err_console.print(
+                    f"[red]❌ Validation of {pdf_file} failed: {escape(str(e))}[/red]"
+                )
+                all_passed = False
+                if writer is not None:
+                    writer.write(
+                        ValidationReport(
+                            source=str(pdf_file), passed=False, error=str(e)
+                        )
+                    )
+                continue
 
-        # Load reference data
-        with yaml_file.open("r", encoding="utf-8") as f:
-            yaml_data = yaml.safe_load(f)
+            all_passed = all_passed and report.passed
+            if writer is not None:
+                writer.write(report)
+            if writer is None or writer.path is not None:
+                print_validation_report(report, show_skills=show_skills)
+    finally:
+        if writer is not None:
+            writer.close()
+
+    if not all_passed:
+        raise typer.Exit(code=1)
 
-        # Extract PDF data
-        extractor = CVExtractor(pdf_file)
-        pdf_data = extractor.extract_all()
 
-        # Validation results
-        results = []
+def print_latex_check(result: CompileResult) -> bool:
+    """Print the outcome of an XDV-only LaTeX check.
 
-        # Name validation
-        expected_name = yaml_data["basics"]["name"]
-        name_ok = (
-            expected_name.lower() in pdf_data.name.lower() if pdf_data.name else False
+    Args:
+        result: Check run result
+
+    Returns:
+        Whether the check passed
+    """
+    if result.success:
+        console.print(f"🔎 LaTeX OK: {result.pages} page(s) in {result.duration:.2f}s")
+        return True
+    console.print(
+        f"[red]❌ LaTeX check failed: {escape(describe_failure(result))}[/red]"
+    )
+    return False
+
+
+@app.command()
+def check(
+    yaml_file: Path = typer.Argument(
+        Path("resume.yml"),
+        help="Resume YAML file to check.",
+        exists=True,
+        file_okay=True,
+        dir_okay=False,
+    ),
+    output_dir: Path = typer.Option(
+        Path("build"), "--output", "-o", help="Directory for the scratch files."
+    ),
+    template_dir: Path = typer.Option(
+        Path("templates"), "--templates", "-t", help="Template directory path."
+    ),
+    timeout: float = typer.Option(
+        120.0, "--timeout", help="Wall-clock limit of the XeLaTeX run in seconds."
+    ),
+) -> None:
+    """Check the rendered LaTeX for errors without producing a PDF."""
+    config = BuildConfig(
+        template_dir=template_dir, output_dir=output_dir, compile_timeout=timeout
+    )
+    try:
+        result = ResumeBuilder.from_yaml(yaml_file, config).check_latex()
+    except ResumeATSError as e:
+        console.print(f"[red]❌ Check failed: {escape(str(e))}[/red]")
+        raise typer.Exit(code=1)
+    if not print_latex_check(result):
+        raise typer.Exit(code=1)
+
+
+@app.command("preflight")
+def preflight_command(
+    template_dir: Path = typer.Option(
+        Path("templates"), "--templates", "-t", help="Template directory path."
+    ),
+) -> None:
+    """Check that the packages and fonts of the LaTeX template are installed."""
+    try:
+        report = run_preflight(template_dir)
+    except ResumeATSError as e:
+        console.print(f"[red]❌ Preflight failed: {escape(str(e))}[/red]")
+        raise typer.Exit(code=1)
+
+    table = Table(title="LaTeX Requirements")
+    table.add_column("Kind", style="cyan")
+    table.add_column("Name", style="blue")
+    table.add_column("Path")
+    for requirement in report.requirements:
+        path = escape(requirement.path) if requirement.path else "[red]missing[/red]"
+        table.add_row(requirement.kind, escape(requirement.name), path)
+    console.print(table)
+    console.print(
+        f"{report.cached}/{len(report.requirements)} answered from the cache "
+        f"(installation {report.installation})"
+    )
+    if report.missing:
+        raise typer.Exit(code=1)
+
+
+@app.command("precheck")
+def precheck_command(
+    yaml_file: Path = typer.Argument(
+        Path("resume.yml"),
+        help="Resume YAML file to check.",
+        exists=True,
+        file_okay=True,
+        dir_okay=False,
+    ),
+    template_dir: Path = typer.Option(
+        Path("templates"), "--templates", "-t", help="Template directory path."
+    ),
+    show_skills: bool = typer.Option(
+        False, "--show-skills", help="Show how each expected skill was matched."
+    ),
+    show_text: bool = typer.Option(
+        False, "--show-text", help="Print the predicted ATS text."
+    ),
+    latex: bool = typer.Option(
+        False, "--latex", help="Also check the LaTeX with an XDV-only XeLaTeX run."
+    ),
+) -> None:
+    """Predict ATS validation from the YAML alone, without compiling a PDF."""
+    try:
+        builder = ResumeBuilder.from_yaml(
+            yaml_file, BuildConfig(template_dir=template_dir)
+        )
+        if show_text:
+            console.print(Panel(render_ats_text(builder), title="Predicted ATS text"))
+        report = precheck(builder)
+        if latex and not print_latex_check(builder.check_latex()):
+            raise typer.Exit(code=1)
+    except ResumeATSError as e:
+        console.print(f"[red]❌ Precheck failed: {escape(str(e))}[/red]")
+        raise typer.Exit(code=1)
+
+    print_validation_report(report, show_skills=show_skills)
+    console.print(f"⚡ Predicted in {sum(report.timings.values()) * 1000:.1f} ms")
+    if not report.passed:
+        raise typer.Exit(code=1)
+
+
+@app.command()
+def match(
+    jobs: Path = typer.Argument(
+        help="Job postings: a JSON Lines file or a directory of .txt/.md files.",
+        exists=True,
+    ),
+    yaml_file: Path = typer.Argument(
+        Path("resume.yml"),
+        help="Resume YAML file to match.",
+        exists=True,
+        file_okay=True,
+        dir_okay=False,
+    ),
+    pdf_file: Optional[Path] = typer.Option(
+        None,
+        "--pdf",
+        help="Match the data extracted from this PDF instead of the YAML.",
+        exists=True,
+        file_okay=True,
+        dir_okay=False,
+    ),
+    top_k: int = typer.Option(10, "--top", "-k", help="Number of postings to show."),
+    output_format: str = typer.Option(
+        "table", "--format", "-f", help="Output format: table, json."
+    ),
+) -> None:
+    """Rank job postings by how well the resume fits them."""
+    try:
+        from .matching import JobIndex
+    except ImportError as e:
+        console.print(
+            f"[red]❌ Matching requires NumPy and SciPy ({e}). "
+            "Install with: pip install 'resume-ats\\[match]'[/red]"
         )
-        results.append(("Name", expected_name, pdf_data.name, name_ok))
-
-        # Email validation
-        expected_email = yaml_data["basics"]["email"]
-        email_ok = pdf_data.email == expected_email
-        results.append(("Email", expected_email, pdf_data.email, email_ok))
-
-        # Position validation
-        expected_position = yaml_data["basics"]["label"]
-        position_ok = (
-            expected_position.lower() in pdf_data.position.lower()
-            if pdf_data.position
-            else False
+        raise typer.Exit(code=1)
+
+    try:
+        resume = (
+            CVExtractor(pdf_file).extract_all() if pdf_file else load_resume(yaml_file)
         )
-        results.append(("Position", expected_position, pdf_data.position, position_ok))
-
-        # Skills validation - handle both list of strings and list of skill objects
-        yaml_skills = []
-        if "skills" in yaml_data:
-            for skill in yaml_data["skills"]:
-                if isinstance(skill, dict) and "keywords" in skill:
-                    # Skill object with keywords
-                    yaml_skills.extend(skill["keywords"])
-                elif isinstance(skill, str):
-                    # String skill
-                    yaml_skills.append(skill)
-
-        if yaml_skills:
-            # Clean YAML skills: remove ** formatting and split on ( to remove annotations
-            yaml_skills_clean = []
-            for skill in yaml_skills:
-                # Remove ** markdown formatting and split on ( to remove annotations
-                clean_skill = skill.replace("**", "").split("(")[0].strip().lower()
-                # Also handle comma-separated skills within annotations
-                if "," in clean_skill:
-                    yaml_skills_clean.extend(
-                        [s.strip() for s in clean_skill.split(",") if s.strip()]
-                    )
-                else:
-                    yaml_skills_clean.append(clean_skill)
-
-            # Check for overlap with partial matching
-            yaml_skills_lower = set(yaml_skills_clean)
-            extracted_skills_lower = {skill.lower() for skill in pdf_data.skills}
-
-            # Check for partial matches
-            overlap = set()
-            for yaml_skill in yaml_skills_lower:
-                # Direct match
-                if yaml_skill in extracted_skills_lower:
-                    overlap.add(yaml_skill)
-                # Partial matches for compound terms
-                elif any(
-                    yaml_skill in extracted_skill or extracted_skill in yaml_skill
-                    for extracted_skill in extracted_skills_lower
-                ):
-                    overlap.add(yaml_skill)
-
-            skills_coverage = len(overlap)
-            # More lenient threshold
-            skills_ok = skills_coverage > len(yaml_skills_lower) * 0.1  # 10% coverage
-            results.append(
-                (
-                    "Skills",
-                    f"{len(yaml_skills_lower)} expected",
-                    f"{len(pdf_data.skills)} found, {skills_coverage} matching",
-                    skills_ok,
-                )
-            )
-        else:
-            results.append(
-                ("Skills", "No skills in YAML", f"{len(pdf_data.skills)} found", True)
-            )
+        index = JobIndex.load(jobs)
+        matches = index.score(resume, top_k=top_k)
+    except Exception as e:
+        console.print(f"[red]❌ Matching failed: {e}[/red]")
+        raise typer.Exit(code=1)
 
-        # Display results
-        table = Table(title="ATS Validation Results")
-        table.add_column("Field", style="cyan")
-        table.add_column("Expected", style="blue")
-        table.add_column("Found", style="yellow")
-        table.add_column("Status", style="bold")
-
-        all_passed = True
-        for field, expected, found, ok in results:
-            status = "[green]✅ PASS[/green]" if ok else "[red]❌ FAIL[/red]"
-            if not ok:
-                all_passed = False
-            table.add_row(field, str(expected), str(found), status)
+    if output_format == "json":
+        console.print_json("[" + ",".join(m.model_dump_json() for m in matches) + "]")
+        return
 
-        console.print(table)
+    table = Table(title=f"Best matches among {len(index)} postings")
+    table.add_column("Score", justify="right", style="bold")
+    table.add_column("Posting", style="cyan")
+    table.add_column("Matching", style="green")
+    table.add_column("Missing", style="red")
+    for job in matches:
+        table.add_row(
+            f"{job.score:.2f}",
+            f"{job.title or job.id}",
+            ", ".join(job.matching),
+            ", ".join(job.missing),
+        )
+    console.print(table)
+
+
+@app.command("index")
+def index_command(
+    paths: List[Path] = typer.Argument(
+        help="PDF files or directories (searched recursively) to index.",
+        exists=True,
+    ),
+    database: Optional[Path] = typer.Option(
+        None, "--db", help="Index database (default: in the user cache)."
+    ),
+    prune: bool = typer.Option(
+        False, "--prune", help="Drop indexed files that no longer exist."
+    ),
+) -> None:
+    """Extract resumes into a searchable full-text index."""
+    try:
+        with ResumeIndex(database) as index:
+            stats = index.add(paths, prune=prune)
+            total = len(index)
+    except ResumeATSError as e:
+        console.print(f"[red]❌ Indexing failed: {e}[/red]")
+        raise typer.Exit(code=1)
 
-        if all_passed:
+    for path, error in stats.failed.items():
+        console.print(f"[yellow]⚠️  {path}: {error}[/yellow]")
+    console.print(
+        f"✅ Indexed {stats.indexed}, reused {stats.reused}, "
+        f"unchanged {stats.unchanged}, removed {stats.removed}, "
+        f"failed {len(stats.failed)} ({total} documents in index)"
+    )
+
+
+@app.command()
+def search(
+    query: str = typer.Argument(
+        help='FTS5 query, e.g. "kubernetes AND terraform NOT java".'
+    ),
+    database: Optional[Path] = typer.Option(
+        None, "--db", help="Index database (default: in the user cache)."
+    ),
+    limit: int = typer.Option(20, "--limit", "-n", help="Maximum number of hits."),
+    output_format: str = typer.Option(
+        "table", "--format", "-f", help="Output format: table, json."
+    ),
+) -> None:
+    """Search the resume index."""
+    try:
+        with ResumeIndex(database) as index:
+            hits = index.search(query, limit=limit, highlight=("\x02", "\x03"))
+    except ResumeATSError as e:
+        console.print(f"[red]❌ Search failed: {e}[/red]")
+        raise typer.Exit(code=1)
+
+    if output_format == "json":
+        for hit in hits:
+            hit.snippet = hit.snippet.replace("\x02", "").replace("\x03", "")
+        console.print_json("[" + ",".join(h.model_dump_json() for h in hits) + "]")
+        return
+
+    table = Table(title=f"{len(hits)} results for {query!r}")
+    table.add_column("Resume", style="cyan")
+    table.add_column("Name")
+    table.add_column("Position")
+    table.add_column("Match")
+    for hit in hits:
+        snippet = (
+            escape(hit.snippet)
+            .replace("\x02", "[bold yellow]")
+            .replace("\x03", "[/bold yellow]")
+        )
+        table.add_row(Path(hit.path).name, hit.name, hit.position, snippet)
+    console.print(table)
+
+
+@app.command()
+def dedupe(
+    paths: List[Path] = typer.Argument(
+        help="PDF files or directories (searched recursively) to compare.",
+        exists=True,
+    ),
+    threshold: float = typer.Option(
+        0.8, "--threshold", help="Minimum estimated Jaccard similarity."
+    ),
+    num_perm: int = typer.Option(128, "--num-perm", help="MinHash signature length."),
+    shingle_size: int = typer.Option(5, "--shingle", help="Words per shingle."),
+    use_cache: bool = typer.Option(
+        True, "--cache/--no-cache", help="Cache signatures by file hash."
+    ),
+    output_format: str = typer.Option(
+        "table", "--format", "-f", help="Output format: table, json."
+    ),
+) -> None:
+    """Find clusters of near-duplicate resumes."""
+    try:
+        from .dedupe import MinHasher, SignatureCache, find_duplicates, signatures_for
+    except ImportError as e:
+        console.print(
+            f"[red]❌ Deduplication requires NumPy ({e}). "
+            "Install with: pip install 'resume-ats\\[dedupe]'[/red]"
+        )
+        raise typer.Exit(code=1)
+
+    errors: Dict[str, str] = {}
+    cache = SignatureCache() if use_cache else None
+    try:
+        hasher = MinHasher(num_perm=num_perm, shingle_size=shingle_size)
+        signatures = signatures_for(iter_pdfs(paths), hasher, cache, errors)
+    finally:
+        if cache:
+            cache.close()
+    clusters = find_duplicates(signatures, threshold)
+
+    for path, error in errors.items():
+        console.print(f"[yellow]⚠️  {path}: {error}[/yellow]")
+
+    if output_format == "json":
+        console.print_json("[" + ",".join(c.model_dump_json() for c in clusters) + "]")
+        return
+
+    table = Table(
+        title=f"{len(clusters)} near-duplicate clusters among {len(signatures)} files"
+    )
+    table.add_column("Similarity", justify="right", style="bold")
+    table.add_column("Files", style="cyan")
+    for cluster in clusters:
+        table.add_row(f"{cluster.similarity:.2f}", "\n".join(cluster.paths))
+    console.print(table)
+
+
+@app.command()
+def submit(
+    source: Path = typer.Argument(
+        help="YAML file, multi-document stream or NDJSON file of resumes.",
+        exists=True,
+        file_okay=True,
+        dir_okay=False,
+    ),
+    spool_dir: Path = typer.Option(
+        ..., "--spool", "-s", help="Spool directory shared with the workers."
+    ),
+    formats: List[str] = typer.Option(
+        ["pdf"], "--format", "-f", help=f"Output formats: {', '.join(FORMATS)}."
+    ),
+    validate_output: bool = typer.Option(
+        False,
+        "--validate",
+        help="Validate generated PDFs against the resume data in the worker.",
+    ),
+) -> None:
+    """Queue resumes for the spool workers."""
+    spool = Spool(spool_dir)
+    invalid = 0
+
+    def skip(index: int, error: Exception) -> None:
+        nonlocal invalid
+        invalid += 1
+        console.print(f"[red]❌ #{index}: invalid resume: {escape(str(error))}[/red]")
+
+    try:
+        for _, data in iter_resumes(source, on_error=skip):
+            console.print(spool.submit(data, formats, validate_output))
+    except ResumeATSError as e:
+        console.print(f"[red]❌ Submit failed: {escape(str(e))}[/red]")
+        raise typer.Exit(code=1)
+
+    if invalid:
+        raise typer.Exit(code=1)
+
+
+@app.command()
+def worker(
+    spool_dir: Path = typer.Option(
+        ..., "--spool", "-s", help="Spool directory shared with the submitters."
+    ),
+    template_dir: Path = typer.Option(
+        Path("templates"), "--templates", "-t", help="Template directory path."
+    ),
+    lease: float = typer.Option(
+        300.0, "--lease", help="Seconds before a silent worker's job is requeued."
+    ),
+    max_jobs: Optional[int] = typer.Option(
+        None, "--max-jobs", help="Exit after building this many jobs."
+    ),
+    poll: float = typer.Option(
+        2.0, "--poll", help="Seconds between polls of an empty queue."
+    ),
+    exit_when_idle: bool = typer.Option(
+        False, "--exit-when-idle", help="Exit once the queue is empty."
+    ),
+) -> None:
+    """Build jobs claimed from a spool directory."""
+
+    def report(status: JobStatus) -> None:
+        if status.state == "failed":
             console.print(
-                "\n[green]🎉 All validations passed! Your resume is ATS-friendly.[/green]"
+                f"[red]❌ {status.id} {status.name}: {escape(status.error or '')}[/red]"
             )
         else:
-            console.print(
-                "\n[red]⚠️  Some validations failed. Check the results above.[/red]"
-            )
-            raise typer.Exit(code=1)
+            console.print(f"✅ {status.id} {status.name} ({status.duration:.1f}s)")
 
-    except Exception as e:
-        console.print(f"[red]❌ Validation failed: {e}[/red]")
+    spool_worker = SpoolWorker(Spool(spool_dir, lease=lease), template_dir)
+    built = spool_worker.run(
+        max_jobs=max_jobs,
+        poll_interval=poll,
+        exit_when_idle=exit_when_idle,
+        on_job=report,
+    )
+    console.print(f"🏁 Worker {spool_worker.worker_id} built {built} job(s)")
+
+
+@app.command()
+def status(
+    job_ids: Optional[List[str]] = typer.Argument(
+        None, help="Jobs to show (default: all jobs)."
+    ),
+    spool_dir: Path = typer.Option(
+        ..., "--spool", "-s", help="Spool directory shared with the workers."
+    ),
+) -> None:
+    """Show the state and results of spooled jobs."""
+    spool = Spool(spool_dir)
+    try:
+        statuses = [spool.status(j) for j in job_ids] if job_ids else spool.jobs()
+        table = Table(title="Spooled Jobs")
+        for column in ("Job", "State", "Name", "Worker", "Outputs / Error"):
+            table.add_column(column)
+        counts: Dict[str, int] = {}
+        for job in statuses:
+            counts[job.state] = counts.get(job.state, 0) + 1
+            detail = job.error or ", ".join(job.outputs.values())
+            table.add_row(job.id, job.state, job.name, job.worker or "", detail)
+    except ResumeATSError as e:
+        console.print(f"[red]❌ {escape(str(e))}[/red]")
         raise typer.Exit(code=1)
 
+    console.print(table)
+    console.print(", ".join(f"{n} {state}" for state, n in counts.items()) or "empty")
+
 
 @app.command()
 def setup(
@@ -0,0 +1,189 @@
+"""Multi-parser ATS consensus check.
+
+Applicant tracking systems do not share a PDF parser, so a resume that
+reads well through pdfplumber may still lose fields elsewhere. This
+module extracts the text of one PDF with several backends at once, runs
+the field extractors on each result and reports, per field, how far the
+backends agree.
+
+Every backend runs in its own worker process, so the wall time is close
+to that of the slowest backend rather than the sum. Backends that are not
+installed are reported as skipped instead of failing the check. A backend
+that is installed but fails counts as having extracted nothing, since the
+ATS using that parser would see no fields either.
+"""
+
+import subprocess
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Union
+
+from .exceptions import ExtractionError
+from .extractors import CVExtractor, iter_pdf_pages
+from .models import ConsensusReport, FieldAgreement, ParserResult
+
+FieldValue = Union[str, List[str]]
+
+SCALAR_FIELDS = ("name", "email", "position")
+LIST_FIELDS = ("skills", "companies")
+
+
+def _pdfplumber_text(path: Path) -> str:
+    """Text as CVExtractor reads it."""
+    return "\n".join(iter_pdf_pages(path))
+
+
+def _pdfminer_text(path: Path) -> str:
+    """Text from pdfminer's own layout analysis."""
+    from pdfminer.high_level import extract_text
+
+    return extract_text(str(path))
+
+
+def _pdftotext_text(path: Path) -> str:
+    """Text from Poppler's pdftotext, keeping the physical layout."""
+    result = subprocess.run(
+        ["pdftotext", "-layout", str(path), "-"],
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip() or f"exit code {result.returncode}")
+    return result.stdout
+
+
+def _pypdf_text(path: Path) -> str:
+    """Text from the pure-Python pypdf parser."""
+    from pypdf import PdfReader
+
+    return "\n".join(page.extract_text() or "" for page in PdfReader(path).pages)
+
+
+# Text backends by name; pypdf needs the ``consensus`` extra
+BACKENDS: Dict[str, Callable[[Path], str]] = {
+    "pdfplumber": _pdfplumber_text,
+    "pdfminer": _pdfminer_text,
+    "pdftotext": _pdftotext_text,
+    "pypdf": _pypdf_text,
+}
+
+
+def run_backend(backend: str, path: Path) -> ParserResult:
+    """Extract text with one backend and apply the field extractors.
+
+    Args:
+        backend: Name in BACKENDS
+        path: PDF file
+
+    Returns:
+        ParserResult; ``error`` is set if the backend is missing or fails
+    """
+    start = time.perf_counter()
+    try:
+        text = BACKENDS[backend](path)
+        if not text.strip():
+            raise ValueError("no text extracted")
+        data = CVExtractor.from_text(text).extract_all()
+    except (ImportError, FileNotFoundError) as e:
+        return ParserResult(backend=backend, error=f"not available: {e}", skipped=True)
+    except Exception as e:
+        return ParserResult(
+            backend=backend, seconds=time.perf_counter() - start, error=str(e)
+        )
+    return ParserResult(backend=backend, seconds=time.perf_counter() - start, data=data)
+
+
+def _normalize(value: str) -> str:
+    """Case- and whitespace-insensitive form of a value."""
+    return " ".join(value.lower().split())
+
+
+def field_agreement(field: str, values: Dict[str, FieldValue]) -> FieldAgreement:
+    """Compare one field across backends.
+
+    Scalar fields agree when their normalized values are equal; the
+    agreement is the share of backends holding the most common value. For
+    list fields it is the share of all extracted items that every backend
+    found, and the consensus value keeps the items a majority found. A
+    field no backend extracted is ``missing`` with an agreement of 0.
+
+    Args:
+        field: Field name
+        values: Backend -> extracted value; empty for failed backends
+
+    Returns:
+        FieldAgreement for the field
+    """
+    if not any(values.values()):
+        empty: FieldValue = [] if field in LIST_FIELDS else ""
+        return FieldAgreement(
+            field=field, agreement=0.0, value=empty, values=values, missing=True
+        )
+
+    if field in LIST_FIELDS:
+        sets = [{_normalize(item) for item in value} for value in values.values()]
+        union = set().union(*sets)
+        common = set.intersection(*sets)
+        counts = Counter(item for items in sets for item in items)
+        majority = sorted(i for i, n in counts.items() if n * 2 > len(sets))
+        agreement = len(common) / len(union)
+        return FieldAgreement(
+            field=field, agreement=agreement, value=majority, values=values
+        )
+
+    counts = Counter(_normalize(str(value)) for value in values.values())
+    winner, votes = counts.most_common(1)[0]
+    value = next(str(v) for v in values.values() if _normalize(str(v)) == winner)
+    return FieldAgreement(
+        field=field, agreement=votes / len(values), value=value, values=values
+    )
+
+
+def consensus(
+    pdf_path: Path,
+    backends: Optional[Sequence[str]] = None,
+) -> ConsensusReport:
+    """Run several text backends concurrently and compare their fields.
+
+    Args:
+        pdf_path: PDF file
+        backends: Backend names. Uses every known backend if None.
+
+    Returns:
+        ConsensusReport with per-parser timing and per-field agreement
+
+    Raises:
+        ExtractionError: If the PDF does not exist or a backend is unknown
+    """
+    if not pdf_path.exists():
+        raise ExtractionError(f"PDF file not found: {pdf_path}")
+    names = list(backends or BACKENDS)
+    unknown = [name for name in names if name not in BACKENDS]
+    if unknown:
+        raise ExtractionError(
+            f"Unknown backend(s): {', '.join(unknown)} "
+            f"(expected {', '.join(BACKENDS)})"
+        )
+
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=len(names)) as executor:
+        futures = [executor.submit(run_backend, name, pdf_path) for name in names]
+        parsers = [future.result() for future in futures]
+    wall_time = time.perf_counter() - start
+
+    # Failed backends count as having extracted nothing, skipped ones not at all
+    counted = [p for p in parsers if not p.skipped]
+    fields = []
+    for field in SCALAR_FIELDS + LIST_FIELDS:
+        empty: FieldValue = [] if field in LIST_FIELDS else ""
+        values = {
+            p.backend: getattr(p.data, field) if p.data else empty for p in counted
+        }
+        fields.append(field_agreement(field, values))
+
+    return ConsensusReport(
+        path=str(pdf_path), parsers=parsers, fields=fields, wall_time=wall_time
+    )
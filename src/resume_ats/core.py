@@ -2,17 +2,65 @@
 
 import re
 import shutil
-import subprocess
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import Any, Dict, Match, Optional, Union
+from typing import (
+    IO,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    Match,
+    Optional,
+    Tuple,
+    Union,
+)
 
 import yaml
 from jinja2 import Environment, FileSystemLoader, select_autoescape
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
-from .exceptions import BuildError, CompilationError, TemplateError
-from .models import BuildConfig, ResumeData
+from . import metrics
+from .exceptions import (
+    BuildError,
+    CompilationError,
+    ExtractionError,
+    ResumeATSError,
+    TemplateError,
+    ValidationError,
+)
+from .formats import OutputFormat, plan_formats, register_format
+from .latex import DEFAULT_OPTIONS, LatexRunner, describe_failure
+from .models import (
+    BatchItem,
+    BuildConfig,
+    CompileResult,
+    ResumeData,
+    ValidationReport,
+)
+from .outputs import ScratchDir, clean_output_dir
+from .pdfopt import optimize_pdf
+from .plaintext import render_markdown, render_text
+from .preflight import require_preflight
+from .validation import validate_pdf
+
+# Special LaTeX characters and their escaped form, in the order the filters
+# apply them. Braces are escaped separately so \href{}{} survives.
+LATEX_ESCAPES = [
+    ("~", "\\textasciitilde{}"),
+    ("&", "\\&"),
+    ("%", "\\%"),
+    ("$", "\\$"),
+    ("#", "\\#"),
+    ("^", "\\textasciicircum{}"),
+    ("_", "\\_"),
+]
+
+# Markdown bold as written in resume.yml
+BOLD_PATTERN = re.compile(r"\*\*(.*?)\*\*")
 
 
 def process_bold_markdown(text: Union[str, Any]) -> Union[str, Any]:
@@ -28,18 +76,13 @@ def process_bold_markdown(text: Union[str, Any]) -> Union[str, Any]:
         return text
 
     # First, escape special LaTeX characters
-    text = text.replace("~", "\\textasciitilde{}")
-    text = text.replace("&", "\\&")
-    text = text.replace("%", "\\%")
-    text = text.replace("$", "\\$")
-    text = text.replace("#", "\\#")
-    text = text.replace("^", "\\textasciicircum{}")
-    text = text.replace("_", "\\_")
+    for char, escaped in LATEX_ESCAPES:
+        text = text.replace(char, escaped)
     text = text.replace("{", "\\{")
     text = text.replace("}", "\\}")
 
     # Then convert **text** to \textbf{text}
-    return re.sub(r"\*\*(.*?)\*\*", r"\\textbf{\1}", text)
+    return BOLD_PATTERN.sub(r"\\textbf{\1}", text)
 
 
 def process_links(text: Union[str, Any]) -> Union[str, Any]:
@@ -93,13 +136,8 @@ def process_bold_and_links(text: Union[str, Any]) -> Union[str, Any]:
 
     # Then escape special LaTeX characters (but preserve our \href commands)
     # We need to be careful not to escape the \ in \href
-    text = text.replace("~", "\\textasciitilde{}")
-    text = text.replace("&", "\\&")
-    text = text.replace("%", "\\%")
-    text = text.replace("$", "\\$")
-    text = text.replace("#", "\\#")
-    text = text.replace("^", "\\textasciicircum{}")
-    text = text.replace("_", "\\_")
+    for char, escaped in LATEX_ESCAPES:
+        text = text.replace(char, escaped)
 
     # For { and }, we need to be careful not to break \href{url}{text}
     # Split on \href commands and process non-href parts separately
@@ -119,11 +157,122 @@ def process_bold_and_links(text: Union[str, Any]) -> Union[str, Any]:
     text = "".join(processed_parts)
 
     # Finally convert **text** to \textbf{text}
-    text = re.sub(r"\*\*(.*?)\*\*", r"\\textbf{\1}", text)
+    text = BOLD_PATTERN.sub(r"\\textbf{\1}", text)
 
     return text
 
 
+def local_asset(path: str) -> str:
+    """Resolve a template asset path for single-resume builds.
+
+    Assets are copied next to the generated files, so paths are unchanged.
+    Site builds override ``asset`` to point at content-hashed copies.
+
+    Args:
+        path: Asset path relative to the project, e.g. ``logos/ads.png``
+
+    Returns:
+        URL of the asset
+    """
+    return path
+
+
+def load_resume(yaml_path: Path) -> ResumeData:
+    """Load and validate resume data from a YAML file.
+
+    Args:
+        yaml_path: Path to YAML file
+
+    Returns:
+        Validated resume data
+
+    Raises:
+        BuildError: If YAML cannot be loaded or validated
+    """
+    try:
+        with yaml_path.open("r", encoding="utf-8") as f:
+            raw_data = yaml.safe_load(f)
+
+        # Validate with Pydantic
+        return ResumeData(**raw_data)
+
+    except Exception as e:
+        raise BuildError(f"Failed to load resume data: {e}") from e
+
+
+def iter_resumes(
+    source: Path,
+    on_error: Optional[Callable[[int, Exception], None]] = None,
+) -> Iterator[Tuple[int, ResumeData]]:
+    """Lazily load resumes from a multi-document YAML or NDJSON stream.
+
+    Documents are parsed and validated one at a time, so memory stays
+    bounded by the largest document and the first resume is available as
+    soon as it has been read. Files ending in ``.jsonl``/``.ndjson`` hold one
+    JSON resume per line; anything else is a YAML stream of ``---``
+    separated documents.
+
+    Args:
+        source: Stream file
+        on_error: Called with the document index and error for documents
+            that fail validation, which are then skipped. Invalid documents
+            raise if None.
+
+    Yields:
+        ``(document index, resume)`` pairs
+
+    Raises:
+        BuildError: If the stream cannot be read or parsed, or a document is
+            invalid and no on_error callback is given
+    """
+
+    def invalid(index: int, error: Exception) -> None:
+        if on_error is None:
+            raise BuildError(f"Invalid resume document #{index}: {error}") from error
+        on_error(index, error)
+
+    try:
+        with source.open("r", encoding="utf-8") as f:
+            if source.suffix in (".jsonl", ".ndjson"):
+                index = 0
+                for line in f:
+                    if not line.strip():
+                        continue
+                    try:
+                        resume = ResumeData.model_validate_json(line)
+                    except ValueError as e:
+                        invalid(index, e)
+                    else:
+                        yield index, resume
+                    index += 1
+            else:
+                loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+                documents = (d for d in yaml.load_all(f, Loader=loader) if d)
+                for index, document in enumerate(documents):
+                    try:
+                        resume = ResumeData.model_validate(document)
+                    except ValueError as e:
+                        invalid(index, e)
+                    else:
+                        yield index, resume
+    except (OSError, yaml.YAMLError) as e:
+        raise BuildError(f"Failed to read resume stream {source}: {e}") from e
+
+
+def resume_slug(index: int, data: ResumeData) -> str:
+    """Directory name for one resume of a batch build.
+
+    Args:
+        index: Document index in the stream
+        data: Resume data
+
+    Returns:
+        File-system safe name, unique within the stream
+    """
+    name = re.sub(r"[^\w.-]+", "_", data.basics.name).strip("_")
+    return f"{index:06d}_{name or 'resume'}"
+
+
 class ResumeBuilder:
     """Main resume builder class."""
 
@@ -135,6 +284,8 @@ class ResumeBuilder:
         """
         self.config = config or BuildConfig()
         self.console = Console()
+        self.validation_reports: Dict[str, ValidationReport] = {}
+        self.scratch: Optional[ScratchDir] = None
         self._setup_jinja_env()
 
     def _setup_jinja_env(self) -> None:
@@ -150,6 +301,7 @@ class ResumeBuilder:
         self.jinja_env.filters["bold"] = process_bold_markdown
         self.jinja_env.filters["links"] = process_links
         self.jinja_env.filters["bold_and_links"] = process_bold_and_links
+        self.jinja_env.globals["asset"] = local_asset
 
     @classmethod
     def from_yaml(
@@ -168,6 +320,23 @@ class ResumeBuilder:
         builder.load_data(yaml_path)
         return builder
 
+    @classmethod
+    def from_data(
+        cls, data: ResumeData, config: Optional[BuildConfig] = None
+    ) -> "ResumeBuilder":
+        """Create builder from already validated resume data.
+
+        Args:
+            data: Resume data
+            config: Build configuration
+
+        Returns:
+            Configured ResumeBuilder instance
+        """
+        builder = cls(config)
+        builder.data = data
+        return builder
+
     def load_data(self, yaml_path: Path) -> None:
         """Load resume data from YAML file.
 
@@ -177,41 +346,67 @@ class ResumeBuilder:
         Raises:
             BuildError: If YAML cannot be loaded or validated
         """
-        try:
-            with yaml_path.open("r", encoding="utf-8") as f:
-                raw_data = yaml.safe_load(f)
+        self.data = load_resume(yaml_path)
+        self.console.print(f"✅ Loaded resume data from {yaml_path}")
 
-            # Validate with Pydantic
-            self.data = ResumeData(**raw_data)
-            self.console.print(f"✅ Loaded resume data from {yaml_path}")
-
-        except Exception as e:
-            raise BuildError(f"Failed to load resume data: {e}") from e
+    @property
+    def work_dir(self) -> Path:
+        """Directory the current build writes its intermediate files to."""
+        return self.scratch.path if self.scratch else self.config.output_dir
 
     def _prepare_build_dir(self) -> None:
-        """Prepare build directory."""
-        if self.config.clean_build and self.config.output_dir.exists():
-            shutil.rmtree(self.config.output_dir)
+        """Prepare build directory.
 
-        self.config.output_dir.mkdir(exist_ok=True)
-
-        # Copy required assets
-        self._copy_assets()
+        Cleaning keeps the scratch directories of concurrent builds.
+        """
+        self.config.output_dir.mkdir(parents=True, exist_ok=True)
+        if self.config.clean_build:
+            clean_output_dir(self.config.output_dir)
 
     def _copy_assets(self) -> None:
-        """Copy required assets to build directory."""
+        """Copy required assets to the working directory."""
         awesome_cv_cls = self.config.template_dir / "awesome-cv.cls"
         if awesome_cv_cls.exists():
-            shutil.copy2(awesome_cv_cls, self.config.output_dir / "awesome-cv.cls")
+            shutil.copy2(awesome_cv_cls, self.work_dir / "awesome-cv.cls")
 
         # Copy logos directory if it exists
         logos_dir = Path("logos")
         if logos_dir.exists():
-            build_logos_dir = self.config.output_dir / "logos"
+            build_logos_dir = self.work_dir / "logos"
             if build_logos_dir.exists():
                 shutil.rmtree(build_logos_dir)
             shutil.copytree(logos_dir, build_logos_dir)
 
+    def _publish(self, relative: str, name: Optional[str] = None) -> Path:
+        """Move a finished output from the working to the output directory.
+
+        Args:
+            relative: Path inside the working directory
+            name: Destination path inside the output directory
+
+        Returns:
+            Published path
+        """
+        if self.scratch:
+            return self.scratch.publish(relative, name)
+        path = self.config.output_dir / relative
+        final_path = self.config.output_dir / (name or relative)
+        if final_path != path:
+            shutil.copy2(path, final_path)
+        return final_path
+
+    def _render_context(self, extra_context: Dict[str, Any]) -> Dict[str, Any]:
+        """Expose the resume fields to templates without copying them.
+
+        Templates access nested models by attribute, so the top-level fields
+        are passed as they are instead of dumping the whole model to dicts.
+        """
+        context = {
+            name: getattr(self.data, name) for name in type(self.data).model_fields
+        }
+        context.update(extra_context)
+        return context
+
     def render_template(self, template_name: str, **extra_context: Any) -> str:
         """Render template with resume data.
 
@@ -227,14 +422,97 @@ class ResumeBuilder:
         """
         try:
             template = self.jinja_env.get_template(template_name)
-            context = self.data.model_dump()
-            context.update(extra_context)
-            return template.render(**context)
+            return template.render(self._render_context(extra_context))
         except Exception as e:
             raise TemplateError(
                 f"Failed to render template {template_name}: {e}"
             ) from e
 
+    def stream_template(
+        self, template_name: str, **extra_context: Any
+    ) -> Iterator[str]:
+        """Render template with resume data chunk by chunk.
+
+        Args:
+            template_name: Name of template file
+            **extra_context: Additional context variables
+
+        Yields:
+            Rendered chunks, in order
+
+        Raises:
+            TemplateError: If template rendering fails
+        """
+        try:
+            template = self.jinja_env.get_template(template_name)
+            yield from template.generate(self._render_context(extra_context))
+        except Exception as e:
+            raise TemplateError(
+                f"Failed to render template {template_name}: {e}"
+            ) from e
+
+    def write_template(
+        self,
+        template_name: str,
+        destination: Union[Path, IO[str]],
+        **extra_context: Any,
+    ) -> None:
+        """Render template straight into a file or text stream.
+
+        Chunks are written as Jinja produces them, so the document is never
+        held in memory as a whole.
+
+        Args:
+            template_name: Name of template file
+            destination: Output path, or an open text stream (file, socket
+                wrapper, ...) that is left open
+            **extra_context: Additional context variables
+
+        Raises:
+            TemplateError: If template rendering fails
+        """
+        chunks = self.stream_template(template_name, **extra_context)
+        with metrics.RENDER_DURATION.time(template_name):
+            if isinstance(destination, Path):
+                with destination.open("w", encoding="utf-8") as f:
+                    f.writelines(chunks)
+            else:
+                destination.writelines(chunks)
+
+    def check_latex(self) -> CompileResult:
+        """Check the rendered LaTeX with an XeLaTeX run that skips the PDF.
+
+        ``-no-pdf`` stops at the XDV file, so fonts are neither embedded nor
+        converted; errors and the page count come back much faster than from
+        a full build.
+
+        Returns:
+            CompileResult of the check run
+
+        Raises:
+            CompilationError: If XeLaTeX is not installed
+        """
+        if self.scratch is None:
+            with ScratchDir(self.config.output_dir) as scratch:
+                self.scratch = scratch
+                try:
+                    self._copy_assets()
+                    return self.check_latex()
+                finally:
+                    self.scratch = None
+
+        tex_path = self.work_dir / "resume.tex"
+        self.write_template("awesomecv.tex.j2", tex_path)
+        runner = LatexRunner(
+            timeout=self.config.compile_timeout, options=[*DEFAULT_OPTIONS, "-no-pdf"]
+        )
+        try:
+            result = runner.run(tex_path)
+        except FileNotFoundError as e:
+            raise CompilationError(f"LaTeX tools not found: {e}") from e
+        metrics.XELATEX_DURATION.observe(result.duration, "check")
+        return result
+
     def build_pdf(self) -> Path:
         """Build PDF resume.
 
@@ -253,63 +531,36 @@ class ResumeBuilder:
 
             try:
                 # Render LaTeX
-                tex_content = self.render_template("awesomecv.tex.j2")
-                tex_path = self.config.output_dir / "resume.tex"
-                tex_path.write_text(tex_content, encoding="utf-8")
+                tex_path = self.work_dir / "resume.tex"
+                self.write_template("awesomecv.tex.j2", tex_path)
 
                 progress.update(task, description="Compiling LaTeX...")
 
                 # Compile directly to PDF with XeLaTeX
-                result = subprocess.run(
-                    [
-                        "xelatex",
-                        "-interaction=nonstopmode",
-                        "-halt-on-error",
-                        tex_path.name,
-                    ],
-                    cwd=self.config.output_dir,
-                    capture_output=True,
-                    text=True,
-                )
-
-                if result.returncode != 0:
-                    error_msg = (
-                        f"XeLaTeX compilation failed (exit code {result.returncode})"
-                    )
-                    if result.stderr.strip():
-                        error_msg += f"\nSTDERR:\n{result.stderr}"
-                    if result.stdout.strip():
-                        error_msg += f"\nSTDOUT:\n{result.stdout}"
-
-                    # Check for common errors
-                    log_file = self.config.output_dir / "resume.log"
-                    if log_file.exists():
-                        log_content = log_file.read_text(
-                            encoding="utf-8", errors="ignore"
-                        )
-                        if "! Font" in log_content:
-                            error_msg += "\n\nFont error detected. Make sure required fonts are installed."
-                        elif "! LaTeX Error:" in log_content:
-                            # Extract LaTeX error
-                            lines = log_content.split("\n")
-                            for i, line in enumerate(lines):
-                                if "! LaTeX Error:" in line:
-                                    error_msg += f"\n\nLaTeX Error: {line}"
-                                    if i + 1 < len(lines):
-                                        error_msg += f"\n{lines[i + 1]}"
-                                    break
-
-                    raise CompilationError(error_msg)
+                runner = LatexRunner(timeout=self.config.compile_timeout)
+                result = runner.run(tex_path)
+                metrics.XELATEX_DURATION.observe(result.duration, "pdf")
+                if not result.success:
+                    raise CompilationError(describe_failure(result), result.diagnostics)
 
                 # Check if PDF was generated
-                pdf_path = self.config.output_dir / "resume.pdf"
+                pdf_path = self.work_dir / "resume.pdf"
                 if not pdf_path.exists():
                     raise CompilationError("PDF file was not generated by XeLaTeX")
 
+                if self.config.optimize_pdf:
+                    progress.update(task, description="Optimizing PDF...")
+                    stats = optimize_pdf(pdf_path)
+                    self.console.print(
+                        f"🗜️  PDF optimized with {stats.backend}: "
+                        f"{stats.size_before:,} → {stats.size_after:,} bytes"
+                        + (" (cached)" if stats.cached else "")
+                    )
+
                 # Create final PDF with name
                 final_name = f"{self.data.basics.name.replace(' ', '_')}_CV.pdf"
-                final_path = self.config.output_dir / final_name
-                shutil.copy2(pdf_path, final_path)
+                self._publish(tex_path.name)
+                final_path = self._publish(pdf_path.name, final_name)
 
                 progress.update(task, description="✅ PDF generated successfully")
                 self.console.print(f"📄 PDF saved to: {final_path}")
@@ -317,6 +568,8 @@ class ResumeBuilder:
 
             except FileNotFoundError as e:
                 raise CompilationError(f"LaTeX tools not found: {e}") from e
+            except CompilationError:
+                raise
             except Exception as e:
                 raise CompilationError(f"PDF generation failed: {e}") from e
 
@@ -326,9 +579,8 @@ class ResumeBuilder:
         Returns:
             Path to generated HTML file
         """
-        html_content = self.render_template("simple.html.j2")
-        html_path = self.config.output_dir / "index.html"
-        html_path.write_text(html_content, encoding="utf-8")
+        self.write_template("simple.html.j2", self.work_dir / "index.html")
+        html_path = self._publish("index.html")
 
         self.console.print(f"🌐 HTML saved to: {html_path}")
         return html_path
@@ -339,32 +591,201 @@ class ResumeBuilder:
         Returns:
             Path to generated JSON file
         """
-        json_path = self.config.output_dir / "resume.json"
         json_content = self.data.model_dump_json(indent=2)
-        json_path.write_text(json_content, encoding="utf-8")
+        (self.work_dir / "resume.json").write_text(json_content, encoding="utf-8")
+        json_path = self._publish("resume.json")
 
         self.console.print(f"📋 JSON saved to: {json_path}")
         return json_path
 
+    def build_text(self) -> Path:
+        """Build a plain-text resume for ATS upload portals.
+
+        Returns:
+            Path to generated text file
+        """
+        (self.work_dir / "resume.txt").write_text(
+            render_text(self.data), encoding="utf-8"
+        )
+        text_path = self._publish("resume.txt")
+
+        self.console.print(f"📝 Text saved to: {text_path}")
+        return text_path
+
+    def build_markdown(self) -> Path:
+        """Build a Markdown resume.
+
+        Returns:
+            Path to generated Markdown file
+        """
+        (self.work_dir / "resume.md").write_text(
+            render_markdown(self.data), encoding="utf-8"
+        )
+        markdown_path = self._publish("resume.md")
+
+        self.console.print(f"📝 Markdown saved to: {markdown_path}")
+        return markdown_path
+
+    def validate_pdf(self, pdf_path: Path) -> ValidationReport:
+        """Validate a generated PDF against the in-memory resume data.
+
+        Args:
+            pdf_path: Path to generated PDF
+
+        Returns:
+            ValidationReport for the PDF
+
+        Raises:
+            ValidationError: If data cannot be extracted from the PDF
+        """
+        try:
+            return validate_pdf(self.data, pdf_path)
+        except ExtractionError as e:
+            raise ValidationError(f"Validation of {pdf_path} failed: {e}") from e
+
+    def _require_check(self) -> None:
+        """Run the XDV check and stop before the full PDF if it fails."""
+        result = self.check_latex()
+        if not result.success:
+            raise CompilationError(
+                describe_failure(result),
+                result.diagnostics,
+            )
+        self.console.print(
+            f"🔎 LaTeX check passed: {result.pages} page(s) in {result.duration:.2f}s"
+        )
+
+    def _build_checked_pdf(self) -> Path:
+        """Build the PDF after the optional preflight and LaTeX check."""
+        if self.config.preflight:
+            require_preflight(self.config.template_dir)
+        if self.config.check_latex:
+            self._require_check()
+        return self.build_pdf()
+
+    def _build_format(self, output_format: OutputFormat) -> Path:
+        """Build one format and count its outcome."""
+        outcome = "failure"
+        try:
+            path = output_format.build(self)
+            outcome = "success"
+            return path
+        finally:
+            metrics.BUILDS.inc(output_format.name, outcome)
+
     def build_all(self) -> Dict[str, Path]:
         """Build all configured formats.
 
+        Formats are looked up in the format registry and each one starts as
+        soon as the formats it requires are done, so independent formats
+        are built in parallel. Intermediate files go to a private scratch
+        directory and every output is renamed into the output directory
+        once complete, so concurrent builds into the same directory never
+        see each other's partial files.
+
         Returns:
             Dictionary mapping format names to output paths
         """
+        plan, unknown = plan_formats(self.config.formats)
+        for format_name in unknown:
+            self.console.print(f"⚠️  Unknown format: {format_name}")
+            metrics.BUILDS.inc(format_name, "unknown")
+
         self._prepare_build_dir()
 
-        results = {}
+        results: Dict[str, Path] = {}
+        pending: Dict[str, Future[ValidationReport]] = {}
+        self.validation_reports = {}
 
-        for format_name in self.config.formats:
-            if format_name == "pdf":
-                results["pdf"] = self.build_pdf()
-            elif format_name == "html":
-                results["html"] = self.build_html()
-            elif format_name == "json":
-                results["json"] = self.build_json()
-            else:
-                self.console.print(f"⚠️  Unknown format: {format_name}")
+        # Validation of a finished PDF overlaps with building the next formats
+        validator = ThreadPoolExecutor(max_workers=1)
+        builds = ThreadPoolExecutor(max_workers=max(len(plan), 1))
+        with ScratchDir(self.config.output_dir) as scratch, validator, builds:
+            self.scratch = scratch
+            try:
+                self._copy_assets()
+                waiting = list(plan)
+                running: Dict[Future[Path], OutputFormat] = {}
+                while waiting or running:
+                    for output_format in list(waiting):
+                        if all(name in results for name in output_format.requires):
+                            waiting.remove(output_format)
+                            future = builds.submit(self._build_format, output_format)
+                            running[future] = output_format
+                    done, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        format_name = running.pop(future).name
+                        results[format_name] = future.result()
+                        if format_name == "pdf" and self.config.validate_output:
+                            pending["pdf"] = validator.submit(
+                                self.validate_pdf, results["pdf"]
+                            )
+
+                for format_name, report in pending.items():
+                    self.validation_reports[format_name] = report.result()
+            finally:
+                self.scratch = None
 
         self.console.print("🎉 Build completed successfully!")
-        return results
+        return {f.name: results[f.name] for f in plan}
+
+    def build_stream(
+        self, resumes: Iterable[Tuple[int, ResumeData]]
+    ) -> Iterator[BatchItem]:
+        """Build every resume of a stream into its own output sub-directory.
+
+        The builder (and its compiled templates) is reused for every resume;
+        only the current document is held in memory. Results are yielded as
+        soon as each resume is built, and a failing resume does not stop the
+        stream.
+
+        Args:
+            resumes: ``(document index, resume)`` pairs, e.g. from iter_resumes()
+
+        Yields:
+            BatchItem per resume
+
+        Raises:
+            PreflightError: If the preflight is enabled and fails
+        """
+        base = self.config
+        # A missing package or font would fail every resume the same way
+        if base.preflight and "pdf" in base.formats:
+            require_preflight(base.template_dir)
+        try:
+            for index, data in resumes:
+                output_dir = base.output_dir / resume_slug(index, data)
+                self.data = data
+                self.config = base.model_copy(update={"output_dir": output_dir})
+                item = BatchItem(
+                    index=index, name=data.basics.name, output_dir=str(output_dir)
+                )
+                start = time.perf_counter()
+                try:
+                    outputs = self.build_all()
+                except ResumeATSError as e:
+                    item.error = str(e)
+                else:
+                    item.outputs = {k: str(v) for k, v in outputs.items()}
+                    item.passed = all(
+                        r.passed for r in self.validation_reports.values()
+                    )
+                item.duration = time.perf_counter() - start
+                yield item
+        finally:
+            self.config = base
+
+
+register_format(
+    "pdf", lambda builder: builder._build_checked_pdf(), description="XeLaTeX PDF"
+)
+register_format("html", lambda builder: builder.build_html(), description="HTML page")
+register_format("json", lambda builder: builder.build_json(), description="JSON data")
+register_format(
+    "txt",
+    lambda builder: builder.build_text(),
+    description="Plain text for ATS portals",
+)
+register_format(
+    "markdown", lambda builder: builder.build_markdown(), description="Markdown"
+)
@@ -0,0 +1,250 @@
+"""Near-duplicate resume detection with MinHash and locality-sensitive hashing.
+
+Each document is reduced to a fixed-size MinHash signature over hashed word
+shingles; the fraction of equal signature slots estimates the Jaccard
+similarity of the shingle sets. Signatures are split into bands and hashed
+into buckets so that only documents sharing a band are ever compared, which
+keeps detection roughly linear in the number of documents.
+
+Signatures are cached per file content hash, so re-running over a growing
+corpus only extracts and hashes new files.
+
+Requires the ``dedupe`` extra (NumPy).
+"""
+
+import re
+import sqlite3
+import zlib
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from . import metrics
+from .cache import cache_dir, file_digest
+from .exceptions import ResumeATSError
+from .extractors import CVExtractor
+from .models import DuplicateCluster
+
+# Largest prime below 2**32: (a * h + b) stays below 2**64 for 32-bit inputs
+PRIME = np.uint64(4294967291)
+
+WORD_PATTERN = re.compile(r"\w+")
+
+
+def shingles(text: str, size: int = 5) -> np.ndarray:
+    """Hash the word shingles of a text.
+
+    Args:
+        text: Document text
+        size: Number of words per shingle
+
+    Returns:
+        Unique 32-bit shingle hashes as a uint64 array
+    """
+    words = WORD_PATTERN.findall(text.lower())
+    if len(words) < size:
+        words = words + [""] * (size - len(words)) if words else []
+    hashes = {
+        zlib.crc32(" ".join(words[i : i + size]).encode())
+        for i in range(len(words) - size + 1)
+    }
+    return np.fromiter(hashes, dtype=np.uint64, count=len(hashes))
+
+
+def lsh_params(threshold: float, num_perm: int) -> Tuple[int, int]:
+    """Choose bands x rows so the LSH S-curve crosses ``threshold``.
+
+    Two documents with Jaccard similarity ``s`` share at least one bucket
+    with probability ``1 - (1 - s**rows)**bands``; its midpoint is about
+    ``(1 / bands) ** (1 / rows)``.
+
+    Args:
+        threshold: Target Jaccard similarity
+        num_perm: Signature length
+
+    Returns:
+        ``(bands, rows)`` with ``bands * rows <= num_perm``
+    """
+    candidates = [(bands, num_perm // bands) for bands in range(1, num_perm + 1)]
+    return min(
+        candidates,
+        key=lambda p: (abs((1 / p[0]) ** (1 / p[1]) - threshold), -p[0]),
+    )
+
+
+class MinHasher:
+    """MinHash signatures from universal hash permutations."""
+
+    def __init__(self, num_perm: int = 128, shingle_size: int = 5, seed: int = 1):
+        """Initialize hasher.
+
+        Args:
+            num_perm: Signature length
+            shingle_size: Number of words per shingle
+            seed: Seed of the hash permutations
+        """
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        self.seed = seed
+        rng = np.random.default_rng(seed)
+        self._a = rng.integers(1, int(PRIME), size=num_perm, dtype=np.uint64)
+        self._b = rng.integers(0, int(PRIME), size=num_perm, dtype=np.uint64)
+
+    @property
+    def key(self) -> str:
+        """Identify the parameters for caching."""
+        return f"{self.num_perm}:{self.shingle_size}:{self.seed}"
+
+    def signature(self, text: str) -> np.ndarray:
+        """Compute the MinHash signature of a text.
+
+        Args:
+            text: Document text
+
+        Returns:
+            uint32 array of length ``num_perm``
+        """
+        hashes = shingles(text, self.shingle_size)
+        if not len(hashes):
+            return np.full(self.num_perm, np.iinfo(np.uint32).max, dtype=np.uint32)
+        permuted = (hashes[:, None] * self._a + self._b) % PRIME
+        return np.asarray(permuted.min(axis=0), dtype=np.uint32)
+
+
+class SignatureCache:
+    """SQLite store of MinHash signatures keyed by file content hash."""
+
+    def __init__(self, database: Optional[Path] = None) -> None:
+        """Open (and create if needed) the signature store.
+
+        Args:
+            database: Database file. Uses the user cache if None.
+        """
+        self.database = database or cache_dir("dedupe") / "signatures.db"
+        self.db = sqlite3.connect(self.database)
+        self.db.execute("PRAGMA journal_mode = WAL")
+        self.db.execute(
+            "CREATE TABLE IF NOT EXISTS signatures ("
+            " digest TEXT NOT NULL, params TEXT NOT NULL, signature BLOB NOT NULL,"
+            " PRIMARY KEY (digest, params))"
+        )
+
+    def get(self, digest: str, params: str) -> Optional[np.ndarray]:
+        """Return a cached signature, or None."""
+        row = self.db.execute(
+            "SELECT signature FROM signatures WHERE digest = ? AND params = ?",
+            (digest, params),
+        ).fetchone()
+        return np.frombuffer(row[0], dtype=np.uint32) if row else None
+
+    def put(self, digest: str, params: str, signature: np.ndarray) -> None:
+        """Store a signature."""
+        self.db.execute(
+            "INSERT OR REPLACE INTO signatures VALUES (?, ?, ?)",
+            (digest, params, signature.astype(np.uint32).tobytes()),
+        )
+
+    def close(self) -> None:
+        """Commit and close the database connection."""
+        self.db.commit()
+        self.db.close()
+
+
+def signatures_for(
+    paths: Iterable[Path],
+    hasher: MinHasher,
+    cache: Optional[SignatureCache] = None,
+    errors: Optional[Dict[str, str]] = None,
+) -> Dict[str, np.ndarray]:
+    """Compute (or load from the cache) the signature of each PDF.
+
+    Args:
+        paths: PDF files
+        hasher: MinHash parameters
+        cache: Signature cache. Signatures are not cached if None.
+        errors: Filled with ``path -> message`` for files that failed
+
+    Returns:
+        Mapping of path to signature
+    """
+    signatures = {}
+    for path in paths:
+        try:
+            digest = file_digest(path)
+            signature = cache.get(digest, hasher.key) if cache else None
+            if cache:
+                metrics.cache_lookup("signatures", signature is not None)
+            if signature is None:
+                signature = hasher.signature(CVExtractor(path).text)
+                if cache:
+                    cache.put(digest, hasher.key, signature)
+        except (OSError, ResumeATSError) as e:
+            if errors is not None:
+                errors[str(path)] = str(e)
+            continue
+        signatures[str(path)] = signature
+    return signatures
+
+
+def find_duplicates(
+    signatures: Dict[str, np.ndarray], threshold: float = 0.8
+) -> List[DuplicateCluster]:
+    """Cluster documents whose estimated Jaccard similarity exceeds a threshold.
+
+    Documents are hashed into one bucket per band; each document is verified
+    against the first document of every bucket it lands in, and verified
+    pairs are merged with union-find. The work is proportional to the number
+    of documents times the number of bands.
+
+    Args:
+        signatures: Mapping of document name to MinHash signature
+        threshold: Minimum estimated Jaccard similarity
+
+    Returns:
+        Clusters of two or more documents, largest first
+    """
+    names = list(signatures)
+    if not names:
+        return []
+    matrix = np.vstack([signatures[name] for name in names])
+    bands, rows = lsh_params(threshold, matrix.shape[1])
+
+    parent = list(range(len(names)))
+    similarity: Dict[int, float] = {}
+
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    for band in range(bands):
+        block = matrix[:, band * rows : (band + 1) * rows]
+        buckets: Dict[bytes, int] = {}
+        for i in range(len(names)):
+            anchor = buckets.setdefault(block[i].tobytes(), i)
+            if anchor == i or find(anchor) == find(i):
+                continue
+            score = float(np.mean(matrix[anchor] == matrix[i]))
+            if score >= threshold:
+                root_a, root_i = find(anchor), find(i)
+                parent[root_i] = root_a
+                similarity[root_a] = min(
+                    score,
+                    similarity.pop(root_i, 1.0),
+                    similarity.get(root_a, 1.0),
+                )
+
+    groups: Dict[int, List[str]] = defaultdict(list)
+    for i, name in enumerate(names):
+        groups[find(i)].append(name)
+
+    clusters = [
+        DuplicateCluster(paths=members, similarity=similarity.get(root, 1.0))
+        for root, members in groups.items()
+        if len(members) > 1
+    ]
+    clusters.sort(key=lambda c: (-len(c.paths), -c.similarity))
+    return clusters
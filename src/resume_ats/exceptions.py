@@ -1,5 +1,10 @@
 """Custom exceptions for resume-ats package."""
 
+from typing import TYPE_CHECKING, List, Optional
+
+if TYPE_CHECKING:
+    from .models import LatexDiagnostic
+
 
 class ResumeATSError(Exception):
     """Base exception for resume-ats package."""
@@ -22,6 +27,16 @@ class TemplateError(ResumeATSError):
 class CompilationError(ResumeATSError):
     """Raised when LaTeX compilation fails."""
 
+    def __init__(
+        self, message: str, diagnostics: Optional[List["LatexDiagnostic"]] = None
+    ):
+        super().__init__(message)
+        self.diagnostics = diagnostics or []
+
+
+class PreflightError(ResumeATSError):
+    """Raised when packages or fonts a template needs are missing."""
+
     pass
 
 
@@ -35,3 +50,21 @@ class ValidationError(ResumeATSError):
     """Raised when ATS validation fails."""
 
     pass
+
+
+class TaxonomyError(ResumeATSError):
+    """Raised when the skill taxonomy cannot be loaded or compiled."""
+
+    pass
+
+
+class SearchError(ResumeATSError):
+    """Raised when the resume index cannot be opened or queried."""
+
+    pass
+
+
+class SpoolError(ResumeATSError):
+    """Raised when a spool directory or job cannot be read."""
+
+    pass
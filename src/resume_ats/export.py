@@ -0,0 +1,157 @@
+"""Bulk export of resume data as NDJSON or MessagePack streams.
+
+Records are serialized one at a time by pydantic-core straight to bytes
+(NDJSON) or to JSON-compatible values (MessagePack) and written to an
+optionally compressed stream, so a whole corpus can be exported in constant
+memory without one pretty-printed file per resume.
+
+MessagePack and Zstandard need the ``export`` extra.
+"""
+
+import gzip
+from pathlib import Path
+from types import TracebackType
+from typing import IO, Iterable, Optional, Type, cast
+
+from .exceptions import BuildError
+from .models import ResumeData
+
+EXPORT_FORMATS = ("ndjson", "msgpack")
+COMPRESSIONS = ("none", "gzip", "zstd")
+
+# File suffixes that imply a compression when none is given
+COMPRESSION_SUFFIXES = {".gz": "gzip", ".zst": "zstd"}
+
+
+def guess_compression(path: Path) -> str:
+    """Infer the compression of an export file from its suffix.
+
+    Args:
+        path: Output file
+
+    Returns:
+        One of COMPRESSIONS
+    """
+    return COMPRESSION_SUFFIXES.get(path.suffix, "none")
+
+
+def open_compressed(path: Path, compression: str = "none", level: int = 3) -> IO[bytes]:
+    """Open a binary output stream with optional compression.
+
+    Args:
+        path: Output file
+        compression: One of COMPRESSIONS
+        level: Compression level
+
+    Returns:
+        Writable binary stream
+
+    Raises:
+        BuildError: If the compression is unknown or its library is missing
+    """
+    if compression == "none":
+        return path.open("wb")
+    if compression == "gzip":
+        return cast(IO[bytes], gzip.open(path, "wb", compresslevel=level))
+    if compression == "zstd":
+        try:
+            import zstandard
+        except ImportError as e:
+            raise BuildError(
+                "Zstandard compression requires zstandard: "
+                "pip install 'resume-ats[export]'"
+            ) from e
+        writer = zstandard.ZstdCompressor(level=level).stream_writer(
+            path.open("wb"), closefd=True
+        )
+        return cast(IO[bytes], writer)
+    raise BuildError(
+        f"Unknown compression: {compression} (expected one of {', '.join(COMPRESSIONS)})"
+    )
+
+
+class BulkExporter:
+    """Write many resumes to a single NDJSON or MessagePack stream."""
+
+    def __init__(
+        self,
+        path: Path,
+        export_format: str = "ndjson",
+        compression: Optional[str] = None,
+        level: int = 3,
+    ) -> None:
+        """Open the export stream.
+
+        Args:
+            path: Output file
+            export_format: One of EXPORT_FORMATS
+            compression: One of COMPRESSIONS. Inferred from the suffix if None.
+            level: Compression level
+
+        Raises:
+            BuildError: If the format is unknown or a library is missing
+        """
+        if export_format not in EXPORT_FORMATS:
+            raise BuildError(
+                f"Unknown export format: {export_format} "
+                f"(expected one of {', '.join(EXPORT_FORMATS)})"
+            )
+        self._packer = None
+        if export_format == "msgpack":
+            try:
+                import msgpack
+            except ImportError as e:
+                raise BuildError(
+                    "MessagePack export requires msgpack: "
+                    "pip install 'resume-ats[export]'"
+                ) from e
+            self._packer = msgpack.Packer()
+
+        self.path = path
+        self.export_format = export_format
+        self.count = 0
+        self._serializer = ResumeData.__pydantic_serializer__
+        self._stream = open_compressed(
+            path, compression or guess_compression(path), level
+        )
+
+    def write(self, resume: ResumeData) -> None:
+        """Append one resume to the stream.
+
+        Args:
+            resume: Resume data
+        """
+        if self._packer is None:
+            self._stream.write(self._serializer.to_json(resume) + b"\n")
+        else:
+            record = self._serializer.to_python(resume, mode="json")
+            self._stream.write(self._packer.pack(record))
+        self.count += 1
+
+    def write_all(self, resumes: Iterable[ResumeData]) -> int:
+        """Append every resume of an iterable to the stream.
+
+        Args:
+            resumes: Resume data
+
+        Returns:
+            Number of records written so far
+        """
+        for resume in resumes:
+            self.write(resume)
+        return self.count
+
+    def close(self) -> None:
+        """Flush and close the stream."""
+        self._stream.close()
+
+    def __enter__(self) -> "BulkExporter":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
@@ -2,35 +2,130 @@
 
 import re
 import subprocess
+import time
 from pathlib import Path
-from typing import List
+from typing import Callable, Dict, Iterator, List, Optional, TypeVar
 
 import pdfplumber
 from rich.console import Console
 
+from . import metrics
 from .exceptions import ExtractionError
 from .models import CVData
+from .taxonomy import SkillTaxonomy, default_taxonomy
+
+T = TypeVar("T")
+
+
+def iter_pdf_pages(pdf_path: Path) -> Iterator[str]:
+    """Yield the text of a PDF page by page.
+
+    pdfplumber keeps the layout objects of every page it has parsed until
+    the document is closed, so memory would grow with the page count. Each
+    page's caches are released as soon as its text is extracted, which
+    keeps peak memory flat however long the document is.
+
+    Args:
+        pdf_path: PDF file
+
+    Yields:
+        Text of each page, empty for pages without text
+    """
+    with pdfplumber.open(pdf_path) as pdf:
+        for page in pdf.pages:
+            try:
+                yield page.extract_text() or ""
+            finally:
+                page.close()
 
 
 class CVExtractor:
     """Robust CV data extractor."""
 
-    def __init__(self, pdf_path: Path):
+    def __init__(
+        self,
+        pdf_path: Path,
+        taxonomy: Optional[SkillTaxonomy] = None,
+        text: Optional[str] = None,
+        max_pages: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+    ) -> None:
         """Initialize extractor with PDF path.
 
         Args:
             pdf_path: Path to PDF file
+            taxonomy: Skill taxonomy. Uses the bundled taxonomy if None.
+            text: Already extracted text. The PDF is not read if given.
+            max_pages: Read at most this many pages
+            max_bytes: Keep at most this many bytes of UTF-8 text, including
+                the newline that ends each page
 
         Raises:
             ExtractionError: If PDF cannot be processed
         """
         self.pdf_path = Path(pdf_path)
-        self.console = Console()
-        self.text = self._extract_text()
+        self.console = Console(stderr=True)  # Keep stdout for reports
+        self.taxonomy = taxonomy or default_taxonomy()
+        self.max_pages = max_pages
+        self.max_bytes = max_bytes
+        # Set when the extraction stopped at the page or byte budget
+        self.truncated = False
+        # Seconds spent in text extraction and in each field extractor
+        self.timings: Dict[str, float] = {}
+
+        start = time.perf_counter()
+        self.text = self._extract_text() if text is None else text
+        self.timings["text"] = time.perf_counter() - start
+
+    @classmethod
+    def from_text(
+        cls, text: str, taxonomy: Optional[SkillTaxonomy] = None
+    ) -> "CVExtractor":
+        """Create an extractor over plain text instead of a PDF.
+
+        Args:
+            text: Text to run the field extractors on
+            taxonomy: Skill taxonomy. Uses the bundled taxonomy if None.
+
+        Returns:
+            CVExtractor instance
+        """
+        return cls(Path("<text>"), taxonomy=taxonomy, text=text)
+
+    def _within_budget(self, pages: Iterator[str]) -> str:
+        """Join page texts until the page or byte budget is spent."""
+        parts: List[str] = []
+        remaining = self.max_bytes
+        # Each backend starts over, whatever an earlier attempt read
+        self.truncated = False
+        for number, page_text in enumerate(pages, 1):
+            if self.max_pages is not None and number > self.max_pages:
+                self.truncated = True
+                break
+            if not page_text:
+                continue
+            page_text += "\n"
+            if remaining is not None:
+                data = page_text.encode("utf-8")
+                if len(data) > remaining:
+                    page_text = data[:remaining].decode("utf-8", errors="ignore")
+                    self.truncated = True
+                remaining -= len(data)
+            parts.append(page_text)
+            if self.truncated:
+                break
+        if self.truncated:
+            self.console.print(
+                f"⚠️  Text of {self.pdf_path} truncated at the extraction budget"
+            )
+        return "".join(parts)
 
     def _extract_text(self) -> str:
         """Extract text from PDF using multiple fallback methods.
 
+        Pages are read one at a time and released right away, and reading
+        stops once ``max_pages`` or ``max_bytes`` is reached.
+
         Returns:
             Extracted text content
 
@@ -39,29 +134,32 @@ class CVExtractor:
         """
         try:
             # Primary method: pdfplumber
-            with pdfplumber.open(self.pdf_path) as pdf:
-                text = ""
-                for page in pdf.pages:
-                    page_text = page.extract_text()
-                    if page_text:
-                        text += page_text + "\n"
+            with metrics.EXTRACTION_DURATION.time("pdfplumber"):
+                text = self._within_budget(iter_pdf_pages(self.pdf_path))
 
-                if text.strip():
-                    return text
+            if text.strip():
+                return text
 
         except Exception as e:
             self.console.print(f"⚠️  pdfplumber failed: {e}")
 
         try:
             # Fallback: pdftotext
-            result = subprocess.run(
-                ["pdftotext", str(self.pdf_path), "-"],
-                capture_output=True,
-                text=True,
-                timeout=30,
-            )
+            # One page more than the budget, so truncation is noticed
+            pages = [] if self.max_pages is None else ["-l", str(self.max_pages + 1)]
+            with metrics.EXTRACTION_DURATION.time("pdftotext"):
+                result = subprocess.run(
+                    ["pdftotext", *pages, str(self.pdf_path), "-"],
+                    capture_output=True,
+                    text=True,
+                    timeout=30,
+                )
             if result.returncode == 0 and result.stdout.strip():
-                return result.stdout
+                # pdftotext ends every page with a form feed
+                text = result.stdout
+                if text.endswith("\f"):
+                    text = text[:-1]
+                return self._within_budget(iter(text.split("\f")))
 
         except (subprocess.TimeoutExpired, FileNotFoundError) as e:
             self.console.print(f"⚠️  pdftotext failed: {e}")
@@ -126,186 +224,13 @@ class CVExtractor:
     def extract_skills(self) -> List[str]:
         """Extract technical skills from CV.
 
+        Every alias found in the text is mapped to its canonical skill ID
+        through the skill taxonomy (e.g. "k8s" -> "kubernetes").
+
         Returns:
-            List of extracted skills
+            Sorted list of canonical skill IDs
         """
-        tech_keywords = {
-            "docker",
-            "kubernetes",
-            "k8s",
-            "terraform",
-            "ansible",
-            "jenkins",
-            "gitlab",
-            "github",
-            "aws",
-            "azure",
-            "gcp",
-            "ovh",
-            "linux",
-            "python",
-            "bash",
-            "shell",
-            "git",
-            "ci/cd",
-            "devops",
-            "prometheus",
-            "grafana",
-            "elasticsearch",
-            "kibana",
-            "nginx",
-            "apache",
-            "mysql",
-            "postgresql",
-            "redis",
-            "mongodb",
-            "helm",
-            "vagrant",
-            "consul",
-            "vault",
-            "nomad",
-            "packer",
-            "java",
-            "javascript",
-            "typescript",
-            "node.js",
-            "react",
-            "angular",
-            "vue",
-            "vue.js",
-            "nuxt.js",
-            "php",
-            "golang",
-            "go",
-            "rust",
-            "scala",
-            "ruby",
-            "perl",
-            "c++",
-            "c#",
-            ".net",
-            "spring",
-            "django",
-            "flask",
-            "express",
-            "fastapi",
-            "sqlalchemy",
-            "jira",
-            "confluence",
-            "scrum",
-            "agile",
-            "podman",
-            "elk",
-            "homeassistant",
-            "iac",
-            "infrastructure",
-            "cloud",
-            "monitoring",
-            "observability",
-            "ci",
-            "cd",
-            "microservices",
-            "architecture",
-            "automation",
-            "testing",
-            "deployment",
-            "orchestration",
-            "containers",
-            "langchain",
-            "ollama",
-            "ai",
-            "machine learning",
-            "ml",
-            "ble",
-            "uwb",
-            "rf",
-            "satellite",
-            "telecommunications",
-            "iot",
-            "esp32",
-            "pzem",
-            "home assistant",
-            "real-time",
-            "v-model",
-            "methodology",
-            "team working",
-            "programming",
-            "languages",
-        }
-
-        found_skills = set()
-        text_lower = self.text.lower()
-
-        # Direct keyword search
-        for keyword in tech_keywords:
-            if keyword in text_lower:
-                found_skills.add(keyword)
-
-        # Search for common patterns and abbreviations
-        skill_patterns = [
-            (r"\bci\s*/\s*cd\b", "ci/cd"),
-            (r"\bc\+\+\b", "c++"),
-            (r"\bc#\b", "c#"),
-            (r"\bnode\.js\b", "node.js"),
-            (r"\bvue\.js\b", "vue.js"),
-            (r"\bnuxt\.js\b", "nuxt.js"),
-            (r"\bmachine\s+learning\b", "machine learning"),
-            (r"\bhome\s+assistant\b", "home assistant"),
-            (r"\breal[- ]time\b", "real-time"),
-            (r"\bv[- ]model\b", "v-model"),
-            (r"\bteam\s+working\b", "team working"),
-            (r"\bprogramming\s+languages\b", "programming languages"),
-            (r"\bcloud\s+and\s+iac\b", "cloud"),
-            (r"\bmonitoring\s+and\s+observability\b", "monitoring"),
-        ]
-
-        for pattern, skill_name in skill_patterns:
-            if re.search(pattern, text_lower):
-                found_skills.add(skill_name)
-
-        # Section-specific search for Skills section
-        skills_section = re.search(
-            r"(?i)(?:skills|compétences|technologies)(.*?)(?:\n(?:languages|professional\s+experience|education)|$)",
-            self.text,
-            re.DOTALL,
-        )
-
-        if skills_section:
-            skills_text = skills_section.group(1).lower()
-
-            # Additional patterns in skills section
-            additional_patterns = [
-                r"\b(helm)\b",
-                r"\b(jira)\b",
-                r"\b(confluence)\b",
-                r"\b(scrum)\b",
-                r"\b(agile)\b",
-                r"\b(grafana)\b",
-                r"\b(prometheus)\b",
-                r"\b(elk)\b",
-                r"\b(basic)\b",
-                r"\b(terraform)\b",
-                r"\b(ansible)\b",
-                r"\b(ovh)\b",
-                r"\b(aws)\b",
-                r"\b(gcp)\b",
-                r"\b(docker)\b",
-                r"\b(kubernetes)\b",
-                r"\b(podman)\b",
-                r"\b(gitlab)\b",
-                r"\b(github)\b",
-                r"\b(actions)\b",
-                r"\b(python)\b",
-                r"\b(golang)\b",
-                r"\b(typescript)\b",
-                r"\b(rust)\b",
-            ]
-
-            for pattern in additional_patterns:
-                matches = re.findall(pattern, skills_text)
-                found_skills.update(matches)
-
-        return sorted(found_skills)
+        return self.taxonomy.find(self.text)
 
     def extract_companies(self) -> List[str]:
         """Extract company names from CV.
@@ -340,11 +265,20 @@ class CVExtractor:
         Returns:
             CVData model with extracted information
         """
+        skills = self._timed("skills", self.extract_skills)
         return CVData(
-            name=self.extract_name(),
-            email=self.extract_email(),
-            position=self.extract_position(),
-            skills=self.extract_skills(),
-            companies=self.extract_companies(),
-            technologies=self.extract_skills(),  # Alias for skills
+            name=self._timed("name", self.extract_name),
+            email=self._timed("email", self.extract_email),
+            position=self._timed("position", self.extract_position),
+            skills=skills,
+            companies=self._timed("companies", self.extract_companies),
+            technologies=skills,  # Alias for skills
         )
+
+    def _timed(self, field: str, extractor: Callable[[], T]) -> T:
+        """Run a field extractor and record its duration in ``timings``."""
+        start = time.perf_counter()
+        try:
+            return extractor()
+        finally:
+            self.timings[field] = time.perf_counter() - start
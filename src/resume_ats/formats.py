@@ -0,0 +1,110 @@
+"""Registry of the output formats ResumeBuilder.build_all() can produce.
+
+Each format names the function that builds it and the formats whose
+outputs it needs. build_all() starts every format as soon as its
+dependencies are done, so independent formats are built in parallel. The
+built-in formats are registered by ``resume_ats.core``; more can be added
+with register_format().
+"""
+
+from typing import TYPE_CHECKING, Callable, Dict, List, Sequence, Tuple
+
+from .exceptions import BuildError
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from .core import ResumeBuilder
+
+BuildFunction = Callable[["ResumeBuilder"], "Path"]
+
+
+class OutputFormat:
+    """Output format and how to build it."""
+
+    def __init__(
+        self,
+        name: str,
+        build: BuildFunction,
+        requires: Sequence[str] = (),
+        description: str = "",
+    ) -> None:
+        """Describe a format.
+
+        Args:
+            name: Format name as given to ``--format``
+            build: Builds the format into the builder's working directory and
+                returns the published path
+            requires: Formats that must be built first
+            description: One-line summary for help texts
+        """
+        self.name = name
+        self.build = build
+        self.requires = tuple(requires)
+        self.description = description
+
+
+FORMATS: Dict[str, OutputFormat] = {}
+
+
+def register_format(
+    name: str,
+    build: BuildFunction,
+    requires: Sequence[str] = (),
+    description: str = "",
+) -> OutputFormat:
+    """Add or replace an output format.
+
+    Args:
+        name: Format name
+        build: Build function, called with the ResumeBuilder
+        requires: Formats that must be built first
+        description: One-line summary
+
+    Returns:
+        The registered format
+    """
+    output_format = OutputFormat(name, build, requires, description)
+    FORMATS[name] = output_format
+    return output_format
+
+
+def plan_formats(names: Sequence[str]) -> Tuple[List[OutputFormat], List[str]]:
+    """Resolve requested formats and their dependencies.
+
+    Args:
+        names: Requested format names
+
+    Returns:
+        Formats in dependency order (dependencies added even if not
+        requested), and the requested names that are not registered
+
+    Raises:
+        BuildError: If the dependencies form a cycle or name an unknown format
+    """
+    ordered: Dict[str, OutputFormat] = {}
+    visiting: List[str] = []
+
+    def visit(name: str) -> None:
+        if name in ordered:
+            return
+        if name in visiting:
+            cycle = " -> ".join(visiting[visiting.index(name) :] + [name])
+            raise BuildError(f"Output format dependency cycle: {cycle}")
+        visiting.append(name)
+        for dependency in FORMATS[name].requires:
+            if dependency not in FORMATS:
+                raise BuildError(
+                    f"Output format {name} requires unknown format {dependency}"
+                )
+            visit(dependency)
+        visiting.pop()
+        ordered[name] = FORMATS[name]
+
+    unknown = []
+    for name in names:
+        if name in FORMATS:
+            visit(name)
+        elif name not in unknown:
+            unknown.append(name)
+    return list(ordered.values()), unknown
@@ -0,0 +1,143 @@
+"""Append-only journal that lets an interrupted batch build resume.
+
+Every built resume of a batch is appended to the journal as one BatchItem
+JSON line, with its build duration and a digest of the resume data, the
+requested formats and the template files. A rerun with ``resume=True``
+skips every document whose last entry succeeded with the same digest and
+whose outputs still exist, and rebuilds only failures and changed
+documents.
+
+Lines are flushed as they are written, so a crashed or preempted batch
+loses at most the builds that were in flight. A torn last line is ignored
+on load, and the journal is compacted to one line per document when a run
+resumes from it.
+"""
+
+import hashlib
+import json
+from pathlib import Path
+from types import TracebackType
+from typing import IO, Dict, Iterable, Iterator, Optional, Sequence, Tuple, Type
+
+from .cache import atomic_write_bytes, file_digest
+from .models import BatchItem, ResumeData
+
+JOURNAL_NAME = "journal.jsonl"
+
+
+def settings_digest(formats: Sequence[str], template_dir: Path) -> str:
+    """Digest of the build settings that change the outputs.
+
+    Args:
+        formats: Requested output formats
+        template_dir: Template directory; every file in it is hashed
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    digest = hashlib.sha256(json.dumps(list(formats)).encode("utf-8"))
+    if template_dir.is_dir():
+        for path in sorted(p for p in template_dir.iterdir() if p.is_file()):
+            digest.update(f"{path.name}:{file_digest(path)}\n".encode())
+    return digest.hexdigest()
+
+
+class BuildJournal:
+    """Journal of one batch output directory."""
+
+    def __init__(self, path: Path, settings: str, resume: bool = False) -> None:
+        """Open the journal for appending.
+
+        Args:
+            path: Journal file
+            settings: Digest of the build settings, see settings_digest()
+            resume: Load the existing entries and skip completed documents.
+                The journal is started afresh if False.
+        """
+        self.path = path
+        self.settings = settings
+        self.entries: Dict[int, BatchItem] = self._load() if resume else {}
+        self.skipped = 0
+        self._digests: Dict[int, str] = {}
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        lines = "".join(e.model_dump_json() + "\n" for e in self.entries.values())
+        atomic_write_bytes(path, lines.encode("utf-8"))
+        self._file: IO[str] = path.open("a", encoding="utf-8")
+
+    def _load(self) -> Dict[int, BatchItem]:
+        """Last entry per document index."""
+        entries: Dict[int, BatchItem] = {}
+        try:
+            with self.path.open("r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        item = BatchItem.model_validate_json(line)
+                    except ValueError:
+                        continue  # Torn write of an interrupted run
+                    entries[item.index] = item
+        except FileNotFoundError:
+            pass
+        return entries
+
+    def digest(self, data: ResumeData) -> str:
+        """Digest of one resume under the journal's build settings."""
+        digest = hashlib.sha256(self.settings.encode("utf-8"))
+        digest.update(data.model_dump_json().encode("utf-8"))
+        return digest.hexdigest()
+
+    def is_complete(self, index: int, digest: str) -> bool:
+        """Whether a document was built successfully with the same digest."""
+        entry = self.entries.get(index)
+        return (
+            entry is not None
+            and entry.digest == digest
+            and entry.error is None
+            and entry.passed
+            and all(Path(p).exists() for p in entry.outputs.values())
+        )
+
+    def pending(
+        self, resumes: Iterable[Tuple[int, ResumeData]]
+    ) -> Iterator[Tuple[int, ResumeData]]:
+        """Drop the documents that are already complete from a stream.
+
+        Args:
+            resumes: ``(document index, resume)`` pairs
+
+        Yields:
+            Pairs that still need to be built; ``skipped`` counts the others
+        """
+        for index, data in resumes:
+            digest = self.digest(data)
+            if self.is_complete(index, digest):
+                self.skipped += 1
+                continue
+            self._digests[index] = digest
+            yield index, data
+
+    def record(self, item: BatchItem) -> None:
+        """Append the outcome of a build.
+
+        Args:
+            item: Result of a document yielded by pending()
+        """
+        item.digest = self._digests.pop(item.index, item.digest)
+        self.entries[item.index] = item
+        self._file.write(item.model_dump_json() + "\n")
+        self._file.flush()
+
+    def close(self) -> None:
+        """Close the journal file."""
+        self._file.close()
+
+    def __enter__(self) -> "BuildJournal":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
@@ -0,0 +1,213 @@
+"""Resource-bounded XeLaTeX runner.
+
+XeLaTeX runs in its own process group with CPU and address-space rlimits
+and a wall-clock timeout; on timeout the whole group is killed, so no
+child process outlives the build. The rlimits are set from the parent with
+``prlimit(2)`` right after the engine starts: builds run in worker
+threads, where a ``preexec_fn`` can deadlock the child. The terminal log is read line by line
+while the engine runs, and the run is cut short at the first ``!`` error
+instead of waiting for it and grepping ``resume.log`` afterwards.
+"""
+
+import os
+import re
+import signal
+import subprocess
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from types import ModuleType
+from typing import Deque, List, Optional, Sequence
+
+from .models import CompileResult, LatexDiagnostic
+
+resource: Optional[ModuleType]
+try:
+    import resource
+except ImportError:  # pragma: no cover - Windows
+    resource = None
+
+# Log lines kept after an error and at the end of the run
+CONTEXT_LINES = 6
+TAIL_LINES = 20
+
+DEFAULT_OPTIONS = ("-interaction=nonstopmode", "-halt-on-error")
+
+# "Output written on resume.xdv (2 pages, 10324 bytes)."
+OUTPUT_WRITTEN = re.compile(r"^Output written on .*\((\d+) pages?\b")
+
+
+class LatexRunner:
+    """Run a LaTeX engine with timeouts, rlimits and early error detection."""
+
+    def __init__(
+        self,
+        engine: Sequence[str] = ("xelatex",),
+        timeout: float = 120.0,
+        cpu_seconds: Optional[int] = 120,
+        memory_bytes: Optional[int] = 4 << 30,
+        options: Sequence[str] = DEFAULT_OPTIONS,
+    ) -> None:
+        """Initialize runner.
+
+        Args:
+            engine: Engine command, e.g. ``("xelatex",)``
+            timeout: Wall-clock limit in seconds
+            cpu_seconds: CPU time limit of the engine, None for no limit
+            memory_bytes: Address-space limit of the engine, None for no limit
+            options: Engine options placed before the file name
+        """
+        self.engine = list(engine)
+        self.timeout = timeout
+        self.cpu_seconds = cpu_seconds
+        self.memory_bytes = memory_bytes
+        self.options = list(options)
+
+    def command(self, tex_path: Path) -> List[str]:
+        """Command line compiling a file from its own directory.
+
+        Args:
+            tex_path: LaTeX source
+
+        Returns:
+            Argument list
+        """
+        return [*self.engine, *self.options, tex_path.name]
+
+    def _limit_resources(self, pid: int) -> None:
+        """Apply rlimits to the started engine.
+
+        Only the wall-clock timeout applies where ``prlimit`` is missing
+        (outside Linux).
+        """
+        if resource is None or not hasattr(resource, "prlimit"):
+            return  # pragma: no cover - not Linux
+        try:
+            if self.cpu_seconds:
+                # SIGXCPU at the soft limit, SIGKILL shortly after
+                resource.prlimit(
+                    pid, resource.RLIMIT_CPU, (self.cpu_seconds, self.cpu_seconds + 5)
+                )
+            if self.memory_bytes:
+                resource.prlimit(
+                    pid, resource.RLIMIT_AS, (self.memory_bytes, self.memory_bytes)
+                )
+        except ProcessLookupError:
+            pass  # Already exited
+
+    @staticmethod
+    def _kill_group(process: "subprocess.Popen[str]") -> None:
+        """Kill the process group of the engine, including its children."""
+        try:
+            os.killpg(process.pid, signal.SIGKILL)
+        except (ProcessLookupError, PermissionError):
+            pass
+
+    def run(self, tex_path: Path) -> CompileResult:
+        """Compile a LaTeX file.
+
+        Args:
+            tex_path: LaTeX source; outputs are written next to it
+
+        Returns:
+            CompileResult with the first error, if any
+
+        Raises:
+            FileNotFoundError: If the engine is not installed
+        """
+        start = time.perf_counter()
+        process = subprocess.Popen(
+            self.command(tex_path),
+            cwd=tex_path.parent,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            encoding="utf-8",
+            errors="replace",
+            start_new_session=True,
+        )
+        self._limit_resources(process.pid)
+
+        timed_out = threading.Event()
+
+        def expire() -> None:
+            timed_out.set()
+            self._kill_group(process)
+
+        watchdog = threading.Timer(self.timeout, expire)
+        watchdog.daemon = True
+        watchdog.start()
+
+        tail: Deque[str] = deque(maxlen=TAIL_LINES)
+        diagnostic: Optional[LatexDiagnostic] = None
+        pages: Optional[int] = None
+        try:
+            assert process.stdout is not None
+            for raw in process.stdout:
+                line = raw.rstrip("\n")
+                tail.append(line)
+                if diagnostic is None:
+                    written = OUTPUT_WRITTEN.match(line)
+                    if written:
+                        pages = int(written.group(1))
+                    elif line.startswith("!"):
+                        diagnostic = LatexDiagnostic(message=line[1:].strip())
+                    continue
+                diagnostic.context.append(line)
+                if line.startswith("l.") and diagnostic.line is None:
+                    number = line[2:].split(" ", 1)[0]
+                    diagnostic.line = int(number) if number.isdigit() else None
+                    break
+                if len(diagnostic.context) >= CONTEXT_LINES:
+                    break
+        finally:
+            watchdog.cancel()
+            aborted = diagnostic is not None and process.poll() is None
+            # Also reaps anything the engine left running in its group
+            self._kill_group(process)
+            returncode = process.wait()
+            if process.stdout is not None:
+                process.stdout.close()
+
+        killed = timed_out.is_set() or aborted
+        return CompileResult(
+            returncode=None if killed else returncode,
+            duration=time.perf_counter() - start,
+            timed_out=timed_out.is_set(),
+            aborted=aborted,
+            diagnostics=[diagnostic] if diagnostic else [],
+            pages=pages,
+            log_tail=list(tail),
+        )
+
+
+def describe_failure(result: CompileResult) -> str:
+    """Human-readable summary of a failed run.
+
+    Args:
+        result: Failed compile result
+
+    Returns:
+        Error message
+    """
+    if result.timed_out:
+        message = f"XeLaTeX timed out after {result.duration:.0f}s"
+    elif result.returncode is None:
+        message = "XeLaTeX stopped at the first error"
+    else:
+        message = f"XeLaTeX compilation failed (exit code {result.returncode})"
+
+    for diagnostic in result.diagnostics:
+        location = f" (line {diagnostic.line})" if diagnostic.line else ""
+        message += f"\n\nLaTeX Error{location}: {diagnostic.message}"
+        if diagnostic.context:
+            message += "\n" + "\n".join(diagnostic.context)
+        if "Font" in diagnostic.message:
+            message += (
+                "\n\nFont error detected. Make sure required fonts are installed."
+            )
+    if not result.diagnostics and result.log_tail:
+        message += "\nOUTPUT:\n" + "\n".join(result.log_tail)
+    return message
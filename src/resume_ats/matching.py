@@ -0,0 +1,355 @@
+"""Job-description matching with a cached sparse BM25 index.
+
+A corpus of job postings is analyzed once into a sparse document-term
+matrix holding BM25 weights (skill mentions are folded onto their canonical
+taxonomy IDs, so "k8s" in a posting matches "Kubernetes" in a resume). The
+matrix is cached on disk; scoring a resume against every posting is then a
+single sparse matrix-vector product.
+
+Requires the ``match`` extra (NumPy and SciPy).
+"""
+
+import hashlib
+import json
+from collections import Counter
+from pathlib import Path
+from typing import (
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
+
+import numpy as np
+from scipy import sparse
+
+from . import metrics
+from .cache import cache_dir
+from .exceptions import ResumeATSError
+from .models import CVData, JobMatch, JobPosting, ResumeData, Skill
+from .taxonomy import SkillTaxonomy, default_taxonomy
+
+INDEX_VERSION = 1
+
+# Common English words that carry no signal for matching
+STOPWORDS = frozenset("""
+    a about above after all also an and any are as at be been being both but by
+    can could did do does doing for from had has have having he her here his how
+    i if in into is it its just may me more most must my no nor not of on once
+    only or other our out over own same she should so some such than that the
+    their them then there these they this those through to too under until up
+    very was we were what when where which while who whom why will with would
+    you your years year experience work working team strong knowledge ability
+    """.split())
+
+
+def analyze(
+    text: str, taxonomy: Optional[SkillTaxonomy] = None
+) -> List[Tuple[str, bool]]:
+    """Turn free text into ``(term, is_skill)`` pairs for indexing.
+
+    Skill mentions become canonical skill IDs; other tokens are kept if they
+    are alphabetic, longer than two characters and not stopwords.
+
+    Args:
+        text: Free text
+        taxonomy: Skill taxonomy. Uses the bundled taxonomy if None.
+
+    Returns:
+        List of ``(term, is_skill)`` pairs
+    """
+    taxonomy = taxonomy or default_taxonomy()
+    return [
+        (term, is_skill)
+        for term, is_skill in taxonomy.canonical_terms(text)
+        if is_skill or (len(term) > 2 and term.isalpha() and term not in STOPWORDS)
+    ]
+
+
+def resume_text(resume: Union[ResumeData, CVData]) -> str:
+    """Collect the matchable text of a resume.
+
+    Args:
+        resume: Source resume data or data extracted from a PDF
+
+    Returns:
+        Plain text
+    """
+    if isinstance(resume, CVData):
+        return "\n".join([resume.position, *resume.skills, *resume.technologies])
+
+    parts = [resume.basics.label or "", resume.basics.summary or ""]
+    for job in resume.work:
+        parts.extend([job.position, *job.highlights])
+    for project in resume.projects:
+        parts.extend([project.description, *project.highlights, *project.keywords])
+    for skill in resume.skills:
+        parts.extend(skill.keywords if isinstance(skill, Skill) else [skill])
+    return "\n".join(parts).replace("**", "")
+
+
+def load_postings(source: Path) -> Iterator[JobPosting]:
+    """Read job postings from a JSON Lines file or a directory of text files.
+
+    JSON Lines records need ``id`` and ``text`` (or ``description``) and may
+    have a ``title``. In a directory, every ``*.txt``/``*.md`` file is one
+    posting whose id is the file stem.
+
+    Args:
+        source: ``.jsonl`` file or directory
+
+    Yields:
+        JobPosting instances
+    """
+    if source.is_dir():
+        for path in sorted(source.iterdir()):
+            if path.suffix in (".txt", ".md"):
+                text = path.read_text(encoding="utf-8", errors="ignore")
+                title = text.strip().splitlines()[0] if text.strip() else path.stem
+                yield JobPosting(id=path.stem, title=title, text=text)
+        return
+
+    with source.open("r", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                record = json.loads(line)
+                record.setdefault("text", record.pop("description", ""))
+                yield JobPosting(**record)
+
+
+def _fingerprint(source: Path, k1: float, b: float) -> str:
+    """Hash the corpus file metadata and index parameters."""
+    paths = sorted(source.iterdir()) if source.is_dir() else [source]
+    digest = hashlib.sha1(f"{INDEX_VERSION}:{k1}:{b}".encode())
+    for path in paths:
+        stat = path.stat()
+        digest.update(f"{path.resolve()}:{stat.st_mtime_ns}:{stat.st_size}".encode())
+    return digest.hexdigest()[:16]
+
+
+class JobIndex:
+    """BM25-weighted posting x term matrix."""
+
+    def __init__(
+        self,
+        matrix: sparse.csr_matrix,
+        terms: Sequence[str],
+        skill_mask: np.ndarray,
+        ids: Sequence[str],
+        titles: Sequence[str],
+    ) -> None:
+        """Initialize index from its components.
+
+        Args:
+            matrix: CSR matrix of BM25 weights, one row per posting
+            terms: Vocabulary, one entry per matrix column
+            skill_mask: Boolean array marking columns that are skill IDs
+            ids: Posting IDs, one per row
+            titles: Posting titles, one per row
+        """
+        self.matrix = matrix
+        self.terms = list(terms)
+        self.skill_mask = skill_mask
+        self.ids = list(ids)
+        self.titles = list(titles)
+        self._columns = {term: i for i, term in enumerate(self.terms)}
+
+    def __len__(self) -> int:
+        """Return the number of postings."""
+        return len(self.ids)
+
+    @classmethod
+    def build(
+        cls,
+        postings: Iterable[JobPosting],
+        k1: float = 1.5,
+        b: float = 0.75,
+    ) -> "JobIndex":
+        """Analyze postings and compute the BM25 matrix.
+
+        Args:
+            postings: Job postings
+            k1: BM25 term-frequency saturation
+            b: BM25 length normalization
+
+        Returns:
+            JobIndex instance
+        """
+        vocabulary: Dict[str, int] = {}
+        skills: Set[int] = set()
+        rows: List[int] = []
+        columns: List[int] = []
+        counts: List[int] = []
+        lengths: List[int] = []
+        ids: List[str] = []
+        titles: List[str] = []
+
+        for row, posting in enumerate(postings):
+            tokens = analyze(f"{posting.title}\n{posting.text}")
+            for (term, is_skill), count in Counter(tokens).items():
+                column = vocabulary.setdefault(term, len(vocabulary))
+                if is_skill:
+                    skills.add(column)
+                rows.append(row)
+                columns.append(column)
+                counts.append(count)
+            lengths.append(len(tokens))
+            ids.append(posting.id)
+            titles.append(posting.title)
+
+        shape = (len(ids), len(vocabulary))
+        matrix = sparse.csr_matrix(
+            (np.asarray(counts, dtype=np.float32), (rows, columns)), shape=shape
+        )
+        matrix.sum_duplicates()
+
+        doc_freq = np.bincount(matrix.indices, minlength=shape[1])
+        idf = np.log1p((shape[0] - doc_freq + 0.5) / (doc_freq + 0.5))
+        doc_len = np.asarray(lengths, dtype=np.float32)
+        avg_len = float(doc_len.mean()) if len(doc_len) else 1.0
+        row_len = np.repeat(doc_len, np.diff(matrix.indptr))
+        tf = matrix.data
+        matrix.data = (
+            idf[matrix.indices]
+            * tf
+            * (k1 + 1)
+            / (tf + k1 * (1 - b + b * row_len / max(avg_len, 1.0)))
+        ).astype(np.float32)
+
+        skill_mask = np.zeros(shape[1], dtype=bool)
+        skill_mask[list(skills)] = True
+        terms = sorted(vocabulary, key=vocabulary.__getitem__)
+        return cls(matrix, terms, skill_mask, ids, titles)
+
+    @classmethod
+    def load(
+        cls,
+        source: Path,
+        cache: Optional[Path] = None,
+        k1: float = 1.5,
+        b: float = 0.75,
+    ) -> "JobIndex":
+        """Load the index for a corpus, building and caching it if needed.
+
+        Args:
+            source: JSON Lines file or directory of postings
+            cache: Cache directory. Uses the user cache if None.
+            k1: BM25 term-frequency saturation
+            b: BM25 length normalization
+
+        Returns:
+            JobIndex instance
+        """
+        directory = (cache or cache_dir("jobs")) / _fingerprint(source, k1, b)
+        cached = (directory / "meta.json").exists()
+        metrics.cache_lookup("jobs", cached)
+        if cached:
+            return cls.read(directory)
+
+        index = cls.build(load_postings(source), k1=k1, b=b)
+        index.write(directory)
+        return index
+
+    def write(self, directory: Path) -> None:
+        """Save the index to a directory.
+
+        ``meta.json`` is written last and marks the cache entry complete.
+
+        Args:
+            directory: Destination directory
+        """
+        directory.mkdir(parents=True, exist_ok=True)
+        sparse.save_npz(directory / "matrix.npz", self.matrix)
+        np.save(directory / "skills.npy", self.skill_mask)
+        meta = {"terms": self.terms, "ids": self.ids, "titles": self.titles}
+        tmp = directory / "meta.json.tmp"
+        tmp.write_text(json.dumps(meta), encoding="utf-8")
+        tmp.replace(directory / "meta.json")
+
+    @classmethod
+    def read(cls, directory: Path) -> "JobIndex":
+        """Load an index saved with write().
+
+        Args:
+            directory: Index directory
+
+        Returns:
+            JobIndex instance
+
+        Raises:
+            ResumeATSError: If the directory does not hold a complete index
+        """
+        try:
+            meta = json.loads((directory / "meta.json").read_text(encoding="utf-8"))
+            matrix = sparse.load_npz(directory / "matrix.npz").tocsr()
+            skill_mask = np.load(directory / "skills.npy")
+        except (OSError, ValueError) as e:
+            raise ResumeATSError(f"Invalid job index in {directory}: {e}") from e
+        return cls(matrix, meta["terms"], skill_mask, meta["ids"], meta["titles"])
+
+    def query_vector(self, text: str) -> np.ndarray:
+        """Encode a text as a binary term vector over the index vocabulary.
+
+        Args:
+            text: Free text
+
+        Returns:
+            Dense float32 vector
+        """
+        vector = np.zeros(len(self.terms), dtype=np.float32)
+        columns = [self._columns[t] for t, _ in analyze(text) if t in self._columns]
+        vector[columns] = 1.0
+        return vector
+
+    def score(
+        self,
+        resume: Union[ResumeData, CVData],
+        top_k: int = 10,
+        max_keywords: int = 10,
+    ) -> List[JobMatch]:
+        """Score a resume against every posting.
+
+        Args:
+            resume: Source resume data or data extracted from a PDF
+            top_k: Number of best postings to return
+            max_keywords: Maximum matching/missing keywords per posting
+
+        Returns:
+            Best matches, highest score first
+        """
+        if not len(self):
+            return []
+
+        query = self.query_vector(resume_text(resume))
+        scores = self.matrix @ query
+
+        top_k = min(top_k, len(scores))
+        best = np.argpartition(-scores, top_k - 1)[:top_k]
+        best = best[np.argsort(-scores[best], kind="stable")]
+
+        matches = []
+        for row in best:
+            start, end = self.matrix.indptr[row], self.matrix.indptr[row + 1]
+            columns = self.matrix.indices[start:end]
+            weights = self.matrix.data[start:end]
+            order = np.argsort(-weights, kind="stable")
+            keywords = [c for c in columns[order] if self.skill_mask[c]]
+            matches.append(
+                JobMatch(
+                    id=self.ids[row],
+                    title=self.titles[row],
+                    score=float(scores[row]),
+                    matching=[self.terms[c] for c in keywords if query[c]][
+                        :max_keywords
+                    ],
+                    missing=[self.terms[c] for c in keywords if not query[c]][
+                        :max_keywords
+                    ],
+                )
+            )
+        return matches
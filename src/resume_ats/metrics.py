@@ -0,0 +1,371 @@
+"""Prometheus/OpenMetrics instrumentation.
+
+Builds, compiles, renders, extractions, cache lookups and queue depth are
+recorded in a process-wide registry that is disabled by default: every
+recording call then returns after a single attribute check, so an
+uninstrumented run pays nothing measurable. Once enabled, the registry is
+exposed in the OpenMetrics text format through a local ``/metrics``
+endpoint or a node-exporter textfile.
+
+Worker processes record into their own copy of the registry; they send
+what they recorded to the parent with Registry.drain(), and the parent
+adds it to its registry with Registry.merge().
+"""
+
+import atexit
+import bisect
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Sequence, Tuple
+
+from .cache import atomic_write_bytes
+
+CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+# Seconds; XeLaTeX runs take seconds, renders and extractions milliseconds
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+
+LabelValues = Tuple[str, ...]
+
+# Metric name -> recorded values, as sent by worker processes
+Snapshot = Dict[str, Dict[LabelValues, Any]]
+
+
+def _escape(value: str) -> str:
+    """Escape a label value."""
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    """Format a label set, e.g. ``{format="pdf"}``."""
+    if not names:
+        return ""
+    pairs = ",".join(f'{n}="{_escape(v)}"' for n, v in zip(names, values))
+    return "{" + pairs + "}"
+
+
+class Registry:
+    """Collection of metrics rendered together."""
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self.metrics: List[Metric] = []
+        self.lock = threading.Lock()
+
+    def render(self) -> str:
+        """Render every metric in the OpenMetrics text format.
+
+        Returns:
+            Exposition text terminated by ``# EOF``
+        """
+        with self.lock:
+            lines = [line for metric in self.metrics for line in metric.render()]
+        return "\n".join(lines + ["# EOF", ""])
+
+    def drain(self) -> Snapshot:
+        """Take the values recorded so far and reset them.
+
+        Returns:
+            Picklable values of every metric that recorded something
+        """
+        with self.lock:
+            snapshot = {m.name: m.values for m in self.metrics if m.values}
+            for metric in self.metrics:
+                metric.values = {}
+        return snapshot
+
+    def merge(self, snapshot: Snapshot) -> None:
+        """Add the values drained from another process's registry.
+
+        Counters and histograms are summed; gauges take the merged value.
+
+        Args:
+            snapshot: Result of drain() in a worker process
+        """
+        metrics = {m.name: m for m in self.metrics}
+        with self.lock:
+            for name, values in snapshot.items():
+                if name in metrics:
+                    metrics[name].merge(values)
+
+
+REGISTRY = Registry()
+
+
+class Metric:
+    """Base class of labelled metrics."""
+
+    kind = ""
+    values: Dict[LabelValues, Any]
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labels: Sequence[str] = (),
+        registry: Registry = REGISTRY,
+    ) -> None:
+        """Create and register a metric.
+
+        Args:
+            name: Metric family name
+            documentation: Help text
+            labels: Label names
+            registry: Registry the metric belongs to
+        """
+        self.name = name
+        self.documentation = documentation
+        self.labels = tuple(labels)
+        self.registry = registry
+        registry.metrics.append(self)
+
+    def header(self) -> List[str]:
+        return [
+            f"# TYPE {self.name} {self.kind}",
+            f"# HELP {self.name} {self.documentation}",
+        ]
+
+    def render(self) -> List[str]:
+        raise NotImplementedError
+
+    def merge(self, values: Dict[LabelValues, Any]) -> None:
+        """Add drained values; the caller holds the registry lock."""
+        raise NotImplementedError
+
+
+class Counter(Metric):
+    """Monotonically increasing count."""
+
+    kind = "counter"
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.values: Dict[LabelValues, float] = {}
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        """Increase the counter of a label set.
+
+        Args:
+            *labels: Label values, in declaration order
+            amount: Increment
+        """
+        if not self.registry.enabled:
+            return
+        with self.registry.lock:
+            self.values[labels] = self.values.get(labels, 0.0) + amount
+
+    def merge(self, values: Dict[LabelValues, float]) -> None:
+        for labels, value in values.items():
+            self.values[labels] = self.values.get(labels, 0.0) + value
+
+    def render(self) -> List[str]:
+        lines = self.header()
+        for labels, value in sorted(self.values.items()):
+            lines.append(
+                f"{self.name}_total{_format_labels(self.labels, labels)} {value:g}"
+            )
+        return lines
+
+
+class Gauge(Metric):
+    """Value that goes up and down."""
+
+    kind = "gauge"
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.values: Dict[LabelValues, float] = {}
+
+    def set(self, value: float, *labels: str) -> None:
+        """Set the gauge of a label set.
+
+        Args:
+            value: New value
+            *labels: Label values, in declaration order
+        """
+        if not self.registry.enabled:
+            return
+        with self.registry.lock:
+            self.values[labels] = value
+
+    def merge(self, values: Dict[LabelValues, float]) -> None:
+        self.values.update(values)
+
+    def render(self) -> List[str]:
+        lines = self.header()
+        for labels, value in sorted(self.values.items()):
+            lines.append(f"{self.name}{_format_labels(self.labels, labels)} {value:g}")
+        return lines
+
+
+class Histogram(Metric):
+    """Distribution of observed values in cumulative buckets."""
+
+    kind = "histogram"
+
+    def __init__(
+        self, *args: Any, buckets: Sequence[float] = DEFAULT_BUCKETS, **kwargs: Any
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.buckets = tuple(sorted(buckets))
+        # Label set -> (per-bucket counts incl. +Inf, sum)
+        self.values: Dict[LabelValues, Tuple[List[int], float]] = {}
+
+    def observe(self, value: float, *labels: str) -> None:
+        """Record one observation.
+
+        Args:
+            value: Observed value
+            *labels: Label values, in declaration order
+        """
+        if not self.registry.enabled:
+            return
+        with self.registry.lock:
+            counts, total = self.values.get(labels) or (
+                [0] * (len(self.buckets) + 1),
+                0.0,
+            )
+            counts[bisect.bisect_left(self.buckets, value)] += 1
+            self.values[labels] = (counts, total + value)
+
+    def merge(self, values: Dict[LabelValues, Tuple[List[int], float]]) -> None:
+        for labels, (counts, total) in values.items():
+            if labels in self.values:
+                mine, my_total = self.values[labels]
+                counts = [a + b for a, b in zip(mine, counts)]
+                total += my_total
+            self.values[labels] = (counts, total)
+
+    @contextmanager
+    def time(self, *labels: str) -> Iterator[None]:
+        """Observe the duration of a block in seconds.
+
+        Args:
+            *labels: Label values, in declaration order
+        """
+        if not self.registry.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, *labels)
+
+    def render(self) -> List[str]:
+        lines = self.header()
+        for labels, (counts, total) in sorted(self.values.items()):
+            cumulative = 0
+            bounds = [f"{b:g}" for b in self.buckets] + ["+Inf"]
+            for bound, count in zip(bounds, counts):
+                cumulative += count
+                label_text = _format_labels(self.labels + ("le",), labels + (bound,))
+                lines.append(f"{self.name}_bucket{label_text} {cumulative}")
+            label_text = _format_labels(self.labels, labels)
+            lines.append(f"{self.name}_count{label_text} {cumulative}")
+            lines.append(f"{self.name}_sum{label_text} {total:g}")
+        return lines
+
+
+BUILDS = Counter(
+    "resume_builds", "Builds by output format and outcome.", ("format", "outcome")
+)
+XELATEX_DURATION = Histogram(
+    "resume_xelatex_duration_seconds", "XeLaTeX run wall time.", ("mode",)
+)
+RENDER_DURATION = Histogram(
+    "resume_render_duration_seconds", "Template rendering time.", ("template",)
+)
+EXTRACTION_DURATION = Histogram(
+    "resume_extraction_duration_seconds",
+    "PDF text extraction time by backend.",
+    ("backend",),
+)
+CACHE_REQUESTS = Counter(
+    "resume_cache_requests", "Cache lookups by cache and result.", ("cache", "result")
+)
+QUEUE_DEPTH = Gauge("resume_queue_depth", "Jobs waiting in a queue.", ("queue",))
+
+
+def cache_lookup(cache: str, hit: bool) -> None:
+    """Count a cache hit or miss.
+
+    Args:
+        cache: Cache name
+        hit: Whether the entry was found
+    """
+    CACHE_REQUESTS.inc(cache, "hit" if hit else "miss")
+
+
+def enable(registry: Registry = REGISTRY) -> None:
+    """Start recording metrics."""
+    registry.enabled = True
+
+
+def write_textfile(path: Path, registry: Registry = REGISTRY) -> None:
+    """Atomically write the metrics for the node-exporter textfile collector.
+
+    Args:
+        path: Destination ``.prom`` file
+        registry: Registry to write
+    """
+    atomic_write_bytes(path, registry.render().encode("utf-8"))
+
+
+def start_textfile_writer(
+    path: Path, interval: float = 15.0, registry: Registry = REGISTRY
+) -> None:
+    """Rewrite a textfile periodically and at exit; enables the registry.
+
+    Args:
+        path: Destination ``.prom`` file
+        interval: Seconds between writes
+        registry: Registry to write
+    """
+    enable(registry)
+
+    def loop() -> None:
+        while True:
+            time.sleep(interval)
+            write_textfile(path, registry)
+
+    threading.Thread(target=loop, daemon=True).start()
+    atexit.register(write_textfile, path, registry)
+
+
+def serve(
+    port: int, address: str = "127.0.0.1", registry: Registry = REGISTRY
+) -> ThreadingHTTPServer:
+    """Serve ``/metrics`` from a background thread; enables the registry.
+
+    Args:
+        port: TCP port, 0 for any free port
+        address: Listen address; local only by default
+        registry: Registry to expose
+
+    Returns:
+        Running server; ``server_address`` holds the bound port
+    """
+    enable(registry)
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            if self.path.split("?", 1)[0] != "/metrics":
+                self.send_error(404)
+                return
+            body = registry.render().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", CONTENT_TYPE)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args: object) -> None:
+            pass
+
+    server = ThreadingHTTPServer((address, port), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
@@ -1,7 +1,7 @@
 """Data models for resume generation and validation."""
 
 from pathlib import Path
-from typing import List, Optional, Union
+from typing import Dict, List, Literal, Optional, Union
 
 from pydantic import BaseModel, ConfigDict
 
@@ -124,3 +124,226 @@ class BuildConfig(BaseModel):
     output_dir: Path = Path("build")
     clean_build: bool = True
     formats: List[str] = ["pdf"]
+    validate_output: bool = False  # Validate generated PDFs in-process
+    compile_timeout: float = 120.0  # Wall-clock seconds per XeLaTeX run
+    check_latex: bool = False  # Run an XDV-only check before the full PDF
+    optimize_pdf: bool = False  # Linearize and compact the PDF (pikepdf or qpdf)
+    preflight: bool = False  # Resolve template packages and fonts before compiling
+
+
+class FieldResult(BaseModel):
+    """Outcome of validating one extracted field."""
+
+    name: str
+    expected: str
+    found: str
+    passed: bool
+
+
+class SkillMatch(BaseModel):
+    """How one expected skill was matched against the extracted skills."""
+
+    skill: str
+    match_type: Literal["exact", "partial", "fuzzy", "missing"]
+    matched: Optional[str] = None
+    score: float = 0.0
+
+
+class ValidationReport(BaseModel):
+    """ATS validation report for one resume."""
+
+    source: str = ""  # Validated document
+    fields: List[FieldResult] = []
+    skills: List[SkillMatch] = []
+    skills_expected: int = 0
+    skills_found: int = 0
+    skills_matched: int = 0
+    coverage: float = 0.0  # skills_matched / skills_expected
+    passed: bool = True
+    timings: Dict[str, float] = {}  # Seconds per stage
+    error: Optional[str] = None  # Why the document could not be validated
+
+
+class JobPosting(BaseModel):
+    """Job description used for resume matching."""
+
+    id: str
+    title: str = ""
+    text: str
+
+
+class JobMatch(BaseModel):
+    """Score of a resume against one job posting."""
+
+    id: str
+    title: str = ""
+    score: float
+    matching: List[str] = []  # Posting skills found in the resume
+    missing: List[str] = []  # Posting skills absent from the resume
+
+
+class IndexStats(BaseModel):
+    """Outcome of an incremental resume indexing run."""
+
+    indexed: int = 0  # Files extracted and (re)indexed
+    reused: int = 0  # New paths whose content was already indexed
+    unchanged: int = 0  # Files skipped because their content did not change
+    removed: int = 0  # Files pruned because they no longer exist
+    failed: Dict[str, str] = {}  # Path -> error message
+
+
+class SearchHit(BaseModel):
+    """Resume matching a full-text search query."""
+
+    path: str
+    name: str = ""
+    email: str = ""
+    position: str = ""
+    score: float = 0.0  # BM25 rank, lower is better
+    snippet: str = ""
+
+
+class DuplicateCluster(BaseModel):
+    """Group of near-duplicate documents."""
+
+    paths: List[str]
+    similarity: float  # Lowest estimated Jaccard similarity that joined the group
+
+
+class BatchItem(BaseModel):
+    """Outcome of building one resume from a batch stream."""
+
+    index: int  # Document index in the stream
+    name: str = ""
+    output_dir: str = ""
+    outputs: Dict[str, str] = {}  # Format -> generated file
+    passed: bool = True  # All in-process validations passed
+    error: Optional[str] = None
+    duration: float = 0.0  # Build wall time in seconds
+    digest: str = ""  # Resume and build settings, set by the batch journal
+
+
+class SiteFile(BaseModel):
+    """Entry of a static site manifest."""
+
+    etag: str
+    size: int
+    content_type: str
+    encodings: List[str] = []  # Precompressed siblings, e.g. ["br", "gzip"]
+
+
+class LatexDiagnostic(BaseModel):
+    """Error reported by a LaTeX run."""
+
+    message: str  # The "!" line without its marker
+    line: Optional[int] = None  # Source line from the "l.<n>" marker
+    context: List[str] = []  # Log lines following the error
+
+
+class CompileResult(BaseModel):
+    """Outcome of one XeLaTeX run."""
+
+    returncode: Optional[int] = None  # None if the run was killed
+    duration: float = 0.0
+    timed_out: bool = False
+    aborted: bool = False  # Killed at the first error
+    diagnostics: List[LatexDiagnostic] = []
+    log_tail: List[str] = []  # Last output lines, for errors without a "!" line
+    pages: Optional[int] = None  # From "Output written on ..."
+
+    @property
+    def success(self) -> bool:
+        """Whether the run finished cleanly."""
+        return self.returncode == 0 and not self.diagnostics
+
+
+class SpoolJob(BaseModel):
+    """Build job stored in a spool directory."""
+
+    id: str
+    resume: ResumeData
+    formats: List[str] = ["pdf"]
+    validate_output: bool = False
+    submitted: float = 0.0  # Unix time
+    token: Optional[str] = None  # Claim token, set by Spool.claim()
+
+
+JobState = Literal["pending", "running", "done", "failed"]
+
+
+class JobStatus(BaseModel):
+    """State and results of a spooled build job."""
+
+    id: str
+    state: JobState
+    name: str = ""
+    worker: Optional[str] = None
+    outputs: Dict[str, str] = {}  # Format -> path relative to the spool root
+    passed: bool = True  # All in-process validations passed
+    error: Optional[str] = None
+    duration: float = 0.0
+
+
+PdfBackend = Literal["pikepdf", "qpdf"]
+
+
+class PdfOptimization(BaseModel):
+    """Outcome of post-processing a PDF."""
+
+    backend: PdfBackend
+    size_before: int
+    size_after: int
+    cached: bool = False  # Reused a result for identical input
+
+
+class ParserResult(BaseModel):
+    """Fields extracted from one PDF text backend."""
+
+    backend: str
+    seconds: float = 0.0  # Text extraction plus field extraction
+    data: Optional[CVData] = None
+    error: Optional[str] = None  # Backend missing or failed
+    skipped: bool = False  # Backend not installed; not counted for agreement
+
+
+class FieldAgreement(BaseModel):
+    """How far the text backends agree on one field."""
+
+    field: str
+    agreement: float  # 1.0 when every backend agrees; 0.0 if none found it
+    value: Union[str, List[str]]  # Majority value
+    values: Dict[str, Union[str, List[str]]] = {}  # Backend -> extracted value
+    missing: bool = False  # No backend extracted the field
+
+
+class ConsensusReport(BaseModel):
+    """Multi-parser extraction of one PDF."""
+
+    path: str
+    parsers: List[ParserResult] = []
+    fields: List[FieldAgreement] = []
+    wall_time: float = 0.0
+
+
+RequirementKind = Literal["package", "font"]
+
+
+class Requirement(BaseModel):
+    """Package or font a template needs from the TeX installation."""
+
+    kind: RequirementKind
+    name: str  # e.g. "fontspec.sty", "Roboto-Regular.otf" or a family name
+    path: Optional[str] = None  # Resolved file, None if missing
+
+
+class PreflightReport(BaseModel):
+    """Resolution of every template requirement."""
+
+    installation: str  # Cache key of the TeX installation
+    requirements: List[Requirement] = []
+    cached: int = 0  # Requirements answered from the cache
+
+    @property
+    def missing(self) -> List[Requirement]:
+        """Requirements that could not be resolved."""
+        return [r for r in self.requirements if r.path is None]
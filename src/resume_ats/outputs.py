@@ -0,0 +1,149 @@
+"""Concurrency-safe build output directories.
+
+Each build works in a private scratch directory (``.build-*``) inside the
+output directory and publishes its final files with ``os.replace``, so
+readers never see a partially written PDF and two builds never share
+intermediate files. Cleaning and publishing take an advisory lock on the
+output directory; compiling does not, so builds still run in parallel.
+
+A scratch directory holds its own lock for as long as its build runs, which
+lets cleaning tell in-flight builds from the leftovers of crashed ones.
+Locks are no-ops on platforms without ``fcntl``.
+"""
+
+import os
+import shutil
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from types import ModuleType, TracebackType
+from typing import IO, Iterator, Optional, Type
+
+fcntl: Optional[ModuleType]
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+LOCK_NAME = ".lock"
+SCRATCH_PREFIX = ".build-"
+
+
+def _try_lock(f: IO[bytes], blocking: bool) -> bool:
+    """Take an exclusive flock on an open file."""
+    if fcntl is None:
+        return True
+    try:
+        fcntl.flock(f, fcntl.LOCK_EX | (0 if blocking else fcntl.LOCK_NB))
+    except BlockingIOError:
+        return False
+    return True
+
+
+@contextmanager
+def directory_lock(directory: Path) -> Iterator[None]:
+    """Hold the advisory lock of an output directory.
+
+    Args:
+        directory: Output directory, created if missing
+    """
+    directory.mkdir(parents=True, exist_ok=True)
+    with open(directory / LOCK_NAME, "ab") as f:
+        _try_lock(f, blocking=True)
+        yield
+
+
+def _scratch_in_use(scratch: Path) -> bool:
+    """Tell whether a running build still owns a scratch directory."""
+    if fcntl is None:
+        return True
+    try:
+        with open(scratch / LOCK_NAME, "ab") as f:
+            return not _try_lock(f, blocking=False)
+    except OSError:
+        return False
+
+
+def clean_output_dir(directory: Path) -> None:
+    """Remove previous outputs and abandoned scratch directories.
+
+    Scratch directories of builds that are still running are kept.
+
+    Args:
+        directory: Output directory
+    """
+    with directory_lock(directory):
+        for entry in directory.iterdir():
+            if entry.name == LOCK_NAME:
+                continue
+            if entry.name.startswith(SCRATCH_PREFIX) and _scratch_in_use(entry):
+                continue
+            if entry.is_dir() and not entry.is_symlink():
+                shutil.rmtree(entry, ignore_errors=True)
+            else:
+                entry.unlink(missing_ok=True)
+
+
+class ScratchDir:
+    """Private working directory of one build."""
+
+    def __init__(self, output_dir: Path) -> None:
+        """Create a locked scratch directory inside the output directory.
+
+        Args:
+            output_dir: Output directory the build publishes to
+        """
+        self.output_dir = output_dir
+        # Locked before cleaning can see it, or it would look abandoned
+        with directory_lock(output_dir):
+            self.path = Path(tempfile.mkdtemp(prefix=SCRATCH_PREFIX, dir=output_dir))
+            self._lock = open(self.path / LOCK_NAME, "ab")
+            _try_lock(self._lock, blocking=True)
+
+    def publish(self, relative: str, name: Optional[str] = None) -> Path:
+        """Atomically move a file or directory tree into the output directory.
+
+        Files are renamed one by one, so each published file is either the
+        previous version or the complete new one.
+
+        Args:
+            relative: Path inside the scratch directory
+            name: Destination path inside the output directory. Defaults to
+                ``relative``.
+
+        Returns:
+            Published path
+        """
+        source = self.path / relative
+        destination = self.output_dir / (name or relative)
+        files = (
+            [p for p in source.rglob("*") if p.is_file()]
+            if source.is_dir()
+            else [source]
+        )
+        with directory_lock(self.output_dir):
+            for path in files:
+                target = (
+                    destination / path.relative_to(source)
+                    if path != source
+                    else destination
+                )
+                target.parent.mkdir(parents=True, exist_ok=True)
+                os.replace(path, target)
+        return destination
+
+    def close(self) -> None:
+        """Delete the scratch directory and release its lock."""
+        shutil.rmtree(self.path, ignore_errors=True)
+        self._lock.close()
+
+    def __enter__(self) -> "ScratchDir":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
@@ -0,0 +1,154 @@
+"""PDF post-processing for web delivery.
+
+Compiled PDFs are linearized ("fast web view", so the first page renders
+before the download completes) and rewritten with compressed object
+streams. With pikepdf (the ``pdf`` extra), identical embedded images, e.g.
+the same logo used by several jobs under different file names, are
+merged into one object first. Without pikepdf the ``qpdf`` command is
+used, which linearizes and packs objects but does not merge images.
+
+Results are cached by the SHA-256 of the input PDF, so rebuilding an
+unchanged resume skips the rewrite.
+"""
+
+import hashlib
+import shutil
+import subprocess
+import uuid
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from . import metrics
+from .cache import atomic_write_bytes, cache_dir, file_digest
+from .exceptions import BuildError
+from .models import PdfBackend, PdfOptimization
+
+# Bump when the output for a given input changes
+CACHE_VERSION = "1"
+
+QPDF_ARGS = (
+    "--linearize",
+    "--object-streams=generate",
+    "--compress-streams=y",
+    "--recompress-flate",
+)
+
+
+def available_backend() -> Optional[PdfBackend]:
+    """Name of the backend that would be used, or None."""
+    try:
+        import pikepdf  # noqa: F401
+    except ImportError:
+        return "qpdf" if shutil.which("qpdf") else None
+    return "pikepdf"
+
+
+def _dedupe_images(pdf: Any) -> int:
+    """Point every page at one object per distinct image stream.
+
+    Returns:
+        Number of image references replaced
+    """
+    import pikepdf
+
+    seen: Dict[str, Any] = {}
+    replaced = 0
+    for page in pdf.pages:
+        xobjects = page.obj.get("/Resources", {}).get("/XObject", {})
+        for name in list(xobjects.keys()):
+            image = xobjects[name]
+            if image.get("/Subtype") != pikepdf.Name.Image:
+                continue
+            digest = hashlib.sha256(image.read_raw_bytes())
+            for key in sorted(k for k in image.keys() if k != "/Length"):
+                digest.update(f"{key}={image[key]!r}".encode())
+            key = digest.hexdigest()
+            if key not in seen:
+                seen[key] = image
+            elif seen[key].objgen != image.objgen:
+                xobjects[name] = seen[key]
+                replaced += 1
+    return replaced
+
+
+def _optimize_with_pikepdf(source: Path, destination: Path) -> None:
+    """Merge duplicate images, then save linearized with object streams."""
+    import pikepdf
+
+    with pikepdf.open(source) as pdf:
+        if _dedupe_images(pdf):
+            pdf.remove_unreferenced_resources()
+        pdf.save(
+            destination,
+            linearize=True,
+            object_stream_mode=pikepdf.ObjectStreamMode.generate,
+            compress_streams=True,
+            recompress_flate=True,
+        )
+
+
+def _optimize_with_qpdf(source: Path, destination: Path) -> None:
+    """Linearize and pack objects with the qpdf command."""
+    result = subprocess.run(
+        ["qpdf", *QPDF_ARGS, str(source), str(destination)],
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    # Exit code 3 means success with warnings
+    if result.returncode not in (0, 3):
+        raise BuildError(f"qpdf failed: {result.stderr.strip()}")
+
+
+def optimize_pdf(
+    source: Path, destination: Optional[Path] = None, cache: Optional[Path] = None
+) -> PdfOptimization:
+    """Linearize and compact a PDF, reusing a cached result if possible.
+
+    Args:
+        source: PDF to optimize
+        destination: Output path. Replaces ``source`` if None.
+        cache: Cache directory. Uses the user cache if None.
+
+    Returns:
+        PdfOptimization with the sizes before and after
+
+    Raises:
+        BuildError: If neither pikepdf nor qpdf is available, or they fail
+    """
+    backend = available_backend()
+    if backend is None:
+        raise BuildError(
+            "PDF optimization requires pikepdf (pip install 'resume-ats[pdf]') "
+            "or the qpdf command"
+        )
+    destination = destination or source
+    size_before = source.stat().st_size
+    cached = (cache or cache_dir("pdf")) / (
+        f"{file_digest(source)}-{backend}-{CACHE_VERSION}.pdf"
+    )
+
+    hit = cached.exists()
+    metrics.cache_lookup("pdf", hit)
+    if not hit:
+        temp = cached.with_name(f".{cached.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            if backend == "pikepdf":
+                _optimize_with_pikepdf(source, temp)
+            else:
+                _optimize_with_qpdf(source, temp)
+        except BuildError:
+            temp.unlink(missing_ok=True)
+            raise
+        except Exception as e:
+            temp.unlink(missing_ok=True)
+            raise BuildError(f"PDF optimization failed: {e}") from e
+        temp.replace(cached)
+
+    atomic_write_bytes(destination, cached.read_bytes())
+    return PdfOptimization(
+        backend=backend,
+        size_before=size_before,
+        size_after=destination.stat().st_size,
+        cached=hit,
+    )
@@ -0,0 +1,143 @@
+"""Plain-text and Markdown resumes rendered straight from ResumeData.
+
+Many ATS upload portals accept a plain-text resume, which is parsed far
+more reliably than a PDF. Both formats are produced from the validated
+data in one pass, without templates, LaTeX or a PDF round trip, so they
+cost milliseconds. The Markdown variant keeps the ``**bold**`` markup of
+``resume.yml``; the text variant drops it.
+"""
+
+from typing import Iterator, List, Optional, Tuple
+
+from .models import Language, Location, ResumeData, Skill
+
+Section = Tuple[str, List[str]]
+
+
+def _dates(start: Optional[str], end: Optional[str]) -> str:
+    """Date range such as ``2020-01 – Present``."""
+    if not start and not end:
+        return ""
+    return f"{start or ''} – {end or 'Present'}".strip(" –")
+
+
+def _join(*parts: Optional[str], sep: str = ", ") -> str:
+    """Join the non-empty parts."""
+    return sep.join(p for p in parts if p)
+
+
+def _header(data: ResumeData) -> List[str]:
+    """Name, title and contact lines."""
+    basics = data.basics
+    location = basics.location
+    if isinstance(location, Location):
+        location = _join(location.city, location.countryCode)
+    contact = _join(
+        location, basics.email, *(p.url for p in basics.profiles), sep=" | "
+    )
+    return [line for line in (basics.label, contact) if line]
+
+
+def _sections(data: ResumeData, entry: str = "", title: str = "") -> Iterator[Section]:
+    """Headed sections in the order recruiters and parsers expect.
+
+    Args:
+        data: Resume data
+        entry: Prefix of one-line entries, ``"- "`` for Markdown list items
+        title: Prefix of the first line of multi-line entries, ``"### "``
+            for Markdown headings
+
+    Yields:
+        Section heading and body lines
+    """
+    if data.basics.summary:
+        yield "Summary", [data.basics.summary.strip()]
+
+    work = []
+    for job in data.work:
+        heading = _join(job.position, job.company, sep=" — ")
+        dates = _dates(job.startDate, job.endDate)
+        work.append(title + _join(heading, job.location, dates))
+        if job.summary:
+            work.append(job.summary.strip())
+        work.extend(f"- {highlight}" for highlight in job.highlights)
+        work.append("")
+    if work:
+        yield "Experience", work[:-1]
+
+    education = [
+        entry
+        + _join(
+            _join(edu.studyType, edu.area),
+            edu.institution,
+            _dates(edu.startDate, edu.endDate),
+            edu.notes,
+            sep=" — ",
+        )
+        for edu in data.education
+    ]
+    if education:
+        yield "Education", education
+
+    projects = []
+    for project in data.projects:
+        projects.append(title + _join(project.name, project.description, sep=" — "))
+        projects.extend(f"- {highlight}" for highlight in project.highlights)
+        if project.keywords:
+            projects.append(f"{entry}Keywords: {', '.join(project.keywords)}")
+        projects.append("")
+    if projects:
+        yield "Projects", projects[:-1]
+
+    skills = [
+        entry + (f"{s.name}: {', '.join(s.keywords)}" if isinstance(s, Skill) else s)
+        for s in data.skills
+    ]
+    if skills:
+        yield "Skills", skills
+
+    languages = [
+        f"{lang.language} ({lang.fluency})" if isinstance(lang, Language) else lang
+        for lang in data.languages
+    ]
+    if languages:
+        yield "Languages", [", ".join(languages)]
+
+    if data.interests:
+        yield "Interests", [", ".join(data.interests)]
+
+    references = [f"{entry}{ref.name} — {ref.reference}" for ref in data.references]
+    if references:
+        yield "References", references
+
+
+def render_text(data: ResumeData) -> str:
+    """Render a plain-text resume for ATS upload portals.
+
+    Args:
+        data: Resume data
+
+    Returns:
+        Plain text with upper-case section headings and no markup
+    """
+    lines = [data.basics.name, *_header(data)]
+    for heading, body in _sections(data):
+        lines += ["", heading.upper(), *body]
+    return "\n".join(lines).replace("**", "") + "\n"
+
+
+def render_markdown(data: ResumeData) -> str:
+    """Render a Markdown resume.
+
+    Args:
+        data: Resume data
+
+    Returns:
+        Markdown with one ``##`` heading per section, a ``###`` heading per
+        position or project and a list item per one-line entry
+    """
+    lines = [f"# {data.basics.name}", ""]
+    lines += [f"{line}  " for line in _header(data)]
+    for heading, body in _sections(data, entry="- ", title="### "):
+        lines += ["", f"## {heading}", "", *body]
+    return "\n".join(lines).rstrip() + "\n"
@@ -0,0 +1,168 @@
+"""Pre-warmed fork-server worker pool for batch and service builds.
+
+The parent process imports the heavy dependencies (pdfplumber, Jinja2,
+Pydantic, rich), compiles the templates and loads the skill taxonomy once,
+freezes the heap for the garbage collector, and then forks the workers.
+They inherit that state copy-on-write instead of each paying for it, and
+are replaced after a number of jobs to cap memory growth. Metrics the
+workers record are returned with each result and merged into the parent's
+registry, so ``/metrics`` and the textfile cover pooled builds.
+
+On platforms without ``fork`` the workers are spawned and warm up
+themselves.
+"""
+
+import gc
+import multiprocessing
+from collections import deque
+from pathlib import Path
+from types import TracebackType
+from typing import Deque, Iterable, Iterator, Optional, Tuple, Type
+
+from jinja2 import TemplateNotFound
+
+from . import metrics
+from .core import ResumeBuilder
+from .extractors import CVExtractor
+from .models import BatchItem, BuildConfig, ResumeData
+from .preflight import require_preflight
+
+# Templates compiled before forking
+TEMPLATES = ("awesomecv.tex.j2", "simple.html.j2")
+
+WARM_UP_TEXT = "Jane Doe\njane@example.com\nDevOps Engineer\nPython, Kubernetes"
+
+Result = Tuple[BatchItem, metrics.Snapshot]
+
+# Builder inherited by (or created in) each worker process
+_builder: Optional[ResumeBuilder] = None
+
+
+def warm_up(template_dir: Path) -> ResumeBuilder:
+    """Load everything a build or extraction needs into this process.
+
+    Args:
+        template_dir: Template directory
+
+    Returns:
+        Builder with compiled templates
+    """
+    builder = ResumeBuilder(BuildConfig(template_dir=template_dir))
+    for name in TEMPLATES:
+        try:
+            builder.jinja_env.get_template(name)
+        except TemplateNotFound:
+            continue
+    # Loads the taxonomy and compiles the field extractors' regexes
+    CVExtractor.from_text(WARM_UP_TEXT).extract_all()
+    return builder
+
+
+def _init_worker(template_dir: Path, record_metrics: bool) -> None:
+    """Warm up a worker unless it inherited a warm parent."""
+    global _builder
+    # Inherited values are already counted by the parent
+    metrics.REGISTRY.drain()
+    metrics.REGISTRY.enabled = record_metrics
+    if _builder is None:
+        _builder = warm_up(template_dir)
+
+
+def _build(job: Tuple[int, ResumeData, BuildConfig]) -> Result:
+    """Build one resume in a worker; also returns the metrics it recorded."""
+    index, data, config = job
+    assert _builder is not None
+    _builder.config = config
+    (item,) = _builder.build_stream([(index, data)])
+    return item, metrics.REGISTRY.drain()
+
+
+def _collect(result: "multiprocessing.pool.AsyncResult[Result]") -> BatchItem:
+    """Wait for a worker result and merge its metrics."""
+    item, snapshot = result.get()
+    if snapshot:
+        metrics.REGISTRY.merge(snapshot)
+    return item
+
+
+class WarmPool:
+    """Process pool whose workers share a warmed-up parent."""
+
+    def __init__(
+        self,
+        template_dir: Path = Path("templates"),
+        processes: Optional[int] = None,
+        max_jobs_per_worker: Optional[int] = 100,
+    ) -> None:
+        """Warm up this process and start the workers.
+
+        Args:
+            template_dir: Template directory
+            processes: Number of workers. Uses the CPU count if None.
+            max_jobs_per_worker: Replace a worker after this many jobs,
+                None to keep workers for the lifetime of the pool
+        """
+        global _builder
+        methods = multiprocessing.get_all_start_methods()
+        method = "fork" if "fork" in methods else "spawn"
+        if method == "fork":
+            _builder = warm_up(template_dir)
+            # Keep the collector from touching (and copying) inherited objects
+            gc.freeze()
+
+        self.processes = processes or multiprocessing.cpu_count()
+        self._pool = multiprocessing.get_context(method).Pool(
+            self.processes,
+            initializer=_init_worker,
+            initargs=(template_dir, metrics.REGISTRY.enabled),
+            maxtasksperchild=max_jobs_per_worker,
+        )
+
+    def build_stream(
+        self, resumes: Iterable[Tuple[int, ResumeData]], config: BuildConfig
+    ) -> Iterator[BatchItem]:
+        """Build a stream of resumes on the workers.
+
+        Like ResumeBuilder.build_stream(), each resume goes to its own
+        sub-directory of ``config.output_dir`` and results come back in
+        stream order. At most two jobs per worker are in flight, so the
+        stream is never read ahead further than that.
+
+        Args:
+            resumes: ``(document index, resume)`` pairs, e.g. from iter_resumes()
+            config: Build configuration shared by all resumes
+
+        Yields:
+            BatchItem per resume
+
+        Raises:
+            PreflightError: If the preflight is enabled and fails
+        """
+        if config.preflight and "pdf" in config.formats:
+            require_preflight(config.template_dir)
+        pending: Deque[multiprocessing.pool.AsyncResult[Result]] = deque()
+        for index, data in resumes:
+            pending.append(self._pool.apply_async(_build, ((index, data, config),)))
+            if len(pending) >= 2 * self.processes:
+                yield _collect(pending.popleft())
+        while pending:
+            yield _collect(pending.popleft())
+
+    def close(self) -> None:
+        """Wait for the workers to finish and stop them."""
+        self._pool.close()
+        self._pool.join()
+        gc.unfreeze()
+
+    def __enter__(self) -> "WarmPool":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        if exc_type is not None:
+            self._pool.terminate()
+        self.close()
@@ -0,0 +1,182 @@
+"""Fast ATS precheck that predicts extraction results without a PDF.
+
+The LaTeX template is rendered as usual, then converted back to the plain
+text an ATS parser would see by undoing the escape and bold rules of the
+template filters. The CVExtractor field extractors run on that text, so a
+YAML edit can be checked in milliseconds instead of a XeLaTeX compile plus
+PDF parse. The PDF-based ``validate`` stays the reference check for CI.
+"""
+
+import re
+import time
+from typing import Dict, List
+
+from .core import LATEX_ESCAPES, ResumeBuilder
+from .extractors import CVExtractor
+from .models import ValidationReport
+from .validation import validate_cv
+
+# Header fields set in the preamble and printed by \makecvheader, in order
+_HEADER_FIELDS = ["position", "address", "mobile", "email", "github", "linkedin"]
+
+# Commands whose first N brace arguments are layout, not text
+_LAYOUT_ARGS = {
+    "begin": 1,
+    "end": 1,
+    "vspace": 1,
+    "hspace": 1,
+    "color": 1,
+    "raisebox": 1,
+    "includegraphics": 1,
+    "rule": 2,
+    "fontsize": 2,
+    "fcolorbox": 2,
+}
+
+# Placeholders for escaped braces while grouping braces are stripped
+_LBRACE = "\x00"
+_RBRACE = "\x01"
+
+
+def _skip_optional(tex: str, pos: int) -> int:
+    """Return the position after an optional ``[...]`` argument at ``pos``."""
+    if tex.startswith("[", pos):
+        close = tex.find("]", pos)
+        if close != -1:
+            return close + 1
+    return pos
+
+
+def _skip_group(tex: str, pos: int) -> int:
+    """Return the position after the brace group starting at ``pos``."""
+    while pos < len(tex) and tex[pos] in " \t":
+        pos += 1
+    if not tex.startswith("{", pos):
+        return pos
+    depth = 0
+    for index in range(pos, len(tex)):
+        if tex[index] == "{":
+            depth += 1
+        elif tex[index] == "}":
+            depth -= 1
+            if depth == 0:
+                return index + 1
+    return len(tex)
+
+
+def _strip_layout(tex: str) -> str:
+    """Remove layout commands together with their non-text arguments."""
+    pattern = re.compile(r"\\(" + "|".join(_LAYOUT_ARGS) + r")\b\*?")
+    out: List[str] = []
+    pos = 0
+    for match in pattern.finditer(tex):
+        if match.start() < pos:
+            continue
+        out.append(tex[pos : match.start()])
+        pos = match.end()
+        name = match.group(1)
+        arguments = _LAYOUT_ARGS[name]
+        if name == "begin" and tex.startswith("{minipage}", pos):
+            arguments += 1  # \begin{minipage}[t]{width}
+        for _ in range(arguments):
+            pos = _skip_group(tex, _skip_optional(tex, pos))
+        pos = _skip_optional(tex, pos)
+    out.append(tex[pos:])
+    return "".join(out)
+
+
+def _header_text(preamble: str) -> str:
+    """Rebuild the text printed by \\makecvheader from preamble commands."""
+    lines = []
+    name = re.search(r"\\name\{([^}]*)\}\{([^}]*)\}", preamble)
+    if name:
+        lines.append(f"{name.group(1)} {name.group(2)}".strip())
+
+    values: Dict[str, str] = {}
+    for field in _HEADER_FIELDS:
+        found = re.search(r"\\" + field + r"\{([^}]*)\}", preamble)
+        if found and found.group(1).strip():
+            values[field] = found.group(1).strip()
+
+    for field in ("position", "address"):
+        if field in values:
+            lines.append(values.pop(field))
+    if values:
+        lines.append(" | ".join(values.values()))
+    return "\n".join(lines)
+
+
+def latex_to_text(tex: str) -> str:
+    """Convert a rendered LaTeX resume to the plain text an ATS would see.
+
+    Args:
+        tex: Rendered LaTeX document
+
+    Returns:
+        Plain text approximation of the PDF text layer
+    """
+    # Drop comments, keeping escaped percent signs
+    tex = "\n".join(re.sub(r"(?<!\\)%.*", "", line) for line in tex.splitlines())
+
+    preamble, _, body = tex.partition("\\begin{document}")
+    body = body.split("\\end{document}")[0]
+    header = "\n" + _header_text(preamble) + "\n"
+    body = re.sub(r"\\makecvheader(\[[^\]]*\])?", lambda _: header, body, count=1)
+
+    # Undo the filter escapes (\textasciitilde may have had its braces escaped)
+    for char, escaped in LATEX_ESCAPES:
+        if escaped.endswith("{}"):
+            body = body.replace(escaped[:-2] + "\\{\\}", char)
+        body = body.replace(escaped, char)
+    body = body.replace("\\{", _LBRACE).replace("\\}", _RBRACE)
+
+    # \href{url}{text} shows its text; \textbf and friends show their argument
+    body = re.sub(r"\\href\{[^}]*\}", "", body)
+    body = _strip_layout(body)
+    body = body.replace("\\\\", "\n").replace("\\item", "\n")
+    body = re.sub(r"\\(enspace|quad|qquad)\b", " ", body)
+    body = re.sub(r"\\[a-zA-Z@]+\*?", "", body)
+    body = body.replace("{", "").replace("}", "")
+    body = body.replace("---", "—").replace("--", "–").replace("~", " ")
+    body = body.replace(_LBRACE, "{").replace(_RBRACE, "}")
+
+    lines = (re.sub(r"[ \t]+", " ", line).strip() for line in body.splitlines())
+    return "\n".join(line for line in lines if line)
+
+
+def render_ats_text(
+    builder: ResumeBuilder, template_name: str = "awesomecv.tex.j2"
+) -> str:
+    """Render the LaTeX template and derive its ATS-visible text.
+
+    Args:
+        builder: ResumeBuilder with loaded resume data
+        template_name: LaTeX template to render
+
+    Returns:
+        Predicted PDF text
+    """
+    return latex_to_text(builder.render_template(template_name))
+
+
+def precheck(
+    builder: ResumeBuilder, template_name: str = "awesomecv.tex.j2"
+) -> ValidationReport:
+    """Predict the ATS validation outcome from the model alone.
+
+    Args:
+        builder: ResumeBuilder with loaded resume data
+        template_name: LaTeX template to render
+
+    Returns:
+        ValidationReport with render and field extractor timings
+    """
+    start = time.perf_counter()
+    text = render_ats_text(builder, template_name)
+    rendered = time.perf_counter() - start
+
+    extractor = CVExtractor.from_text(text)
+    report = validate_cv(builder.data, extractor.extract_all())
+    report.source = template_name
+    report.timings = {"render": rendered, **extractor.timings}
+    return report
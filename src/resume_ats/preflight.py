@@ -0,0 +1,206 @@
+"""Preflight check of the packages and fonts the LaTeX template needs.
+
+Without it, a missing package or font only shows up after a full XeLaTeX
+run, and in a batch every job then fails the same slow way. The preflight
+reads the ``\\RequirePackage``/``\\usepackage`` and fontspec declarations
+of ``awesome-cv.cls`` and ``awesomecv.tex.j2``, resolves packages and
+font files with a single ``kpsewhich`` call and font families with
+``fc-list``, and fails before the first compile if anything is missing.
+
+Resolved requirements are cached per TeX installation, keyed by the
+engine binary and the ``ls-R`` file databases that ``mktexlsr``/``tlmgr``
+rewrite on every install. Missing requirements are not cached, so
+installing them takes effect on the next run.
+"""
+
+import hashlib
+import json
+import os
+import re
+import shutil
+import subprocess
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Set
+
+from . import metrics
+from .cache import atomic_write_bytes, cache_dir
+from .exceptions import PreflightError
+from .models import PreflightReport, Requirement, RequirementKind
+
+# Bump when the cache format or the resolution changes
+CACHE_VERSION = "1"
+
+TEMPLATE_FILES = ("awesome-cv.cls", "awesomecv.tex.j2")
+
+COMMENT = re.compile(r"(?<!\\)%.*")
+PACKAGE = re.compile(r"\\(?:RequirePackage|usepackage)\s*(?:\[[^\]]*\])?\s*\{([^}]*)\}")
+FONT = re.compile(
+    r"\\(?:setmainfont|setsansfont|setmonofont|setmathfont|fontspec"
+    r"|newfontfamily\s*\\\w+)\s*(?:\[[^\]]*\])?\s*\{([^}]*)\}"
+)
+
+# OpenType files loaded by font packages under XeLaTeX
+FONT_PACKAGES: Dict[str, Sequence[str]] = {
+    "roboto": ("Roboto-Regular.otf", "Roboto-Bold.otf"),
+    "sourcesanspro": (
+        "SourceSansPro-Regular.otf",
+        "SourceSansPro-Bold.otf",
+        "SourceSansPro-Light.otf",
+    ),
+    "fontawesome5": (
+        "FontAwesome5Free-Solid-900.otf",
+        "FontAwesome5Brands-Regular-400.otf",
+    ),
+    "unicode-math": ("latinmodern-math.otf",),
+}
+
+# Template directories that passed in this process
+_verified: Set[Path] = set()
+
+
+def _run(args: Sequence[str]) -> str:
+    """Standard output of a command; missing files do not fail kpsewhich."""
+    result = subprocess.run(args, capture_output=True, text=True, timeout=60)
+    return result.stdout
+
+
+def requirements(template_dir: Path) -> List[Requirement]:
+    """Packages and fonts declared by the template files.
+
+    Args:
+        template_dir: Template directory
+
+    Returns:
+        Unresolved requirements, in declaration order
+    """
+    found: Dict[str, Requirement] = {}
+
+    def add(kind: RequirementKind, name: str) -> None:
+        name = name.strip()
+        # Skip empty names and Jinja expressions
+        if name and "{" not in name and name not in found:
+            found[name] = Requirement(kind=kind, name=name)
+
+    for file_name in TEMPLATE_FILES:
+        path = template_dir / file_name
+        if not path.exists():
+            continue
+        text = COMMENT.sub("", path.read_text(encoding="utf-8"))
+        for match in PACKAGE.finditer(text):
+            for package in match.group(1).split(","):
+                add("package", f"{package.strip()}.sty")
+                for font_file in FONT_PACKAGES.get(package.strip(), ()):
+                    add("font", font_file)
+        for match in FONT.finditer(text):
+            add("font", match.group(1))
+    return list(found.values())
+
+
+def installation_key() -> str:
+    """Identify the TeX installation for the cache.
+
+    Returns:
+        Hex digest of the engine binary and the file databases
+
+    Raises:
+        PreflightError: If xelatex or kpsewhich is not on the PATH
+    """
+    xelatex = shutil.which("xelatex")
+    kpsewhich = shutil.which("kpsewhich")
+    if not xelatex or not kpsewhich:
+        raise PreflightError(
+            "TeX installation not found (xelatex and kpsewhich must be on the PATH)"
+        )
+
+    engine = Path(xelatex).resolve()
+    parts = [CACHE_VERSION, str(engine), str(engine.stat().st_mtime_ns)]
+    databases = _run([kpsewhich, "-expand-braces=$TEXMFDBS"]).strip()
+    for directory in databases.split(os.pathsep):
+        ls_r = Path(directory.lstrip("!")) / "ls-R"
+        if directory and ls_r.exists():
+            parts.append(f"{ls_r}:{ls_r.stat().st_mtime_ns}")
+    return hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()[:16]
+
+
+def _resolve_files(names: List[str]) -> Dict[str, str]:
+    """Look files up in the TeX tree with one kpsewhich call."""
+    if not names:
+        return {}
+    paths = _run(["kpsewhich", *names]).splitlines()
+    return {Path(p).name: p for p in paths if p}
+
+
+def _resolve_families(names: List[str]) -> Dict[str, str]:
+    """Look font families up with fontconfig."""
+    if not names or not shutil.which("fc-list"):
+        return {}
+    files: Dict[str, str] = {}
+    for line in _run(["fc-list", "-f", "%{family}\t%{file}\n"]).splitlines():
+        families, _, file = line.partition("\t")
+        for family in families.split(","):
+            files.setdefault(family.strip().lower(), file)
+    return {name: files[name.lower()] for name in names if name.lower() in files}
+
+
+def preflight(template_dir: Path, cache: Optional[Path] = None) -> PreflightReport:
+    """Resolve every package and font the template needs.
+
+    Args:
+        template_dir: Template directory
+        cache: Cache directory. Uses the user cache if None.
+
+    Returns:
+        PreflightReport; ``missing`` lists what could not be found
+
+    Raises:
+        PreflightError: If no TeX installation is found
+    """
+    key = installation_key()
+    cache_file = (cache or cache_dir("preflight")) / f"{key}.json"
+    try:
+        known: Dict[str, str] = json.loads(cache_file.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        known = {}
+
+    needed = requirements(template_dir)
+    todo = [r for r in needed if r.name not in known]
+    metrics.cache_lookup("preflight", not todo)
+    if todo:
+        # File names go to kpsewhich, bare font names to fontconfig
+        families = [r.name for r in todo if r.kind == "font" and "." not in r.name]
+        files = [r.name for r in todo if r.name not in families]
+        resolved = {**_resolve_files(files), **_resolve_families(families)}
+        if resolved:
+            known.update(resolved)
+            data = json.dumps(known, indent=2, sort_keys=True)
+            atomic_write_bytes(cache_file, data.encode("utf-8"))
+
+    for requirement in needed:
+        requirement.path = known.get(requirement.name)
+    return PreflightReport(
+        installation=key,
+        requirements=needed,
+        cached=len(needed) - len(todo),
+    )
+
+
+def require_preflight(template_dir: Path) -> None:
+    """Fail fast unless the template's requirements are installed.
+
+    A successful check is remembered for the rest of the process, so
+    calling this before every build of a batch is free.
+
+    Args:
+        template_dir: Template directory
+
+    Raises:
+        PreflightError: If the TeX installation or a requirement is missing
+    """
+    directory = template_dir.resolve()
+    if directory in _verified:
+        return
+    missing = preflight(template_dir).missing
+    if missing:
+        names = ", ".join(f"{r.name} ({r.kind})" for r in missing)
+        raise PreflightError(f"Missing LaTeX requirements: {names}")
+    _verified.add(directory)
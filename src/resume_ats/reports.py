@@ -0,0 +1,169 @@
+"""Machine-readable validation reports (JSON, JSON Lines, JUnit XML)."""
+
+import sys
+import xml.etree.ElementTree as ET
+from pathlib import Path
+from types import TracebackType
+from typing import IO, List, Optional, Type
+
+from .models import ValidationReport
+
+REPORT_FORMATS = ("json", "jsonl", "junit")
+
+
+class ReportWriter:
+    """Write validation reports to a file or stdout.
+
+    ``jsonl`` is streamed: the file is opened in append mode and each report
+    is written and flushed as soon as it is available, so batch runs (and
+    repeated invocations) accumulate into one report file. ``json`` and
+    ``junit`` are whole documents and are written when the writer closes.
+    """
+
+    def __init__(self, report_format: str, path: Optional[Path] = None) -> None:
+        """Initialize writer.
+
+        Args:
+            report_format: One of REPORT_FORMATS
+            path: Output file. Writes to stdout if None or "-".
+
+        Raises:
+            ValueError: If the format is unknown
+        """
+        if report_format not in REPORT_FORMATS:
+            raise ValueError(
+                f"Unknown report format: {report_format} "
+                f"(expected one of {', '.join(REPORT_FORMATS)})"
+            )
+        self.report_format = report_format
+        self.path = None if path is None or str(path) == "-" else Path(path)
+        self._reports: List[ValidationReport] = []
+        self._stream: Optional[IO[str]] = None
+
+    def _open(self) -> IO[str]:
+        if self._stream is None:
+            if self.path is None:
+                self._stream = sys.stdout
+            else:
+                mode = "a" if self.report_format == "jsonl" else "w"
+                self._stream = self.path.open(mode, encoding="utf-8")
+        return self._stream
+
+    def write(self, report: ValidationReport) -> None:
+        """Add a report to the output.
+
+        Args:
+            report: Validation report
+        """
+        if self.report_format == "jsonl":
+            stream = self._open()
+            stream.write(report.model_dump_json() + "\n")
+            stream.flush()
+        else:
+            self._reports.append(report)
+
+    def close(self) -> None:
+        """Write buffered documents and close the output file."""
+        if self.report_format == "json":
+            self._open().write(
+                "[" + ",\n".join(r.model_dump_json() for r in self._reports) + "]\n"
+            )
+        elif self.report_format == "junit":
+            tree = ET.ElementTree(junit_xml(self._reports))
+            ET.indent(tree)
+            stream = self._open()
+            tree.write(stream, encoding="unicode", xml_declaration=True)
+            stream.write("\n")
+
+        if self._stream is not None and self._stream is not sys.stdout:
+            self._stream.close()
+        self._stream = None
+
+    def __enter__(self) -> "ReportWriter":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+
+def junit_xml(reports: List[ValidationReport]) -> ET.Element:
+    """Convert validation reports to a JUnit XML tree.
+
+    Each resume becomes a ``testsuite`` and each validated field a
+    ``testcase``; timings are attached as suite properties. A document that
+    could not be validated is a suite with a single ``<error>`` testcase.
+
+    Args:
+        reports: Validation reports
+
+    Returns:
+        ``testsuites`` root element
+    """
+    root = ET.Element("testsuites", name="resume-ats")
+    total_tests = total_failures = total_errors = 0
+    total_time = 0.0
+
+    for report in reports:
+        failures = sum(1 for field in report.fields if not field.passed)
+        errors = 0 if report.error is None else 1
+        elapsed = sum(report.timings.values())
+        suite = ET.SubElement(
+            root,
+            "testsuite",
+            name=report.source or "resume",
+            tests=str(len(report.fields) + errors),
+            failures=str(failures),
+            errors=str(errors),
+            time=f"{elapsed:.6f}",
+        )
+
+        properties = ET.SubElement(suite, "properties")
+        for stage, seconds in report.timings.items():
+            ET.SubElement(
+                properties, "property", name=f"time.{stage}", value=f"{seconds:.6f}"
+            )
+        ET.SubElement(
+            properties, "property", name="coverage", value=f"{report.coverage:.4f}"
+        )
+
+        classname = f"ats.{Path(report.source).stem or 'resume'}"
+        if report.error is not None:
+            case = ET.SubElement(
+                suite, "testcase", classname=classname, name="Document", time="0"
+            )
+            error = ET.SubElement(case, "error", message=report.error)
+            error.text = report.error
+
+        for field in report.fields:
+            case = ET.SubElement(
+                suite,
+                "testcase",
+                classname=classname,
+                name=field.name,
+                time=f"{report.timings.get(field.name.lower(), 0.0):.6f}",
+            )
+            if not field.passed:
+                failure = ET.SubElement(
+                    case,
+                    "failure",
+                    message=f"expected {field.expected!r}, found {field.found!r}",
+                )
+                failure.text = (
+                    f"{field.name}: expected {field.expected!r}, found {field.found!r}"
+                )
+
+        total_tests += len(report.fields) + errors
+        total_failures += failures
+        total_errors += errors
+        total_time += elapsed
+
+    root.set("tests", str(total_tests))
+    root.set("failures", str(total_failures))
+    root.set("errors", str(total_errors))
+    root.set("time", f"{total_time:.6f}")
+    return root
@@ -0,0 +1,270 @@
+"""Searchable local index of extracted resumes.
+
+Extracted fields and text are stored in a SQLite database with an FTS5
+full-text index, so a corpus of thousands of PDFs only has to be extracted
+once and can then be queried with the FTS5 syntax
+(``kubernetes AND terraform NOT java``, ``"machine learning"``, ``terra*``).
+
+Documents are keyed by content hash: re-indexing skips files whose size and
+mtime did not change, re-hashes the others and only runs the extractor on
+content that is not in the database yet.
+"""
+
+import sqlite3
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from .cache import cache_dir, file_digest
+from .exceptions import ResumeATSError, SearchError
+from .extractors import CVExtractor
+from .models import IndexStats, SearchHit
+
+SCHEMA_VERSION = 1
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    id INTEGER PRIMARY KEY,
+    digest TEXT NOT NULL UNIQUE,
+    name TEXT NOT NULL DEFAULT '',
+    email TEXT NOT NULL DEFAULT '',
+    position TEXT NOT NULL DEFAULT '',
+    skills TEXT NOT NULL DEFAULT '',
+    companies TEXT NOT NULL DEFAULT '',
+    text TEXT NOT NULL DEFAULT ''
+);
+
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    digest TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS files_digest ON files (digest);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS resumes USING fts5 (
+    name, email, position, skills, companies, text,
+    content='documents', content_rowid='id',
+    tokenize="unicode61 remove_diacritics 2 tokenchars '+#'",
+    prefix='2 3'
+);
+
+CREATE TRIGGER IF NOT EXISTS documents_ai AFTER INSERT ON documents BEGIN
+    INSERT INTO resumes (rowid, name, email, position, skills, companies, text)
+    VALUES (new.id, new.name, new.email, new.position, new.skills,
+            new.companies, new.text);
+END;
+
+CREATE TRIGGER IF NOT EXISTS documents_ad AFTER DELETE ON documents BEGIN
+    INSERT INTO resumes (resumes, rowid, name, email, position, skills,
+                         companies, text)
+    VALUES ('delete', old.id, old.name, old.email, old.position, old.skills,
+            old.companies, old.text);
+END;
+"""
+
+# Files processed per transaction while indexing
+COMMIT_EVERY = 100
+
+
+def default_database() -> Path:
+    """Return the default index database path inside the user cache."""
+    return cache_dir("index") / "resumes.db"
+
+
+def iter_pdfs(paths: Iterable[Path]) -> Iterator[Path]:
+    """Expand files and directories into the PDF files they contain.
+
+    Args:
+        paths: PDF files or directories searched recursively
+
+    Yields:
+        Resolved PDF paths, directories in sorted order
+    """
+    for path in paths:
+        if path.is_dir():
+            for pdf in sorted(path.rglob("*.pdf")):
+                if pdf.is_file():
+                    yield pdf.resolve()
+        else:
+            yield path.resolve()
+
+
+class ResumeIndex:
+    """SQLite FTS5 index of extracted resumes."""
+
+    def __init__(self, database: Optional[Path] = None) -> None:
+        """Open (and create if needed) an index database.
+
+        Args:
+            database: Database file. Uses the user cache if None.
+
+        Raises:
+            SearchError: If the database cannot be opened or FTS5 is missing
+        """
+        self.database = Path(database) if database else default_database()
+        try:
+            self.db = sqlite3.connect(self.database)
+            self.db.execute("PRAGMA journal_mode = WAL")
+            self.db.execute("PRAGMA synchronous = NORMAL")
+            version = self.db.execute("PRAGMA user_version").fetchone()[0]
+            if version not in (0, SCHEMA_VERSION):
+                raise SearchError(
+                    f"Index {self.database} has schema version {version}, "
+                    f"expected {SCHEMA_VERSION}; delete it and re-index"
+                )
+            self.db.executescript(SCHEMA)
+            self.db.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        except sqlite3.Error as e:
+            raise SearchError(f"Cannot open index {self.database}: {e}") from e
+
+    def __len__(self) -> int:
+        """Return the number of distinct indexed documents."""
+        return int(self.db.execute("SELECT count(*) FROM documents").fetchone()[0])
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self.db.close()
+
+    def __enter__(self) -> "ResumeIndex":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def add(self, paths: Iterable[Path], prune: bool = False) -> IndexStats:
+        """Index PDF files, skipping content that is already indexed.
+
+        Args:
+            paths: PDF files or directories searched recursively
+            prune: Also drop indexed files that no longer exist
+
+        Returns:
+            Counts of indexed, reused, unchanged, removed and failed files
+        """
+        stats = IndexStats()
+        with self.db:
+            for count, path in enumerate(iter_pdfs(paths), 1):
+                try:
+                    self._add_file(path, stats)
+                except (OSError, ResumeATSError) as e:
+                    stats.failed[str(path)] = str(e)
+                if count % COMMIT_EVERY == 0:
+                    self.db.commit()
+            if prune:
+                stats.removed = self.prune()
+        return stats
+
+    def _add_file(self, path: Path, stats: IndexStats) -> None:
+        """Index one file and update the run statistics."""
+        stat = path.stat()
+        key = str(path)
+        row = self.db.execute(
+            "SELECT digest, size, mtime_ns FROM files WHERE path = ?", (key,)
+        ).fetchone()
+        if row and row[1:] == (stat.st_size, stat.st_mtime_ns):
+            stats.unchanged += 1
+            return
+
+        digest = file_digest(path)
+        known = self.db.execute(
+            "SELECT 1 FROM documents WHERE digest = ?", (digest,)
+        ).fetchone()
+        if row and row[0] == digest:
+            stats.unchanged += 1
+        elif known:
+            stats.reused += 1
+        else:
+            extractor = CVExtractor(path)
+            data = extractor.extract_all()
+            self.db.execute(
+                "INSERT INTO documents "
+                "(digest, name, email, position, skills, companies, text) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    digest,
+                    data.name,
+                    data.email,
+                    data.position,
+                    ", ".join(data.skills),
+                    ", ".join(data.companies),
+                    extractor.text,
+                ),
+            )
+            stats.indexed += 1
+
+        self.db.execute(
+            "INSERT OR REPLACE INTO files (path, digest, size, mtime_ns) "
+            "VALUES (?, ?, ?, ?)",
+            (key, digest, stat.st_size, stat.st_mtime_ns),
+        )
+        if row and row[0] != digest:
+            self._drop_orphan(row[0])
+
+    def _drop_orphan(self, digest: str) -> None:
+        """Delete a document if no indexed file references it anymore."""
+        self.db.execute(
+            "DELETE FROM documents WHERE digest = ? "
+            "AND NOT EXISTS (SELECT 1 FROM files WHERE files.digest = ?)",
+            (digest, digest),
+        )
+
+    def prune(self) -> int:
+        """Drop indexed files that no longer exist.
+
+        Returns:
+            Number of files removed
+        """
+        missing = [
+            (path, digest)
+            for path, digest in self.db.execute("SELECT path, digest FROM files")
+            if not Path(path).is_file()
+        ]
+        with self.db:
+            for path, digest in missing:
+                self.db.execute("DELETE FROM files WHERE path = ?", (path,))
+                self._drop_orphan(digest)
+        return len(missing)
+
+    def search(
+        self,
+        query: str,
+        limit: int = 20,
+        highlight: Tuple[str, str] = ("[", "]"),
+    ) -> List[SearchHit]:
+        """Run an FTS5 query against the index.
+
+        Args:
+            query: FTS5 query, e.g. ``kubernetes AND terraform NOT java``
+            limit: Maximum number of hits
+            highlight: Markers placed around matched terms in snippets
+
+        Returns:
+            Best hits first
+
+        Raises:
+            SearchError: If the query is not valid FTS5 syntax
+        """
+        try:
+            rows = self.db.execute(
+                "SELECT (SELECT min(path) FROM files WHERE files.digest = d.digest),"
+                " d.name, d.email, d.position, bm25(resumes),"
+                " snippet(resumes, -1, ?, ?, '…', 12)"
+                " FROM resumes JOIN documents d ON d.id = resumes.rowid"
+                " WHERE resumes MATCH ? ORDER BY bm25(resumes) LIMIT ?",
+                (*highlight, query, limit),
+            ).fetchall()
+        except sqlite3.OperationalError as e:
+            raise SearchError(f"Invalid search query {query!r}: {e}") from e
+
+        return [
+            SearchHit(
+                path=path or "",
+                name=name,
+                email=email,
+                position=position,
+                score=score,
+                snippet=" ".join(snippet.split()),
+            )
+            for path, name, email, position, score, snippet in rows
+        ]
@@ -0,0 +1,226 @@
+"""Static HTML site generation for many resumes.
+
+Every resume of a stream is rendered from ``simple.html.j2`` into
+``<slug>/index.html`` of one site tree. The stylesheet and logos are
+published once under ``assets/`` with content-hashed file names, so a
+static server can cache them forever; pages are minified and get
+precompressed ``.gz`` (and ``.br`` with the ``site`` extra) siblings. A
+``manifest.json`` lists the ETag, size, type and available encodings of
+every file for the server.
+"""
+
+import gzip
+import hashlib
+import json
+import mimetypes
+import re
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Optional, Tuple
+
+from rich.console import Console
+
+from .cache import atomic_write_bytes
+from .core import ResumeBuilder, resume_slug
+from .models import BuildConfig, ResumeData, SiteFile
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+# Content types worth precompressing
+COMPRESSIBLE = {"text/html", "text/css", "application/json", "image/svg+xml"}
+
+# Whitespace around these tags never renders
+BLOCK_TAGS = (
+    "html|head|body|meta|title|link|style|header|footer|main|section|article|"
+    "nav|div|p|ul|ol|li|table|tr|td|th|h[1-6]|!DOCTYPE"
+)
+
+HTML_COMMENT = re.compile(r"<!--(?!\[).*?-->", re.DOTALL)
+HTML_BLOCK_SPACE = re.compile(rf"\s*(</?(?:{BLOCK_TAGS})\b[^>]*>)\s*", re.IGNORECASE)
+CSS_COMMENT = re.compile(r"/\*.*?\*/", re.DOTALL)
+CSS_PUNCTUATION_SPACE = re.compile(r"\s*([{};,>])\s*")
+
+
+def minify_html(html: str) -> str:
+    """Remove comments and insignificant whitespace from HTML.
+
+    Args:
+        html: HTML document without ``<pre>`` blocks
+
+    Returns:
+        Minified HTML
+    """
+    html = HTML_COMMENT.sub("", html)
+    html = re.sub(r"\s+", " ", html)
+    return HTML_BLOCK_SPACE.sub(r"\1", html).strip()
+
+
+def minify_css(css: str) -> str:
+    """Remove comments and insignificant whitespace from CSS.
+
+    Args:
+        css: Stylesheet
+
+    Returns:
+        Minified stylesheet
+    """
+    css = CSS_COMMENT.sub("", css)
+    css = CSS_PUNCTUATION_SPACE.sub(r"\1", re.sub(r"\s+", " ", css))
+    return css.replace(";}", "}").strip()
+
+
+def hashed_name(name: str, content: bytes, length: int = 12) -> str:
+    """Insert a content hash into a file name (``a.css`` -> ``a.<hash>.css``).
+
+    Args:
+        name: Original file name
+        content: File content
+        length: Number of hex digits of the hash
+
+    Returns:
+        Content-addressed file name
+    """
+    path = Path(name)
+    digest = hashlib.sha256(content).hexdigest()[:length]
+    return f"{path.stem}.{digest}{path.suffix}"
+
+
+class SiteBuilder:
+    """Render many resumes into one static site with shared assets."""
+
+    def __init__(
+        self,
+        output_dir: Path,
+        template_dir: Path = Path("templates"),
+        logos_dir: Path = Path("logos"),
+        template: str = "simple.html.j2",
+        stylesheet: str = "simple.css",
+        compress: bool = True,
+    ) -> None:
+        """Initialize site builder.
+
+        Args:
+            output_dir: Root of the site tree
+            template_dir: Template directory
+            logos_dir: Directory of the logos referenced by resumes
+            template: Page template
+            stylesheet: Stylesheet template shared by all pages
+            compress: Write precompressed siblings of text files
+        """
+        self.output_dir = output_dir
+        self.logos_dir = logos_dir
+        self.template = template
+        self.stylesheet = stylesheet
+        self.compress = compress
+        self.console = Console()
+        self.builder = ResumeBuilder(
+            BuildConfig(template_dir=template_dir, output_dir=output_dir)
+        )
+        self.manifest: Dict[str, SiteFile] = {}
+        self._assets: Dict[str, str] = {}
+
+    def _write(self, relative: str, content: bytes) -> None:
+        """Write a site file, its compressed siblings and its manifest entry."""
+        path = self.output_dir / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        atomic_write_bytes(path, content)
+
+        content_type = mimetypes.guess_type(path.name)[0] or "application/octet-stream"
+        encodings = []
+        if self.compress and content_type in COMPRESSIBLE:
+            variants = [("gzip", ".gz", lambda b: gzip.compress(b, 9, mtime=0))]
+            if brotli is not None:
+                variants.insert(0, ("br", ".br", brotli.compress))
+            for encoding, suffix, compress in variants:
+                packed = compress(content)
+                if len(packed) < len(content):
+                    atomic_write_bytes(path.with_name(path.name + suffix), packed)
+                    encodings.append(encoding)
+
+        self.manifest[relative] = SiteFile(
+            etag=f'"{hashlib.sha256(content).hexdigest()[:16]}"',
+            size=len(content),
+            content_type=content_type,
+            encodings=encodings,
+        )
+
+    def publish_asset(self, name: str, content: bytes) -> str:
+        """Publish a shared asset once under a content-hashed name.
+
+        Args:
+            name: Original asset name, e.g. ``logos/ads.png``
+            content: Asset content
+
+        Returns:
+            Site-relative path of the published asset
+        """
+        relative = f"assets/{hashed_name(Path(name).name, content)}"
+        if relative not in self.manifest:
+            self._write(relative, content)
+        return relative
+
+    def asset(self, name: str) -> str:
+        """Resolve an asset referenced by a template, publishing it on first use.
+
+        Args:
+            name: Asset path used by the template, e.g. ``logos/ads.png``
+
+        Returns:
+            URL relative to a page directory; the name itself if it is missing
+        """
+        if name not in self._assets:
+            source = self.logos_dir / name.split("/", 1)[-1]
+            if name.startswith("logos/") and source.is_file():
+                self._assets[name] = "../" + self.publish_asset(
+                    name, source.read_bytes()
+                )
+            else:
+                self.console.print(f"⚠️  Asset not found: {name}")
+                self._assets[name] = name
+        return self._assets[name]
+
+    def _publish_stylesheet(self) -> str:
+        """Render, minify and publish the shared stylesheet."""
+        if self.stylesheet not in self._assets:
+            css = self.builder.jinja_env.get_template(self.stylesheet).render()
+            relative = self.publish_asset(
+                self.stylesheet, minify_css(css).encode("utf-8")
+            )
+            self._assets[self.stylesheet] = "../" + relative
+        return self._assets[self.stylesheet]
+
+    def build(
+        self,
+        resumes: Iterable[Tuple[int, ResumeData]],
+        on_page: Optional[Callable[[int, str], None]] = None,
+    ) -> Dict[str, SiteFile]:
+        """Render every resume and write the site manifest.
+
+        Args:
+            resumes: ``(document index, resume)`` pairs, e.g. from iter_resumes()
+            on_page: Called with the document index and page path of each page
+
+        Returns:
+            Manifest mapping site-relative paths to their entries
+        """
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        stylesheet = self._publish_stylesheet()
+
+        for index, data in resumes:
+            self.builder.data = data
+            html = self.builder.render_template(
+                self.template, stylesheet=stylesheet, asset=self.asset
+            )
+            relative = f"{resume_slug(index, data)}/index.html"
+            self._write(relative, minify_html(html).encode("utf-8"))
+            if on_page:
+                on_page(index, relative)
+
+        manifest = {path: entry.model_dump() for path, entry in self.manifest.items()}
+        atomic_write_bytes(
+            self.output_dir / "manifest.json",
+            json.dumps(manifest, indent=1, sort_keys=True).encode("utf-8"),
+        )
+        return self.manifest
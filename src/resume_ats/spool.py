@@ -0,0 +1,363 @@
+"""File-based build queue shared by workers on several hosts.
+
+A spool is a directory on a shared filesystem; no broker is involved::
+
+    pending/<id>.json   submitted jobs, claimed in name (submission) order
+    running/<id>.<token>.json   claimed jobs; the file mtime is the lease
+                        heartbeat and the token is unique to the claim
+    running/<id>.<token>/   private build directory of the claim
+    done/<id>.json, done/<id>/status.json, done/<id>/<outputs>
+    failed/<id>.json, failed/<id>/status.json
+
+Every state change is a single ``os.rename``, so exactly one worker wins a
+claim. A worker refreshes the mtime of its claimed job while building;
+jobs whose lease expired (crashed or partitioned worker) are renamed back
+to ``pending/`` by any other worker. Heartbeats and publishing act on the
+exact file of the claim, so a stalled worker whose job was reclaimed and
+claimed again neither renews nor overwrites the new claim; it discards its
+results instead.
+"""
+
+import os
+import shutil
+import socket
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Callable, Iterator, List, Optional, Tuple
+
+from pydantic import ValidationError as PydanticValidationError
+from rich.console import Console
+
+from . import metrics
+from .core import ResumeBuilder
+from .exceptions import ResumeATSError, SpoolError
+from .models import BuildConfig, JobState, JobStatus, ResumeData, SpoolJob
+
+STATES: Tuple[JobState, ...] = ("pending", "running", "done", "failed")
+
+
+def default_worker_id() -> str:
+    """Worker name unique across hosts sharing a spool."""
+    return f"{socket.gethostname()}-{os.getpid()}"
+
+
+class Spool:
+    """Job queue in a shared directory."""
+
+    def __init__(self, root: Path, lease: float = 300.0) -> None:
+        """Open (and create) a spool directory.
+
+        Args:
+            root: Spool directory shared by submitters and workers
+            lease: Seconds without heartbeat after which a claimed job is
+                handed to another worker
+        """
+        self.root = root
+        self.lease = lease
+        for state in STATES:
+            (root / state).mkdir(parents=True, exist_ok=True)
+
+    def _job_path(self, state: str, job_id: str) -> Path:
+        return self.root / state / f"{job_id}.json"
+
+    def _lease_path(self, job: SpoolJob) -> Path:
+        return self.root / "running" / f"{job.id}.{job.token}.json"
+
+    def work_dir(self, job: SpoolJob) -> Path:
+        """Private build directory of a claimed job."""
+        return self.root / "running" / f"{job.id}.{job.token}"
+
+    def submit(
+        self,
+        data: ResumeData,
+        formats: Optional[List[str]] = None,
+        validate_output: bool = False,
+    ) -> str:
+        """Enqueue a resume build.
+
+        The job is written under a temporary name and renamed into
+        ``pending/``, so workers never claim a partial file.
+
+        Args:
+            data: Resume to build
+            formats: Output formats
+            validate_output: Validate generated PDFs in the worker
+
+        Returns:
+            Job id
+        """
+        now = time.time()
+        job = SpoolJob(
+            id=f"{time.time_ns():020d}-{uuid.uuid4().hex[:8]}",
+            resume=data,
+            formats=formats or ["pdf"],
+            validate_output=validate_output,
+            submitted=now,
+        )
+        temp = self.root / "pending" / f".{job.id}.tmp"
+        temp.write_text(job.model_dump_json(), encoding="utf-8")
+        os.rename(temp, self._job_path("pending", job.id))
+        return job.id
+
+    def claim(self) -> Optional[SpoolJob]:
+        """Take the oldest pending job.
+
+        Returns:
+            Claimed job with its claim ``token``, or None if nothing is pending
+        """
+        pending = sorted((self.root / "pending").glob("[!.]*.json"))
+        metrics.QUEUE_DEPTH.set(len(pending), "spool")
+        for path in pending:
+            token = uuid.uuid4().hex[:12]
+            running = self.root / "running" / f"{path.stem}.{token}.json"
+            try:
+                # Start the lease before the job shows up in running/, or
+                # its submission time would make it look expired
+                os.utime(path)
+                os.rename(path, running)
+            except FileNotFoundError:
+                continue  # Another worker won
+            try:
+                job = SpoolJob.model_validate_json(running.read_bytes())
+            except PydanticValidationError as e:
+                self._finish_invalid(running, e)
+                continue
+            job.token = token
+            return job
+        return None
+
+    def _finish_invalid(self, running: Path, error: Exception) -> None:
+        """Move an unreadable job to failed/ with its error."""
+        job_id = running.name.partition(".")[0]
+        status = JobStatus(id=job_id, state="failed", error=f"Invalid job: {error}")
+        result_dir = self.root / "failed" / job_id
+        result_dir.mkdir(exist_ok=True)
+        (result_dir / "status.json").write_text(
+            status.model_dump_json(indent=2), encoding="utf-8"
+        )
+        os.rename(running, self._job_path("failed", job_id))
+
+    def heartbeat(self, job: SpoolJob) -> bool:
+        """Renew the lease of a claimed job.
+
+        Args:
+            job: Job returned by claim()
+
+        Returns:
+            False if the lease expired, even if the job was claimed again
+        """
+        try:
+            os.utime(self._lease_path(job))
+        except FileNotFoundError:
+            return False
+        return True
+
+    def reclaim_expired(self) -> int:
+        """Return jobs with an expired lease to the pending queue.
+
+        Returns:
+            Number of requeued jobs
+        """
+        deadline = time.time() - self.lease
+        requeued = 0
+        for path in (self.root / "running").glob("*.json"):
+            job_id = path.name.partition(".")[0]
+            try:
+                if path.stat().st_mtime > deadline:
+                    continue
+                os.rename(path, self._job_path("pending", job_id))
+            except FileNotFoundError:
+                continue
+            # Build directory of the expired claim only
+            shutil.rmtree(path.with_suffix(""), ignore_errors=True)
+            requeued += 1
+        return requeued
+
+    def complete(self, job: SpoolJob, status: JobStatus) -> bool:
+        """Publish the results of a job built in its work_dir().
+
+        The claim's lease file is renamed first: the rename fails if the
+        lease expired, and once it succeeded no other worker can reclaim
+        the job, so the results are only moved into place by their owner.
+
+        Args:
+            job: Job returned by claim()
+            status: Final status, ``done`` or ``failed``
+
+        Returns:
+            False if the lease was lost and the results were discarded
+        """
+        work_dir = self.work_dir(job)
+        result_dir = self.root / status.state / status.id
+        status.outputs = {
+            name: str(
+                (result_dir / Path(path).relative_to(work_dir)).relative_to(self.root)
+            )
+            for name, path in status.outputs.items()
+        }
+        work_dir.mkdir(parents=True, exist_ok=True)
+        (work_dir / "status.json").write_text(
+            status.model_dump_json(indent=2), encoding="utf-8"
+        )
+        try:
+            os.rename(self._lease_path(job), self._job_path(status.state, job.id))
+        except FileNotFoundError:
+            shutil.rmtree(work_dir, ignore_errors=True)
+            return False
+        os.rename(work_dir, result_dir)
+        return True
+
+    def status(self, job_id: str) -> JobStatus:
+        """Current state of a job.
+
+        Args:
+            job_id: Job id returned by submit()
+
+        Returns:
+            JobStatus; finished jobs include their outputs
+
+        Raises:
+            SpoolError: If the job is unknown
+        """
+        if any((self.root / "running").glob(f"{job_id}.*.json")):
+            return JobStatus(id=job_id, state="running")
+        for state in STATES:
+            if state == "running" or not self._job_path(state, job_id).exists():
+                continue
+            status_file = self.root / state / job_id / "status.json"
+            if status_file.exists():
+                return JobStatus.model_validate_json(status_file.read_bytes())
+            if state != "pending":
+                # Finished, the owner is still moving the results in
+                return JobStatus(id=job_id, state="running")
+            return JobStatus(id=job_id, state=state)
+        raise SpoolError(f"Unknown job: {job_id}")
+
+    def jobs(self) -> Iterator[JobStatus]:
+        """Status of every job in the spool.
+
+        Yields:
+            JobStatus per job, by state and submission order
+        """
+        for state in STATES:
+            for path in sorted((self.root / state).glob("[!.]*.json")):
+                try:
+                    yield self.status(path.name.partition(".")[0])
+                except SpoolError:
+                    continue  # Moved between listing and reading
+
+
+class SpoolWorker:
+    """Build jobs claimed from a spool."""
+
+    def __init__(
+        self,
+        spool: Spool,
+        template_dir: Path = Path("templates"),
+        worker_id: Optional[str] = None,
+    ) -> None:
+        """Initialize worker.
+
+        Args:
+            spool: Spool to pull jobs from
+            template_dir: Template directory on this host
+            worker_id: Name recorded in job statuses
+        """
+        self.spool = spool
+        self.worker_id = worker_id or default_worker_id()
+        self.builder = ResumeBuilder(BuildConfig(template_dir=template_dir))
+        self.console = Console()
+
+    def _build(self, job: SpoolJob, work_dir: Path) -> JobStatus:
+        """Build one job into its private directory."""
+        status = JobStatus(
+            id=job.id, state="done", name=job.resume.basics.name, worker=self.worker_id
+        )
+        start = time.perf_counter()
+        self.builder.data = job.resume
+        self.builder.config = self.builder.config.model_copy(
+            update={
+                "output_dir": work_dir,
+                "formats": job.formats,
+                "validate_output": job.validate_output,
+            }
+        )
+        try:
+            outputs = self.builder.build_all()
+        except ResumeATSError as e:
+            status.state = "failed"
+            status.error = str(e)
+        else:
+            status.outputs = {k: str(v) for k, v in outputs.items()}
+            status.passed = all(
+                r.passed for r in self.builder.validation_reports.values()
+            )
+        status.duration = time.perf_counter() - start
+        return status
+
+    def run_once(self) -> Optional[JobStatus]:
+        """Claim and build one job.
+
+        Returns:
+            Published status, or None if nothing was built or the lease was lost
+        """
+        job = self.spool.claim()
+        if job is None:
+            return None
+
+        work_dir = self.spool.work_dir(job)
+        stop = threading.Event()
+
+        def beat() -> None:
+            while not stop.wait(self.spool.lease / 3):
+                if not self.spool.heartbeat(job):
+                    return
+
+        heart = threading.Thread(target=beat, daemon=True)
+        heart.start()
+        try:
+            status = self._build(job, work_dir)
+        finally:
+            stop.set()
+            heart.join()
+
+        if not self.spool.complete(job, status):
+            self.console.print(f"⚠️  Lease lost for job {job.id}, results discarded")
+            return None
+        return status
+
+    def run(
+        self,
+        max_jobs: Optional[int] = None,
+        poll_interval: float = 2.0,
+        exit_when_idle: bool = False,
+        on_job: Optional[Callable[[JobStatus], None]] = None,
+    ) -> int:
+        """Process jobs until stopped.
+
+        Args:
+            max_jobs: Stop after this many jobs
+            poll_interval: Seconds between polls of an empty queue
+            exit_when_idle: Return once no job is pending or running
+            on_job: Called with the status of each finished job
+
+        Returns:
+            Number of jobs built
+        """
+        built = 0
+        while max_jobs is None or built < max_jobs:
+            status = self.run_once()
+            if status is not None:
+                built += 1
+                if on_job:
+                    on_job(status)
+                continue
+            if self.spool.reclaim_expired():
+                continue
+            if exit_when_idle and not any((self.spool.root / "running").glob("*.json")):
+                if not any((self.spool.root / "pending").glob("[!.]*.json")):
+                    break
+            time.sleep(poll_interval)
+        return built
@@ -0,0 +1,384 @@
+"""Skill taxonomy with a compiled, memory-mapped alias index.
+
+The taxonomy source is a YAML file listing canonical skills and their
+aliases. Parsing tens of thousands of YAML entries is slow, so the source is
+compiled once into a flat binary index (an open-addressing hash table over
+normalized alias keys) which is cached on disk and memory-mapped on start-up.
+"""
+
+import hashlib
+import mmap
+import re
+import struct
+import sys
+import zlib
+from array import array
+from functools import cache
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+import yaml
+
+from . import metrics
+from .cache import atomic_write_bytes, cache_dir
+from .exceptions import TaxonomyError
+
+DEFAULT_TAXONOMY = Path(__file__).parent / "data" / "skills.yml"
+
+INDEX_VERSION = 1
+_MAGIC = b"RATSKIX1"
+# magic, skill count, key count, bucket count, longest key in tokens
+_HEADER = struct.Struct("=8sIIII")
+
+_TOKEN_PATTERN = re.compile(r"\.?[\w+#]+(?:[.\-][\w+#]+)*|[/&]")
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lowercase skill tokens.
+
+    Dots, dashes, ``+`` and ``#`` stay inside tokens (``node.js``, ``c++``,
+    ``real-time``) while ``/`` and ``&`` become tokens of their own so that
+    "CI / CD" and "ci/cd" produce the same sequence.
+
+    Args:
+        text: Input text
+
+    Returns:
+        List of tokens
+    """
+    return _TOKEN_PATTERN.findall(text.lower())
+
+
+def normalize_term(term: str) -> str:
+    """Normalize a skill term to its lookup key.
+
+    Args:
+        term: Skill name or alias, optionally with **bold** markdown
+
+    Returns:
+        Space-joined token sequence
+    """
+    return " ".join(tokenize(term.replace("**", "")))
+
+
+def load_entries(source: Path) -> List[Union[str, Dict[str, Any]]]:
+    """Load raw skill entries from a taxonomy file.
+
+    Args:
+        source: Path to YAML (or JSON) taxonomy file
+
+    Returns:
+        List of entries with ``id``, ``name`` and ``aliases``
+
+    Raises:
+        TaxonomyError: If the file cannot be read or is malformed
+    """
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    try:
+        with source.open("r", encoding="utf-8") as f:
+            raw = yaml.load(f, Loader=loader)
+    except (OSError, yaml.YAMLError) as e:
+        raise TaxonomyError(f"Failed to load taxonomy {source}: {e}") from e
+
+    entries = raw.get("skills") if isinstance(raw, dict) else raw
+    if not isinstance(entries, list):
+        raise TaxonomyError(f"Taxonomy {source} must contain a 'skills' list")
+    return entries
+
+
+def build_index(entries: Iterable[Union[str, Dict[str, Any]]]) -> bytes:
+    """Compile taxonomy entries into the binary index format.
+
+    Layout (native byte order, all integers uint32)::
+
+        header | skill offsets | key offsets | key->skill | buckets
+               | skill blob ("id\\0name" records) | key blob
+
+    Args:
+        entries: Skill entries with ``id`` and optional ``name``/``aliases``,
+            or bare skill IDs
+
+    Returns:
+        Serialized index
+
+    Raises:
+        TaxonomyError: If an entry has no id
+    """
+    skill_blob = bytearray()
+    skill_offsets = array("I", [0])
+    key_blob = bytearray()
+    key_offsets = array("I", [0])
+    key_skills = array("I")
+    seen: Dict[bytes, int] = {}
+    max_tokens = 1
+
+    for entry in entries:
+        if isinstance(entry, str):
+            entry = {"id": entry}
+        skill_id = str(entry.get("id") or "").strip()
+        if not skill_id:
+            raise TaxonomyError(f"Taxonomy entry without id: {entry!r}")
+        name = str(entry.get("name") or skill_id)
+
+        skill_index = len(skill_offsets) - 1
+        skill_blob += skill_id.encode("utf-8") + b"\0" + name.encode("utf-8")
+        skill_offsets.append(len(skill_blob))
+
+        for term in (skill_id, name, *(entry.get("aliases") or [])):
+            key = normalize_term(str(term))
+            key_bytes = key.encode("utf-8")
+            if not key_bytes or key_bytes in seen:
+                continue
+            seen[key_bytes] = skill_index
+            key_blob += key_bytes
+            key_offsets.append(len(key_blob))
+            key_skills.append(skill_index)
+            max_tokens = max(max_tokens, key.count(" ") + 1)
+
+    n_keys = len(key_skills)
+    n_buckets = 1
+    while n_buckets < n_keys * 2:
+        n_buckets <<= 1
+    mask = n_buckets - 1
+    buckets = array("I", bytes(4 * n_buckets))
+    for key_index, key_bytes in enumerate(seen):
+        slot = zlib.crc32(key_bytes) & mask
+        while buckets[slot]:
+            slot = (slot + 1) & mask
+        buckets[slot] = key_index + 1
+
+    header = _HEADER.pack(_MAGIC, len(skill_offsets) - 1, n_keys, n_buckets, max_tokens)
+    return b"".join(
+        [
+            header,
+            skill_offsets.tobytes(),
+            key_offsets.tobytes(),
+            key_skills.tobytes(),
+            buckets.tobytes(),
+            bytes(skill_blob),
+            bytes(key_blob),
+        ]
+    )
+
+
+def compile_taxonomy(source: Path, index_path: Path) -> Path:
+    """Compile a taxonomy file into an index file.
+
+    Args:
+        source: Taxonomy source file
+        index_path: Destination of the compiled index
+
+    Returns:
+        Path to the compiled index
+    """
+    atomic_write_bytes(index_path, build_index(load_entries(source)))
+    return index_path
+
+
+def _index_cache_path(source: Path, directory: Optional[Path]) -> Path:
+    """Return the cache location of the compiled index for a source file."""
+    stat = source.stat()
+    fingerprint = (
+        f"{source.resolve()}:{stat.st_mtime_ns}:{stat.st_size}:"
+        f"{INDEX_VERSION}:{sys.byteorder}"
+    )
+    digest = hashlib.sha1(fingerprint.encode("utf-8")).hexdigest()[:16]
+    if directory is None:
+        directory = cache_dir("taxonomy")
+    else:
+        directory.mkdir(parents=True, exist_ok=True)
+    return directory / f"{source.stem}-{digest}.idx"
+
+
+class SkillTaxonomy:
+    """Read-only view over a compiled skill index."""
+
+    def __init__(self, buffer: Union[bytes, mmap.mmap]) -> None:
+        """Initialize taxonomy from a compiled index buffer.
+
+        Args:
+            buffer: Bytes or memory map holding a compiled index
+
+        Raises:
+            TaxonomyError: If the buffer is not a valid index
+        """
+        if len(buffer) < _HEADER.size:
+            raise TaxonomyError("Compiled taxonomy index is truncated")
+        magic, n_skills, n_keys, n_buckets, max_tokens = _HEADER.unpack_from(buffer, 0)
+        if magic != _MAGIC:
+            raise TaxonomyError("Not a compiled taxonomy index")
+
+        self._buffer = buffer
+        view = memoryview(buffer)
+        pos = _HEADER.size
+
+        def take(count: int) -> memoryview:
+            nonlocal pos
+            section = view[pos : pos + 4 * count].cast("I")
+            pos += 4 * count
+            return section
+
+        self._skill_offsets = take(n_skills + 1)
+        self._key_offsets = take(n_keys + 1)
+        self._key_skills = take(n_keys)
+        self._buckets = take(n_buckets)
+        self._skill_blob = view[pos : pos + self._skill_offsets[n_skills]]
+        pos += self._skill_offsets[n_skills]
+        self._key_blob = view[pos : pos + self._key_offsets[n_keys]]
+
+        self._mask = n_buckets - 1
+        self.max_tokens = max_tokens
+        self._size = n_skills
+
+    @classmethod
+    def load(
+        cls, source: Optional[Path] = None, cache: Optional[Path] = None
+    ) -> "SkillTaxonomy":
+        """Load a taxonomy, compiling it into the on-disk cache if needed.
+
+        Args:
+            source: Taxonomy file. Uses the bundled taxonomy if None.
+            cache: Directory for compiled indexes. Uses the user cache if None.
+
+        Returns:
+            Memory-mapped SkillTaxonomy
+        """
+        source = Path(source or DEFAULT_TAXONOMY)
+        try:
+            index_path = _index_cache_path(source, cache)
+            cached = index_path.exists()
+            metrics.cache_lookup("taxonomy", cached)
+            if not cached:
+                compile_taxonomy(source, index_path)
+            with index_path.open("rb") as f:
+                return cls(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+        except TaxonomyError:
+            raise
+        except OSError:
+            # Read-only cache: compile in memory instead
+            return cls(build_index(load_entries(source)))
+
+    @classmethod
+    def from_entries(cls, entries: Iterable[Dict[str, Any]]) -> "SkillTaxonomy":
+        """Build an in-memory taxonomy without touching the disk cache.
+
+        Args:
+            entries: Skill entries with ``id`` and optional ``name``/``aliases``
+
+        Returns:
+            SkillTaxonomy instance
+        """
+        return cls(build_index(entries))
+
+    def __len__(self) -> int:
+        """Return the number of canonical skills."""
+        return int(self._size)
+
+    def _skill(self, index: int) -> Tuple[str, str]:
+        record = bytes(
+            self._skill_blob[
+                self._skill_offsets[index] : self._skill_offsets[index + 1]
+            ]
+        ).decode("utf-8")
+        skill_id, _, name = record.partition("\0")
+        return skill_id, name
+
+    def _find_key(self, key: bytes) -> int:
+        slot = zlib.crc32(key) & self._mask
+        while True:
+            entry = self._buckets[slot]
+            if not entry:
+                return -1
+            start = self._key_offsets[entry - 1]
+            end = self._key_offsets[entry]
+            if self._key_blob[start:end] == key:
+                return int(self._key_skills[entry - 1])
+            slot = (slot + 1) & self._mask
+
+    def lookup(self, term: str) -> Optional[str]:
+        """Map a skill name or alias to its canonical skill ID.
+
+        Args:
+            term: Skill name or alias
+
+        Returns:
+            Canonical skill ID, or None if the term is unknown
+        """
+        index = self._find_key(normalize_term(term).encode("utf-8"))
+        return self._skill(index)[0] if index >= 0 else None
+
+    def display_name(self, skill_id: str) -> Optional[str]:
+        """Return the display name of a canonical skill ID.
+
+        Args:
+            skill_id: Canonical skill ID
+
+        Returns:
+            Display name, or None if the ID is unknown
+        """
+        index = self._find_key(normalize_term(skill_id).encode("utf-8"))
+        return self._skill(index)[1] if index >= 0 else None
+
+    def find(self, text: str) -> List[str]:
+        """Find all taxonomy skills mentioned in a text.
+
+        Scans the token stream once, preferring the longest alias at each
+        position ("machine learning" over "learning").
+
+        Args:
+            text: Free text to scan
+
+        Returns:
+            Sorted list of canonical skill IDs
+        """
+        tokens = tokenize(text)
+        return sorted({self._skill(i)[0] for i, _ in self._scan(tokens) if i >= 0})
+
+    def canonical_terms(self, text: str) -> List[Tuple[str, bool]]:
+        """Tokenize a text, replacing skill mentions by their canonical ID.
+
+        Args:
+            text: Free text to scan
+
+        Returns:
+            ``(term, is_skill)`` pairs in text order
+        """
+        tokens = tokenize(text)
+        terms = []
+        position = 0
+        for index, width in self._scan(tokens):
+            if index >= 0:
+                terms.append((self._skill(index)[0], True))
+            else:
+                terms.append((tokens[position], False))
+            position += width
+        return terms
+
+    def _scan(self, tokens: List[str]) -> List[Tuple[int, int]]:
+        """Match the longest alias at each position of a token stream.
+
+        Returns:
+            ``(skill index, width in tokens)`` per consumed span; the index
+            is -1 for a single non-skill token
+        """
+        spans = []
+        position = 0
+        while position < len(tokens):
+            width = min(self.max_tokens, len(tokens) - position)
+            index = -1
+            while width:
+                key = " ".join(tokens[position : position + width])
+                index = self._find_key(key.encode("utf-8"))
+                if index >= 0:
+                    break
+                width -= 1
+            width = width or 1
+            spans.append((index, width))
+            position += width
+        return spans
+
+
+@cache
+def default_taxonomy() -> SkillTaxonomy:
+    """Return the process-wide taxonomy loaded from the bundled data file."""
+    return SkillTaxonomy.load()
@@ -0,0 +1,302 @@
+"""ATS validation of extracted CV data against source resume data."""
+
+import difflib
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set
+
+from .extractors import CVExtractor
+from .models import CVData, FieldResult, ResumeData, Skill, SkillMatch, ValidationReport
+from .taxonomy import SkillTaxonomy, default_taxonomy
+
+# Substrings up to this length are indexed exactly; longer strings are
+# indexed by their character trigrams.
+_GRAM = 3
+
+
+def expected_skills(resume: ResumeData) -> List[str]:
+    """Collect the skills a resume claims, cleaned for matching.
+
+    Removes ``**`` markdown, drops parenthesized annotations and splits
+    comma-separated entries.
+
+    Args:
+        resume: Resume data
+
+    Returns:
+        Unique lowercase skill names, in resume order
+    """
+    raw: List[str] = []
+    for skill in resume.skills:
+        if isinstance(skill, Skill):
+            raw.extend(skill.keywords)
+        else:
+            raw.append(skill)
+
+    cleaned: List[str] = []
+    for skill in raw:
+        clean_skill = skill.replace("**", "").split("(")[0].strip().lower()
+        cleaned.extend(s.strip() for s in clean_skill.split(",") if s.strip())
+
+    return list(dict.fromkeys(cleaned))
+
+
+def _short_grams(text: str) -> Set[str]:
+    """Return all substrings of length 1 to ``_GRAM``."""
+    return {
+        text[i : i + n] for n in range(1, _GRAM + 1) for i in range(len(text) - n + 1)
+    }
+
+
+def _trigrams(text: str) -> Set[str]:
+    return {text[i : i + _GRAM] for i in range(len(text) - _GRAM + 1)}
+
+
+class SkillMatcher:
+    """Inverted n-gram index over extracted skills.
+
+    Each expected skill is classified as:
+
+    - ``exact``: same normalized string or same canonical taxonomy ID
+    - ``partial``: one string contains the other
+    - ``fuzzy``: similar spelling (difflib ratio) above a threshold
+    - ``missing``: none of the above
+
+    Candidates are found through the index, so matching n expected skills
+    against m extracted ones costs roughly O(n) lookups instead of n * m
+    string comparisons.
+    """
+
+    def __init__(
+        self,
+        candidates: Iterable[str],
+        partial_threshold: float = 0.0,
+        fuzzy_threshold: float = 0.85,
+        taxonomy: Optional[SkillTaxonomy] = None,
+    ) -> None:
+        """Build the index.
+
+        Args:
+            candidates: Extracted skills to match against
+            partial_threshold: Minimum length ratio (shorter / longer) for a
+                containment match to count as partial
+            fuzzy_threshold: Minimum similarity ratio for a fuzzy match
+            taxonomy: Skill taxonomy used to resolve aliases
+        """
+        self.partial_threshold = partial_threshold
+        self.fuzzy_threshold = fuzzy_threshold
+        self.taxonomy = taxonomy or default_taxonomy()
+
+        self._skills = list(dict.fromkeys(c.lower() for c in candidates if c))
+        self._exact: Dict[str, int] = {}
+        self._canonical: Dict[str, int] = {}
+        self._postings: Dict[str, Set[int]] = {}
+        self._trigram_counts: List[int] = []
+
+        for index, skill in enumerate(self._skills):
+            self._exact[skill] = index
+            canonical = self.taxonomy.lookup(skill)
+            if canonical is not None:
+                self._canonical.setdefault(canonical, index)
+            for gram in _short_grams(skill):
+                self._postings.setdefault(gram, set()).add(index)
+            self._trigram_counts.append(len(_trigrams(skill)))
+
+    def _containing(self, skill: str) -> Set[int]:
+        """Return indexed skills that contain ``skill`` as a substring."""
+        if len(skill) <= _GRAM:
+            return self._postings.get(skill, set())
+
+        postings = sorted(
+            (self._postings.get(gram, set()) for gram in _trigrams(skill)), key=len
+        )
+        hits = set(postings[0]).intersection(*postings[1:])
+        return {i for i in hits if skill in self._skills[i]}
+
+    def _contained(self, skill: str, trigram_hits: Counter) -> Set[int]:
+        """Return indexed skills that are substrings of ``skill``."""
+        found = {
+            self._exact[gram] for gram in _short_grams(skill) if gram in self._exact
+        }
+        for index, count in trigram_hits.items():
+            if count == self._trigram_counts[index] and self._skills[index] in skill:
+                found.add(index)
+        return found
+
+    def match(self, skill: str) -> SkillMatch:
+        """Match one expected skill against the index.
+
+        Args:
+            skill: Expected skill name
+
+        Returns:
+            SkillMatch describing the best match
+        """
+        needle = skill.lower().strip()
+
+        index = self._exact.get(needle)
+        if index is None:
+            canonical = self.taxonomy.lookup(needle)
+            if canonical is not None:
+                index = self._canonical.get(canonical)
+        if index is not None:
+            return SkillMatch(
+                skill=skill, match_type="exact", matched=self._skills[index], score=1.0
+            )
+
+        trigram_hits: Counter = Counter()
+        for gram in _trigrams(needle):
+            trigram_hits.update(self._postings.get(gram, ()))
+
+        best: Optional[SkillMatch] = None
+        for index in self._containing(needle) | self._contained(needle, trigram_hits):
+            candidate = self._skills[index]
+            score = min(len(candidate), len(needle)) / max(len(candidate), len(needle))
+            if score >= self.partial_threshold and (best is None or score > best.score):
+                best = SkillMatch(
+                    skill=skill, match_type="partial", matched=candidate, score=score
+                )
+        if best is not None:
+            return best
+
+        for index, _ in trigram_hits.most_common():
+            candidate = self._skills[index]
+            score = difflib.SequenceMatcher(None, needle, candidate).ratio()
+            if score >= self.fuzzy_threshold and (best is None or score > best.score):
+                best = SkillMatch(
+                    skill=skill, match_type="fuzzy", matched=candidate, score=score
+                )
+        if best is not None:
+            return best
+
+        return SkillMatch(skill=skill, match_type="missing")
+
+    def match_all(self, skills: Iterable[str]) -> List[SkillMatch]:
+        """Match several expected skills.
+
+        Args:
+            skills: Expected skill names
+
+        Returns:
+            One SkillMatch per skill, in input order
+        """
+        return [self.match(skill) for skill in skills]
+
+
+def validate_cv(
+    resume: ResumeData,
+    cv: CVData,
+    coverage_threshold: float = 0.1,
+    partial_threshold: float = 0.0,
+    fuzzy_threshold: float = 0.85,
+) -> ValidationReport:
+    """Validate extracted CV data against the source resume.
+
+    Args:
+        resume: Source resume data (expected values)
+        cv: Data extracted from the generated document
+        coverage_threshold: Fraction of expected skills that must be found
+        partial_threshold: See SkillMatcher
+        fuzzy_threshold: See SkillMatcher
+
+    Returns:
+        ValidationReport with per-field and per-skill results
+    """
+    fields = []
+
+    expected_name = resume.basics.name
+    fields.append(
+        FieldResult(
+            name="Name",
+            expected=expected_name,
+            found=cv.name,
+            passed=bool(cv.name) and expected_name.lower() in cv.name.lower(),
+        )
+    )
+
+    expected_email = resume.basics.email
+    fields.append(
+        FieldResult(
+            name="Email",
+            expected=expected_email,
+            found=cv.email,
+            passed=cv.email == expected_email,
+        )
+    )
+
+    expected_position = resume.basics.label or ""
+    fields.append(
+        FieldResult(
+            name="Position",
+            expected=expected_position,
+            found=cv.position,
+            passed=bool(cv.position)
+            and expected_position.lower() in cv.position.lower(),
+        )
+    )
+
+    skills = expected_skills(resume)
+    matches: List[SkillMatch] = []
+    if skills:
+        matcher = SkillMatcher(
+            cv.skills,
+            partial_threshold=partial_threshold,
+            fuzzy_threshold=fuzzy_threshold,
+        )
+        matches = matcher.match_all(skills)
+        matching = sum(1 for m in matches if m.match_type != "missing")
+        fields.append(
+            FieldResult(
+                name="Skills",
+                expected=f"{len(skills)} expected",
+                found=f"{len(cv.skills)} found, {matching} matching",
+                passed=matching > len(skills) * coverage_threshold,
+            )
+        )
+    else:
+        fields.append(
+            FieldResult(
+                name="Skills",
+                expected="No skills in YAML",
+                found=f"{len(cv.skills)} found",
+                passed=True,
+            )
+        )
+
+    matched = sum(1 for m in matches if m.match_type != "missing")
+    return ValidationReport(
+        fields=fields,
+        skills=matches,
+        skills_expected=len(skills),
+        skills_found=len(cv.skills),
+        skills_matched=matched,
+        coverage=matched / len(skills) if skills else 1.0,
+        passed=all(field.passed for field in fields),
+    )
+
+
+def validate_pdf(
+    resume: ResumeData, pdf_path: Path, **thresholds: float
+) -> ValidationReport:
+    """Extract a PDF and validate it against the source resume.
+
+    Args:
+        resume: Source resume data (expected values)
+        pdf_path: Generated PDF
+        **thresholds: Threshold overrides passed to validate_cv
+
+    Returns:
+        ValidationReport with the PDF as source and per-stage timings
+
+    Raises:
+        ExtractionError: If text cannot be extracted from the PDF
+    """
+    extractor = CVExtractor(pdf_path)
+    cv_data = extractor.extract_all()
+
+    start = time.perf_counter()
+    report = validate_cv(resume, cv_data, **thresholds)
+    report.source = str(pdf_path)
+    report.timings = {**extractor.timings, "validate": time.perf_counter() - start}
+    return report
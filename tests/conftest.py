@@ -0,0 +1,67 @@
+"""Shared test helpers."""
+
+import zlib
+from pathlib import Path
+from typing import List, Sequence
+
+
+def _escape(line: str) -> str:
+    """Escape a PDF literal string."""
+    return line.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def make_pdf(
+    path: Path, pages: Sequence[Sequence[str]], compress: bool = False
+) -> Path:
+    """Write a PDF showing lines of Helvetica text, without a PDF library.
+
+    Args:
+        path: Destination file
+        pages: Lines of text of each page
+        compress: Deflate the page content streams
+
+    Returns:
+        ``path``
+    """
+    objects: List[bytes] = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"",  # Page tree, filled in once the kids are known
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    kids = []
+    for lines in pages:
+        shown = " ".join(f"({_escape(line)}) '" for line in lines)
+        content = f"BT /F1 12 Tf 72 734 Td 14 TL {shown} ET".encode()
+        filters = ""
+        if compress:
+            content = zlib.compress(content)
+            filters = " /Filter /FlateDecode"
+        objects.append(
+            f"<< /Length {len(content)}{filters} >>\nstream\n".encode()
+            + content
+            + b"\nendstream"
+        )
+        objects.append(
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            f"/Contents {len(objects)} 0 R "
+            f"/Resources << /Font << /F1 3 0 R >> >> >>".encode()
+        )
+        kids.append(f"{len(objects)} 0 R")
+    objects[1] = (
+        f"<< /Type /Pages /Kids [{' '.join(kids)}] /Count {len(kids)} >>".encode()
+    )
+
+    out = b"%PDF-1.4\n"
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(out))
+        out += f"{number} 0 obj\n".encode() + body + b"\nendobj\n"
+    xref = len(out)
+    out += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+    out += b"".join(f"{offset:010d} 00000 n \n".encode() for offset in offsets)
+    out += (
+        f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\n"
+        f"startxref\n{xref}\n%%EOF\n"
+    ).encode()
+    path.write_bytes(out)
+    return path
@@ -0,0 +1,117 @@
+"""Tests for streaming batch builds."""
+
+import json
+from pathlib import Path
+from typing import List, Tuple
+
+import pytest
+
+from resume_ats import ResumeBuilder
+from resume_ats.core import iter_resumes
+from resume_ats.exceptions import BuildError, CompilationError
+from resume_ats.models import BuildConfig
+
+
+def resume(name: str) -> dict:
+    """Minimal resume document."""
+    return {"basics": {"name": name, "email": f"{name.split()[0]}@example.com"}}
+
+
+@pytest.mark.unit
+class TestIterResumes:
+    """Unit tests for lazy resume streams."""
+
+    def test_yaml_stream_is_lazy(self, tmp_path: Path):
+        """Documents are yielded before later ones are parsed."""
+        source = tmp_path / "resumes.yml"
+        source.write_text(
+            "basics: {name: Ann Poe, email: ann@example.com}\n"
+            "---\n"
+            "basics: {name: Bob Roe, email: bob@example.com}\n"
+            "---\n"
+            "basics: [unclosed\n",
+            encoding="utf-8",
+        )
+
+        stream = iter_resumes(source)
+        assert next(stream)[1].basics.name == "Ann Poe"
+        assert next(stream)[1].basics.name == "Bob Roe"
+        with pytest.raises(BuildError):
+            next(stream)
+
+    def test_ndjson_skips_invalid_documents(self, tmp_path: Path):
+        """Invalid documents are reported and the stream goes on."""
+        source = tmp_path / "resumes.jsonl"
+        lines = [json.dumps(resume("Ann Poe")), '{"basics": {}}', ""]
+        lines.append(json.dumps(resume("Bob Roe")))
+        source.write_text("\n".join(lines), encoding="utf-8")
+        errors: List[int] = []
+
+        loaded = list(iter_resumes(source, on_error=lambda i, e: errors.append(i)))
+
+        assert [(i, r.basics.name) for i, r in loaded] == [
+            (0, "Ann Poe"),
+            (2, "Bob Roe"),
+        ]
+        assert errors == [1]
+
+    def test_invalid_document_raises_without_callback(self, tmp_path: Path):
+        """Without on_error an invalid document stops the stream."""
+        source = tmp_path / "resumes.yml"
+        source.write_text("basics: {name: Ann Poe}\n", encoding="utf-8")
+
+        with pytest.raises(BuildError, match="#0"):
+            list(iter_resumes(source))
+
+
+@pytest.mark.unit
+class TestBuildStream:
+    """Unit tests for ResumeBuilder.build_stream."""
+
+    def test_each_resume_gets_its_own_directory(self, tmp_path: Path):
+        """Outputs land in per-document directories as they are built."""
+        source = tmp_path / "resumes.jsonl"
+        source.write_text(
+            "\n".join(json.dumps(resume(n)) for n in ("Ann Poe", "Bob Roe")),
+            encoding="utf-8",
+        )
+        config = BuildConfig(output_dir=tmp_path / "out", formats=["json"])
+        builder = ResumeBuilder(config)
+
+        seen: List[Tuple[int, str]] = []
+        for item in builder.build_stream(iter_resumes(source)):
+            seen.append((item.index, item.name))
+            data = json.loads(Path(item.outputs["json"]).read_text(encoding="utf-8"))
+            assert data["basics"]["name"] == item.name
+
+        assert seen == [(0, "Ann Poe"), (1, "Bob Roe")]
+        assert sorted(p.name for p in (tmp_path / "out").iterdir()) == [
+            "000000_Ann_Poe",
+            "000001_Bob_Roe",
+        ]
+        assert builder.config.output_dir == tmp_path / "out"
+
+    def test_failures_do_not_stop_the_stream(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        """A failing resume is reported and the next one is still built."""
+        config = BuildConfig(output_dir=tmp_path / "out", formats=["pdf"])
+        builder = ResumeBuilder(config)
+
+        def build_pdf() -> Path:
+            if builder.data.basics.name == "Ann Poe":
+                raise CompilationError("xelatex not found")
+            return builder.config.output_dir / "resume.pdf"
+
+        monkeypatch.setattr(builder, "build_pdf", build_pdf)
+        source = tmp_path / "resumes.jsonl"
+        source.write_text(
+            "\n".join(json.dumps(resume(n)) for n in ("Ann Poe", "Bob Roe")),
+            encoding="utf-8",
+        )
+
+        items = list(builder.build_stream(iter_resumes(source)))
+
+        assert items[0].error == "xelatex not found"
+        assert items[1].error is None
+        assert items[1].outputs["pdf"].endswith("000001_Bob_Roe/resume.pdf")
@@ -0,0 +1,108 @@
+"""Tests for the multi-parser consensus check."""
+
+from pathlib import Path
+
+import pytest
+from conftest import make_pdf
+
+from resume_ats.consensus import BACKENDS, consensus, field_agreement
+from resume_ats.exceptions import ExtractionError
+
+
+def _broken(path: Path) -> str:
+    """Backend that cannot read the PDF."""
+    raise RuntimeError("broken xref table")
+
+
+def _missing(path: Path) -> str:
+    """Backend whose library is not installed."""
+    raise ImportError("No module named 'ocrlib'")
+
+
+@pytest.mark.unit
+class TestFieldAgreement:
+    """Agreement scores for scalar and list fields."""
+
+    def test_scalar_majority(self):
+        """The most common normalized value wins."""
+        result = field_agreement(
+            "name", {"a": "Jane Doe", "b": "jane  doe", "c": "Jane"}
+        )
+
+        assert result.value == "Jane Doe"
+        assert result.agreement == pytest.approx(2 / 3)
+
+    def test_list_overlap(self):
+        """List agreement is the share of items every backend found."""
+        result = field_agreement(
+            "skills",
+            {"a": ["python", "go"], "b": ["python", "go", "rust"], "c": ["python"]},
+        )
+
+        assert result.value == ["go", "python"]
+        assert result.agreement == pytest.approx(1 / 3)
+
+    def test_field_no_backend_found_is_missing(self):
+        """A field every backend lost has no agreement."""
+        skills = field_agreement("skills", {"a": [], "b": []})
+        name = field_agreement("name", {"a": "", "b": ""})
+
+        assert skills.missing and skills.agreement == 0.0 and skills.value == []
+        assert name.missing and name.agreement == 0.0
+        assert not field_agreement("name", {"a": "Jane", "b": ""}).missing
+
+
+@pytest.mark.unit
+class TestConsensus:
+    """Concurrent extraction with the installed backends."""
+
+    def test_backends_agree_on_simple_pdf(self, tmp_path: Path):
+        """pdfplumber and pdfminer read the same fields; missing ones are skipped."""
+        pdf = make_pdf(
+            tmp_path / "cv.pdf",
+            [
+                [
+                    "Jane Doe",
+                    "jane@example.com",
+                    "DevOps Engineer",
+                    "Skills: Python, Kubernetes, Terraform",
+                ]
+            ],
+        )
+
+        report = consensus(pdf, ["pdfplumber", "pdfminer", "pdftotext", "pypdf"])
+
+        by_backend = {p.backend: p for p in report.parsers}
+        assert by_backend["pdfplumber"].data is not None
+        assert by_backend["pdfminer"].data is not None
+        fields = {f.field: f for f in report.fields}
+        assert fields["email"].value == "jane@example.com"
+        assert fields["email"].agreement == 1.0
+        assert "kubernetes" in fields["skills"].value
+
+    def test_failed_backend_lowers_agreement(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        """A backend that fails counts as extracting nothing; skipped ones do not."""
+        monkeypatch.setitem(BACKENDS, "broken", _broken)
+        monkeypatch.setitem(BACKENDS, "missing", _missing)
+        pdf = make_pdf(tmp_path / "cv.pdf", [["Jane Doe", "jane@example.com"]])
+
+        report = consensus(pdf, ["pdfplumber", "broken", "missing"])
+
+        by_backend = {p.backend: p for p in report.parsers}
+        assert not by_backend["broken"].skipped and by_backend["broken"].error
+        assert by_backend["missing"].skipped
+        fields = {f.field: f for f in report.fields}
+        assert fields["email"].values == {
+            "pdfplumber": "jane@example.com",
+            "broken": "",
+        }
+        assert fields["email"].agreement == pytest.approx(1 / 2)
+
+    def test_unknown_backend(self, tmp_path: Path):
+        """Unknown backend names are rejected before any work starts."""
+        pdf = make_pdf(tmp_path / "cv.pdf", [["Jane Doe"]])
+
+        with pytest.raises(ExtractionError, match="ocr"):
+            consensus(pdf, ["ocr"])
@@ -0,0 +1,90 @@
+"""Tests for near-duplicate detection."""
+
+from pathlib import Path
+from typing import List
+
+import pytest
+
+pytest.importorskip("numpy")
+
+import resume_ats.dedupe  # noqa: E402
+from resume_ats.dedupe import (  # noqa: E402
+    MinHasher,
+    SignatureCache,
+    find_duplicates,
+    lsh_params,
+    signatures_for,
+)
+
+BASE = (
+    "Jane Doe DevOps Engineer Paris. Built Kubernetes platforms with Terraform, "
+    "Helm and ArgoCD for forty product teams. Migrated legacy services to GitLab "
+    "CI pipelines and cut deployment time from hours to minutes. Ran Prometheus "
+    "and Grafana monitoring with on-call rotations and incident reviews. "
+    "Education: MSc Computer Science, Sorbonne University. Languages: French, "
+    "English, Spanish. Interests: climbing, chess and open source."
+)
+REVISION = BASE.replace("forty", "fifty").replace("chess", "go")
+OTHER = (
+    "John Roe Data Scientist Berlin. Trained gradient boosting and deep learning "
+    "models in Python with pandas, scikit-learn and PyTorch. Designed A/B tests "
+    "and causal inference studies for pricing. Education: PhD Statistics."
+)
+
+
+@pytest.mark.unit
+class TestMinHash:
+    """Unit tests for MinHash signatures and LSH clustering."""
+
+    def test_signature_estimates_similarity(self):
+        """Equal signature slots approximate Jaccard similarity."""
+        hasher = MinHasher(num_perm=256, shingle_size=3)
+        base, revision, other = (hasher.signature(t) for t in (BASE, REVISION, OTHER))
+
+        assert (base == revision).mean() > 0.6
+        assert (base == other).mean() < 0.1
+
+    def test_lsh_params_cover_signature(self):
+        """Bands and rows fit in the signature and center on the threshold."""
+        bands, rows = lsh_params(0.8, 128)
+
+        assert bands * rows <= 128
+        assert abs((1 / bands) ** (1 / rows) - 0.8) < 0.05
+
+    def test_find_duplicates_clusters_revisions(self):
+        """Revisions of one resume form a cluster; unrelated ones do not."""
+        hasher = MinHasher(num_perm=128, shingle_size=3)
+        texts = {"a.pdf": BASE, "b.pdf": REVISION, "c.pdf": OTHER, "d.pdf": BASE}
+        signatures = {name: hasher.signature(text) for name, text in texts.items()}
+
+        clusters = find_duplicates(signatures, threshold=0.5)
+
+        assert len(clusters) == 1
+        assert sorted(clusters[0].paths) == ["a.pdf", "b.pdf", "d.pdf"]
+        assert 0.5 <= clusters[0].similarity < 1.0
+
+    def test_signatures_are_cached_by_content(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Files with known content are not extracted again."""
+        extracted: List[Path] = []
+
+        class FakeExtractor:
+            def __init__(self, pdf_path: Path) -> None:
+                extracted.append(pdf_path)
+                self.text = pdf_path.read_text(encoding="utf-8")
+
+        monkeypatch.setattr(resume_ats.dedupe, "CVExtractor", FakeExtractor)
+        paths = []
+        for name, text in (("a.pdf", BASE), ("b.pdf", BASE), ("c.pdf", OTHER)):
+            paths.append(tmp_path / name)
+            paths[-1].write_text(text, encoding="utf-8")
+
+        hasher = MinHasher()
+        cache = SignatureCache(tmp_path / "signatures.db")
+        first = signatures_for(paths, hasher, cache)
+        second = signatures_for(paths, hasher, cache)
+        cache.close()
+
+        assert [p.name for p in extracted] == ["a.pdf", "c.pdf"]
+        assert all((first[k] == second[k]).all() for k in first)
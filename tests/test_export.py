@@ -0,0 +1,72 @@
+"""Tests for bulk resume export."""
+
+import gzip
+import json
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from resume_ats.exceptions import BuildError
+from resume_ats.export import BulkExporter, guess_compression
+from resume_ats.models import ResumeData
+
+
+@pytest.fixture
+def resumes() -> List[ResumeData]:
+    """A few minimal resumes."""
+    return [
+        ResumeData(
+            basics={"name": f"User {i}", "email": f"u{i}@example.com"},
+            skills=["Python", "Kubernetes"],
+        )
+        for i in range(3)
+    ]
+
+
+@pytest.mark.unit
+class TestBulkExporter:
+    """Unit tests for BulkExporter."""
+
+    def test_ndjson_gzip_round_trip(self, resumes: List[ResumeData], tmp_path: Path):
+        """Records are compact JSON lines that validate back into ResumeData."""
+        path = tmp_path / "resumes.ndjson.gz"
+        with BulkExporter(path) as exporter:
+            assert exporter.write_all(resumes) == 3
+
+        lines = gzip.decompress(path.read_bytes()).decode("utf-8").splitlines()
+        assert [ResumeData.model_validate_json(line) for line in lines] == resumes
+        assert json.loads(lines[0]) == json.loads(resumes[0].model_dump_json())
+        assert "\n" not in lines[0] and ": " not in lines[0]
+
+    def test_msgpack(self, resumes: List[ResumeData], tmp_path: Path):
+        """MessagePack records unpack to the JSON representation."""
+        msgpack = pytest.importorskip("msgpack")
+        path = tmp_path / "resumes.msgpack"
+        with BulkExporter(path, "msgpack") as exporter:
+            exporter.write_all(resumes)
+
+        unpacked = list(msgpack.Unpacker(path.open("rb")))
+        assert [ResumeData.model_validate(r) for r in unpacked] == resumes
+
+    def test_zstd(self, resumes: List[ResumeData], tmp_path: Path):
+        """Zstandard streams decompress to NDJSON."""
+        zstandard = pytest.importorskip("zstandard")
+        path = tmp_path / "resumes.ndjson.zst"
+        with BulkExporter(path) as exporter:
+            exporter.write_all(resumes)
+
+        with zstandard.ZstdDecompressor().stream_reader(path.open("rb")) as reader:
+            assert len(reader.read().splitlines()) == 3
+
+    def test_compression_from_suffix(self):
+        """The compression is inferred from the file suffix."""
+        assert guess_compression(Path("a.ndjson.gz")) == "gzip"
+        assert guess_compression(Path("a.msgpack.zst")) == "zstd"
+        assert guess_compression(Path("a.ndjson")) == "none"
+
+    def test_unknown_format(self, tmp_path: Path):
+        """Unknown formats are rejected before anything is written."""
+        with pytest.raises(BuildError):
+            BulkExporter(tmp_path / "out.csv", "csv")
+        assert not (tmp_path / "out.csv").exists()
@@ -0,0 +1,86 @@
+"""Tests for page-by-page PDF text extraction."""
+
+import subprocess
+from pathlib import Path
+from typing import Any, Iterator, List
+
+import pytest
+from conftest import make_pdf
+
+from resume_ats import extractors
+from resume_ats.extractors import CVExtractor, iter_pdf_pages
+
+
+@pytest.mark.unit
+class TestStreamingExtraction:
+    """Pages are yielded one by one, within the budget."""
+
+    @pytest.fixture
+    def pdf(self, tmp_path: Path) -> Path:
+        return make_pdf(tmp_path / "cv.pdf", [["Jane Doe"], [], ["Page three"]])
+
+    def test_pages(self, pdf: Path):
+        """Each page yields its text, releasing its caches afterwards."""
+        assert list(iter_pdf_pages(pdf)) == ["Jane Doe", "", "Page three"]
+
+    def test_full_text(self, pdf: Path):
+        """Without a budget every non-empty page is kept."""
+        extractor = CVExtractor(pdf)
+
+        assert extractor.text == "Jane Doe\nPage three\n"
+        assert not extractor.truncated
+
+    def test_max_pages(self, pdf: Path):
+        """Reading stops after max_pages."""
+        extractor = CVExtractor(pdf, max_pages=1)
+
+        assert extractor.text == "Jane Doe\n"
+        assert extractor.truncated
+
+    def test_max_bytes(self, pdf: Path):
+        """The text, page separators included, is cut at max_bytes."""
+        extractor = CVExtractor(pdf, max_bytes=12)
+
+        assert extractor.text == "Jane Doe\nPag"
+        assert extractor.truncated
+
+    def test_max_bytes_fits_exactly(self, pdf: Path):
+        """Text that fits the byte budget exactly is not truncated."""
+        extractor = CVExtractor(pdf, max_bytes=len("Jane Doe\nPage three\n"))
+
+        assert extractor.text == "Jane Doe\nPage three\n"
+        assert not extractor.truncated
+
+    @pytest.mark.parametrize(
+        "stdout, text, truncated",
+        [
+            # The form feed after the last page is not another page
+            ("Jane Doe\fPage two\f", "Jane Doe\nPage two\n", False),
+            ("Jane Doe\fPage two\fPage three\f", "Jane Doe\nPage two\n", True),
+        ],
+    )
+    def test_pdftotext_fallback(
+        self,
+        pdf: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        stdout: str,
+        text: str,
+        truncated: bool,
+    ):
+        """pdftotext reports truncation like pdfplumber, whatever it left behind."""
+
+        def blank(path: Path) -> Iterator[str]:
+            # No text, and more pages than the budget
+            return iter(["", "", ""])
+
+        def pdftotext(args: List[str], **kwargs: Any) -> subprocess.CompletedProcess:
+            assert args[:3] == ["pdftotext", "-l", "3"]
+            return subprocess.CompletedProcess(args, 0, stdout=stdout)
+
+        monkeypatch.setattr(extractors, "iter_pdf_pages", blank)
+        monkeypatch.setattr(extractors.subprocess, "run", pdftotext)
+
+        extractor = CVExtractor(pdf, max_pages=2)
+
+        assert extractor.text == text
+        assert extractor.truncated is truncated
@@ -0,0 +1,157 @@
+"""Tests for the output-format registry and the plain-text formats."""
+
+import threading
+from pathlib import Path
+
+import pytest
+from markdown_it import MarkdownIt
+
+from resume_ats import ResumeBuilder
+from resume_ats.core import load_resume
+from resume_ats.exceptions import BuildError
+from resume_ats.formats import FORMATS, OutputFormat, plan_formats
+from resume_ats.models import BuildConfig, ResumeData
+from resume_ats.plaintext import render_markdown, render_text
+
+ROOT = Path(__file__).parent.parent
+
+DATA = ResumeData(
+    basics={
+        "name": "Ann Poe",
+        "email": "ann@example.com",
+        "label": "SRE",
+        "location": {"city": "Paris", "countryCode": "FR"},
+        "summary": "Runs **Kubernetes** at scale.",
+    },
+    work=[
+        {
+            "company": "Acme",
+            "position": "SRE",
+            "startDate": "2020-01",
+            "highlights": ["Cut deploy time by **80%**"],
+        }
+    ],
+    skills=[{"name": "Ops", "keywords": ["Terraform", "Go"]}, "Python"],
+    languages=[{"language": "English", "fluency": "Native"}],
+)
+
+
+@pytest.mark.unit
+class TestPlainText:
+    """Text and Markdown come straight from the resume data."""
+
+    def test_text(self):
+        """Upper-case headings, bold markup dropped."""
+        text = render_text(DATA)
+
+        assert text.splitlines()[:3] == [
+            "Ann Poe",
+            "SRE",
+            "Paris, FR | ann@example.com",
+        ]
+        assert "SRE — Acme, 2020-01 – Present" in text
+        assert "- Cut deploy time by 80%" in text
+        assert "SKILLS\nOps: Terraform, Go\nPython" in text
+        assert "English (Native)" in text
+        assert "**" not in text
+
+    def test_markdown(self):
+        """Markdown headings keep the bold markup."""
+        markdown = render_markdown(DATA)
+
+        assert markdown.startswith("# Ann Poe\n")
+        assert "## Experience" in markdown
+        assert "Cut deploy time by **80%**" in markdown
+
+    def test_markdown_entries_are_separate_blocks(self):
+        """Entries do not run together into one Markdown paragraph."""
+        data = load_resume(ROOT / "resume.yml")
+        tokens = MarkdownIt().parse(render_markdown(data))
+
+        headings = [
+            tokens[i + 1].content
+            for i, t in enumerate(tokens)
+            if t.type == "heading_open" and t.tag == "h3"
+        ]
+        items = [
+            tokens[i + 2].content
+            for i, t in enumerate(tokens)
+            if t.type == "list_item_open"
+        ]
+        assert len(headings) == len(data.work)
+        assert headings[0].startswith(
+            f"{data.work[0].position} — {data.work[0].company}"
+        )
+        for edu in data.education:
+            assert any(item.startswith(edu.studyType) for item in items)
+        for ref in data.references:
+            assert f"{ref.name} — {ref.reference}" in items
+        assert len([item for item in items if ":" in item]) >= len(data.skills)
+        # Only the contact block uses hard line breaks
+        paragraphs = [t.content for t in tokens if t.type == "inline"]
+        assert [p for p in paragraphs if "\n" in p] == [paragraphs[1]]
+
+
+@pytest.mark.unit
+class TestRegistry:
+    """Formats are planned by dependency and built in parallel."""
+
+    def test_plan_adds_dependencies(self, monkeypatch: pytest.MonkeyPatch):
+        """Dependencies come first, unknown names are reported."""
+        monkeypatch.setitem(
+            FORMATS, "bundle", OutputFormat("bundle", lambda b: Path(), ["json"])
+        )
+
+        plan, unknown = plan_formats(["bundle", "txt", "nope", "json"])
+
+        assert [f.name for f in plan] == ["json", "bundle", "txt"]
+        assert unknown == ["nope"]
+
+    def test_cycle(self, monkeypatch: pytest.MonkeyPatch):
+        """A dependency cycle is an error."""
+        monkeypatch.setitem(FORMATS, "a", OutputFormat("a", lambda b: Path(), ["b"]))
+        monkeypatch.setitem(FORMATS, "b", OutputFormat("b", lambda b: Path(), ["a"]))
+
+        with pytest.raises(BuildError, match="a -> b -> a"):
+            plan_formats(["a"])
+
+    def test_build_all(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        """Independent formats overlap; dependent ones wait."""
+        both_started = threading.Barrier(2, timeout=5)
+        order = []
+
+        def slow(name: str, method: str):
+            def build(builder: ResumeBuilder) -> Path:
+                both_started.wait()
+                order.append(name)
+                return getattr(builder, method)()
+
+            return build
+
+        def bundle(builder: ResumeBuilder) -> Path:
+            order.append("bundle")
+            return builder.build_text()
+
+        monkeypatch.setitem(
+            FORMATS, "one", OutputFormat("one", slow("one", "build_json"))
+        )
+        monkeypatch.setitem(
+            FORMATS, "two", OutputFormat("two", slow("two", "build_html"))
+        )
+        monkeypatch.setitem(
+            FORMATS, "bundle", OutputFormat("bundle", bundle, ["one", "two"])
+        )
+        config = BuildConfig(
+            template_dir=ROOT / "templates",
+            output_dir=tmp_path / "out",
+            formats=["bundle", "markdown"],
+        )
+
+        results = ResumeBuilder.from_data(DATA, config).build_all()
+
+        assert list(results) == ["one", "two", "bundle", "markdown"]
+        assert order[-1] == "bundle"
+        assert (tmp_path / "out" / "resume.txt").read_text(encoding="utf-8") == (
+            render_text(DATA)
+        )
+        assert results["markdown"] == tmp_path / "out" / "resume.md"
@@ -0,0 +1,111 @@
+"""Tests for resumable batch builds."""
+
+import json
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from resume_ats import ResumeBuilder
+from resume_ats.core import iter_resumes
+from resume_ats.journal import BuildJournal, settings_digest
+from resume_ats.models import BatchItem, BuildConfig
+
+ROOT = Path(__file__).parent.parent
+
+
+def write_stream(path: Path, emails: List[str]) -> None:
+    """NDJSON stream with one resume per email."""
+    path.write_text(
+        "\n".join(
+            json.dumps({"basics": {"name": f"P {i}", "email": email}})
+            for i, email in enumerate(emails)
+        ),
+        encoding="utf-8",
+    )
+
+
+@pytest.mark.unit
+class TestBuildJournal:
+    """Completed documents are skipped when a batch resumes."""
+
+    @pytest.fixture
+    def config(self, tmp_path: Path) -> BuildConfig:
+        return BuildConfig(
+            template_dir=ROOT / "templates",
+            output_dir=tmp_path / "out",
+            formats=["json", "txt"],
+        )
+
+    def run(self, config: BuildConfig, source: Path, resume: bool) -> BuildJournal:
+        """One batch run; returns the closed journal."""
+        settings = settings_digest(config.formats, config.template_dir)
+        with BuildJournal(config.output_dir / "journal.jsonl", settings, resume) as j:
+            builder = ResumeBuilder(config)
+            for item in builder.build_stream(j.pending(iter_resumes(source))):
+                j.record(item)
+        return j
+
+    def test_resume_skips_unchanged(self, tmp_path: Path, config: BuildConfig):
+        """Only changed documents are rebuilt."""
+        source = tmp_path / "resumes.jsonl"
+        write_stream(source, ["a@x.com", "b@x.com", "c@x.com"])
+        first = self.run(config, source, resume=False)
+        assert first.skipped == 0
+        assert all(e.duration > 0 and e.digest for e in first.entries.values())
+
+        write_stream(source, ["a@x.com", "changed@x.com", "c@x.com"])
+        second = self.run(config, source, resume=True)
+
+        assert second.skipped == 2
+        lines = (config.output_dir / "journal.jsonl").read_text().splitlines()
+        assert [BatchItem.model_validate_json(line).index for line in lines] == [
+            0,
+            1,
+            2,
+            1,
+        ]
+        data = json.loads(
+            (config.output_dir / "000001_P_1" / "resume.json").read_text()
+        )
+        assert data["basics"]["email"] == "changed@x.com"
+
+    def test_retries_failures_and_missing_outputs(
+        self, tmp_path: Path, config: BuildConfig
+    ):
+        """Failed entries and deleted outputs are rebuilt."""
+        source = tmp_path / "resumes.jsonl"
+        write_stream(source, ["a@x.com", "b@x.com"])
+        first = self.run(config, source, resume=False)
+
+        journal = config.output_dir / "journal.jsonl"
+        failed = first.entries[0].model_copy(update={"error": "xelatex crashed"})
+        with journal.open("a", encoding="utf-8") as f:
+            f.write(failed.model_dump_json() + "\n")
+            f.write('{"index": 1, "na')  # Torn write
+        Path(first.entries[1].outputs["txt"]).unlink()
+
+        second = self.run(config, source, resume=True)
+
+        assert second.skipped == 0
+        assert second.entries[0].error is None
+
+    def test_settings_change_rebuilds(self, tmp_path: Path, config: BuildConfig):
+        """Other formats give other digests."""
+        source = tmp_path / "resumes.jsonl"
+        write_stream(source, ["a@x.com"])
+        self.run(config, source, resume=False)
+
+        config.formats = ["json"]
+        assert self.run(config, source, resume=True).skipped == 0
+
+    def test_fresh_run_resets_journal(self, tmp_path: Path, config: BuildConfig):
+        """Without resume, everything is rebuilt and the journal restarts."""
+        source = tmp_path / "resumes.jsonl"
+        write_stream(source, ["a@x.com"])
+        self.run(config, source, resume=False)
+
+        journal = self.run(config, source, resume=False)
+
+        assert journal.skipped == 0
+        assert len((config.output_dir / "journal.jsonl").read_text().splitlines()) == 1
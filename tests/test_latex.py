@@ -0,0 +1,185 @@
+"""Tests for the resource-bounded LaTeX runner."""
+
+import os
+import sys
+import textwrap
+import time
+from pathlib import Path
+
+import pytest
+
+from resume_ats import ResumeBuilder
+from resume_ats.exceptions import CompilationError
+from resume_ats.latex import LatexRunner, describe_failure
+from resume_ats.models import BuildConfig, CompileResult, LatexDiagnostic, ResumeData
+
+ROOT = Path(__file__).parent.parent
+
+
+def fake_engine(tmp_path: Path, body: str) -> LatexRunner:
+    """Runner whose engine is a Python script standing in for XeLaTeX."""
+    script = tmp_path / "engine.py"
+    script.write_text(textwrap.dedent(body), encoding="utf-8")
+    (tmp_path / "resume.tex").write_text("", encoding="utf-8")
+    return LatexRunner(engine=(sys.executable, str(script)), timeout=5)
+
+
+@pytest.mark.unit
+class TestLatexRunner:
+    """Timeouts, early aborts and diagnostics."""
+
+    def test_success(self, tmp_path: Path):
+        """A clean run reports its exit code and output tail."""
+        runner = fake_engine(
+            tmp_path, "print('Output written on resume.xdv (2 pages, 10324 bytes).')"
+        )
+
+        result = runner.run(tmp_path / "resume.tex")
+
+        assert result.success
+        assert result.pages == 2
+        assert len(result.log_tail) == 1
+
+    def test_aborts_at_first_error(self, tmp_path: Path):
+        """The run is killed as soon as the error and its line are known."""
+        runner = fake_engine(
+            tmp_path,
+            """
+            import sys, time
+            print("! Undefined control sequence.")
+            print("l.12 \\\\foo")
+            sys.stdout.flush()
+            time.sleep(30)
+            """,
+        )
+
+        start = time.perf_counter()
+        result = runner.run(tmp_path / "resume.tex")
+
+        assert time.perf_counter() - start < 5
+        assert result.aborted and not result.success
+        assert result.diagnostics[0].message == "Undefined control sequence."
+        assert result.diagnostics[0].line == 12
+        assert "line 12" in describe_failure(result)
+
+    @pytest.mark.skipif(not sys.platform.startswith("linux"), reason="prlimit")
+    def test_rlimits_reach_the_engine(self, tmp_path: Path):
+        """CPU and address-space limits are applied to the running engine."""
+        runner = fake_engine(
+            tmp_path,
+            """
+            import resource, time
+            deadline = time.monotonic() + 4
+            while time.monotonic() < deadline:
+                cpu = resource.getrlimit(resource.RLIMIT_CPU)
+                memory = resource.getrlimit(resource.RLIMIT_AS)
+                if cpu[0] != resource.RLIM_INFINITY:
+                    break
+                time.sleep(0.01)
+            print(*cpu, *memory)
+            """,
+        )
+        runner.cpu_seconds = 30
+        runner.memory_bytes = 2 << 30
+
+        result = runner.run(tmp_path / "resume.tex")
+
+        assert result.log_tail == [f"30 35 {2 << 30} {2 << 30}"]
+
+    def test_timeout_kills_process_group(self, tmp_path: Path):
+        """A hung engine and the children it spawned are killed."""
+        runner = fake_engine(
+            tmp_path,
+            """
+            import subprocess, sys, time
+            child = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)"])
+            open("child.pid", "w").write(str(child.pid))
+            time.sleep(30)
+            """,
+        )
+        runner.timeout = 1
+
+        result = runner.run(tmp_path / "resume.tex")
+
+        assert result.timed_out and result.returncode is None
+        assert "timed out after 1s" in describe_failure(result)
+        pid = int((tmp_path / "child.pid").read_text())
+        for _ in range(50):
+            try:
+                os.kill(pid, 0)
+            except ProcessLookupError:
+                break
+            time.sleep(0.1)
+        else:
+            pytest.fail("engine child survived the timeout")
+
+    def test_missing_engine(self, tmp_path: Path):
+        """A missing engine raises FileNotFoundError."""
+        runner = LatexRunner(engine=("definitely-not-xelatex",))
+
+        with pytest.raises(FileNotFoundError):
+            runner.run(tmp_path / "resume.tex")
+
+
+@pytest.mark.unit
+class TestLatexCheck:
+    """The XDV-only check gates the full PDF build."""
+
+    @pytest.fixture
+    def builder(self, tmp_path: Path) -> ResumeBuilder:
+        """Builder with the LaTeX check enabled."""
+        config = BuildConfig(
+            template_dir=ROOT / "templates",
+            output_dir=tmp_path / "build",
+            check_latex=True,
+        )
+        return ResumeBuilder.from_data(
+            ResumeData(basics={"name": "Ann Poe", "email": "a@example.com"}), config
+        )
+
+    def fake_runner(self, monkeypatch: pytest.MonkeyPatch, result: CompileResult):
+        """Replace the engine with one returning a fixed result."""
+        calls = []
+
+        class FakeRunner:
+            def __init__(self, timeout: float, options=()):
+                self.timeout = timeout
+                self.options = list(options)
+
+            def run(self, tex_path: Path) -> CompileResult:
+                assert "\\begin{document}" in tex_path.read_text(encoding="utf-8")
+                calls.append(self.options)
+                return result
+
+        monkeypatch.setattr("resume_ats.core.LatexRunner", FakeRunner)
+        return calls
+
+    def test_failed_check_skips_pdf(
+        self, builder: ResumeBuilder, monkeypatch: pytest.MonkeyPatch
+    ):
+        """A failing check raises before the full compile runs."""
+        failed = CompileResult(
+            returncode=1,
+            diagnostics=[LatexDiagnostic(message="Undefined control sequence.")],
+        )
+        calls = self.fake_runner(monkeypatch, failed)
+        monkeypatch.setattr(
+            builder, "build_pdf", lambda: pytest.fail("PDF built after failed check")
+        )
+
+        with pytest.raises(CompilationError) as error:
+            builder.build_all()
+
+        assert calls == [["-interaction=nonstopmode", "-halt-on-error", "-no-pdf"]]
+        assert error.value.diagnostics == failed.diagnostics
+
+    def test_check_reports_pages(
+        self, builder: ResumeBuilder, monkeypatch: pytest.MonkeyPatch
+    ):
+        """A standalone check runs in a scratch dir and cleans it up."""
+        self.fake_runner(monkeypatch, CompileResult(returncode=0, pages=1))
+
+        result = builder.check_latex()
+
+        assert result.success and result.pages == 1
+        assert not list(builder.config.output_dir.glob(".build-*"))
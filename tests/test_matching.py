@@ -0,0 +1,79 @@
+"""Tests for job-description matching."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("numpy")
+pytest.importorskip("scipy")
+
+from resume_ats.matching import JobIndex  # noqa: E402
+from resume_ats.models import CVData, JobPosting, ResumeData  # noqa: E402
+
+POSTINGS = [
+    JobPosting(
+        id="k8s",
+        title="Platform Engineer",
+        text="Run k8s clusters with Terraform and Helm. Prometheus monitoring.",
+    ),
+    JobPosting(
+        id="java",
+        title="Backend Developer",
+        text="Java and Spring services, PostgreSQL, Kafka streaming.",
+    ),
+    JobPosting(
+        id="data",
+        title="Data Scientist",
+        text="Machine learning with Python, pandas and statistics.",
+    ),
+]
+
+
+@pytest.mark.unit
+class TestJobIndex:
+    """Unit tests for JobIndex."""
+
+    @pytest.fixture
+    def resume(self) -> ResumeData:
+        """DevOps resume."""
+        return ResumeData(
+            basics={"name": "Test User", "email": "t@e.st", "label": "DevOps"},
+            skills=[{"name": "Ops", "keywords": ["Kubernetes", "Terraform", "Python"]}],
+        )
+
+    def test_ranks_best_posting_first(self, resume: ResumeData):
+        """The posting sharing the most skills ranks first."""
+        index = JobIndex.build(POSTINGS)
+        matches = index.score(resume, top_k=2)
+
+        assert [m.id for m in matches] == ["k8s", "data"]
+        assert matches[0].score > matches[1].score
+        assert set(matches[0].matching) == {"kubernetes", "terraform"}
+        assert set(matches[0].missing) == {"helm", "prometheus", "monitoring"}
+
+    def test_scores_extracted_cv_data(self):
+        """Data extracted from a PDF can be matched too."""
+        index = JobIndex.build(POSTINGS)
+        cv = CVData(name="X", email="x@y.z", position="", skills=["java", "spring"])
+
+        assert index.score(cv, top_k=1)[0].id == "java"
+
+    def test_index_is_cached_on_disk(self, tmp_path: Path, resume: ResumeData):
+        """The matrix is built once per corpus and reloaded from the cache."""
+        corpus = tmp_path / "jobs.jsonl"
+        corpus.write_text(
+            "\n".join(p.model_dump_json() for p in POSTINGS), encoding="utf-8"
+        )
+        cache = tmp_path / "cache"
+
+        built = JobIndex.load(corpus, cache=cache)
+        (entry,) = cache.iterdir()
+        meta = json.loads((entry / "meta.json").read_text(encoding="utf-8"))
+        assert meta["ids"] == ["k8s", "java", "data"]
+
+        loaded = JobIndex.load(corpus, cache=cache)
+        assert loaded.terms == built.terms
+        assert [m.id for m in loaded.score(resume)] == [
+            m.id for m in built.score(resume)
+        ]
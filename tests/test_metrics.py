@@ -0,0 +1,120 @@
+"""Tests for the OpenMetrics instrumentation."""
+
+import urllib.request
+from pathlib import Path
+
+import pytest
+
+from resume_ats import ResumeBuilder, metrics
+from resume_ats.models import BuildConfig, ResumeData
+
+ROOT = Path(__file__).parent.parent
+
+
+@pytest.fixture
+def registry() -> metrics.Registry:
+    """Enabled private registry."""
+    registry = metrics.Registry()
+    metrics.enable(registry)
+    return registry
+
+
+@pytest.fixture
+def enabled():
+    """Enable the process-wide registry for one test."""
+    metrics.enable()
+    yield metrics.REGISTRY
+    metrics.REGISTRY.enabled = False
+
+
+@pytest.mark.unit
+class TestMetrics:
+    """Exposition format and instrumentation."""
+
+    def test_disabled_metrics_record_nothing(self):
+        """A disabled registry ignores observations."""
+        registry = metrics.Registry()
+        counter = metrics.Counter("jobs", "Jobs.", ("state",), registry=registry)
+        histogram = metrics.Histogram("wait_seconds", "Wait.", registry=registry)
+
+        counter.inc("done")
+        with histogram.time():
+            pass
+
+        assert counter.values == {} and histogram.values == {}
+
+    def test_openmetrics_text(self, registry: metrics.Registry):
+        """Counters, gauges and cumulative histogram buckets are rendered."""
+        counter = metrics.Counter("jobs", "Jobs.", ("state",), registry=registry)
+        gauge = metrics.Gauge("depth", "Depth.", registry=registry)
+        histogram = metrics.Histogram(
+            "wait_seconds", "Wait.", ("queue",), buckets=(0.1, 1), registry=registry
+        )
+
+        counter.inc("done")
+        counter.inc("done", amount=2)
+        gauge.set(4)
+        histogram.observe(0.05, "a")
+        histogram.observe(0.5, "a")
+        histogram.observe(5, "a")
+
+        text = registry.render()
+        assert (
+            '# TYPE jobs counter\n# HELP jobs Jobs.\njobs_total{state="done"} 3' in text
+        )
+        assert "depth 4" in text
+        assert 'wait_seconds_bucket{queue="a",le="0.1"} 1' in text
+        assert 'wait_seconds_bucket{queue="a",le="1"} 2' in text
+        assert 'wait_seconds_bucket{queue="a",le="+Inf"} 3' in text
+        assert 'wait_seconds_count{queue="a"} 3' in text
+        assert 'wait_seconds_sum{queue="a"} 5.55' in text
+        assert text.endswith("# EOF\n")
+
+    def test_drain_and_merge(self, registry: metrics.Registry):
+        """Values drained in one registry are added to another."""
+        worker = metrics.Registry()
+        metrics.enable(worker)
+        for target in (registry, worker):
+            metrics.Counter("jobs", "Jobs.", ("state",), registry=target)
+            metrics.Gauge("depth", "Depth.", registry=target)
+            metrics.Histogram("wait_seconds", "Wait.", buckets=(1,), registry=target)
+        counter, gauge, histogram = registry.metrics
+        counter.inc("done")
+        histogram.observe(0.5)
+        worker.metrics[0].inc("done", amount=2)
+        worker.metrics[1].set(7)
+        worker.metrics[2].observe(5)
+
+        registry.merge(worker.drain())
+
+        assert counter.values == {("done",): 3}
+        assert gauge.values == {(): 7}
+        assert histogram.values == {(): ([1, 1], 5.5)}
+        assert worker.drain() == {}
+
+    def test_build_is_instrumented(self, tmp_path: Path, enabled: metrics.Registry):
+        """Builds and renders are counted and served over HTTP."""
+        config = BuildConfig(
+            template_dir=ROOT / "templates",
+            output_dir=tmp_path,
+            formats=["html", "json", "doc"],
+        )
+        data = ResumeData(basics={"name": "Ann Poe", "email": "a@example.com"})
+        ResumeBuilder.from_data(data, config).build_all()
+
+        server = metrics.serve(0)
+        try:
+            url = f"http://127.0.0.1:{server.server_address[1]}/metrics"
+            with urllib.request.urlopen(url) as response:
+                text = response.read().decode("utf-8")
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        assert 'resume_builds_total{format="html",outcome="success"}' in text
+        assert 'resume_builds_total{format="doc",outcome="unknown"}' in text
+        assert 'resume_render_duration_seconds_count{template="simple.html.j2"}' in text
+
+        textfile = tmp_path / "resume.prom"
+        metrics.write_textfile(textfile)
+        assert textfile.read_text(encoding="utf-8").endswith("# EOF\n")
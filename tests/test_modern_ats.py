@@ -1,5 +1,6 @@
 """Modern ATS compatibility tests using the new package structure."""
 
+import io
 from pathlib import Path
 from typing import Dict
 
@@ -8,7 +9,7 @@ import yaml
 
 from resume_ats import CVExtractor, ResumeBuilder
 from resume_ats.exceptions import ExtractionError
-from resume_ats.models import BuildConfig, ResumeData
+from resume_ats.models import BuildConfig, CVData, ResumeData
 
 
 class TestResumeBuilder:
@@ -67,6 +68,62 @@ class TestResumeBuilder:
         result = builder.render_template("test.txt")
         assert result == "Hello Test User!"
 
+    def test_write_template_streams_models(self, temp_yaml_file: Path, tmp_path: Path):
+        """Test streaming rendering matches render_template without dumping data."""
+        template_dir = tmp_path / "templates"
+        template_dir.mkdir()
+        (template_dir / "test.txt").write_text(
+            "{% for s in skills %}{{ s }};{% endfor %}{{ basics.name }}"
+            "{% if basics is mapping %} (dict){% endif %}"
+        )
+
+        config = BuildConfig(template_dir=template_dir)
+        builder = ResumeBuilder.from_yaml(temp_yaml_file, config)
+        output = io.StringIO()
+        builder.write_template("test.txt", output)
+
+        assert output.getvalue() == "Python;Docker;Kubernetes;Test User"
+        assert "".join(builder.stream_template("test.txt")) == output.getvalue()
+        assert builder.render_template("test.txt") == output.getvalue()
+
+        target = tmp_path / "out.txt"
+        builder.write_template("test.txt", target)
+        assert target.read_text(encoding="utf-8") == output.getvalue()
+
+    def test_build_all_validates_pdf_in_process(
+        self, temp_yaml_file: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test --validate checks the PDF against the in-memory resume data."""
+        config = BuildConfig(
+            output_dir=tmp_path / "output",
+            formats=["pdf", "json"],
+            validate_output=True,
+        )
+        builder = ResumeBuilder.from_yaml(temp_yaml_file, config)
+        pdf_path = tmp_path / "output" / "Test_User_CV.pdf"
+        monkeypatch.setattr(builder, "build_pdf", lambda: pdf_path)
+
+        class FakeExtractor:
+            def __init__(self, path: Path):
+                assert path == pdf_path
+                self.timings = {"text": 0.0}
+
+            def extract_all(self) -> CVData:
+                return CVData(
+                    name="Test User",
+                    email="test@example.com",
+                    position="DevOps Engineer",
+                    skills=["python", "docker", "kubernetes"],
+                )
+
+        monkeypatch.setattr("resume_ats.validation.CVExtractor", FakeExtractor)
+        results = builder.build_all()
+
+        assert set(results) == {"pdf", "json"}
+        report = builder.validation_reports["pdf"]
+        assert report.passed
+        assert all(m.match_type == "exact" for m in report.skills)
+
 
 @pytest.mark.ats
 class TestATSCompatibility:
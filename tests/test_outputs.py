@@ -0,0 +1,83 @@
+"""Tests for concurrent builds into one output directory."""
+
+import json
+import threading
+from pathlib import Path
+
+import pytest
+
+from resume_ats import ResumeBuilder
+from resume_ats.models import BuildConfig, ResumeData
+from resume_ats.outputs import ScratchDir, clean_output_dir
+
+ROOT = Path(__file__).parent.parent
+
+
+def builder_for(name: str, output_dir: Path) -> ResumeBuilder:
+    """Builder for a minimal resume."""
+    config = BuildConfig(
+        template_dir=ROOT / "templates",
+        output_dir=output_dir,
+        formats=["html", "json"],
+    )
+    data = ResumeData(basics={"name": name, "email": "a@example.com"})
+    return ResumeBuilder.from_data(data, config)
+
+
+@pytest.mark.unit
+class TestOutputDir:
+    """Scratch directories, cleaning and atomic publishing."""
+
+    def test_publish_moves_files_out_of_scratch(self, tmp_path: Path):
+        """Published trees land in the output dir and the scratch dir goes away."""
+        with ScratchDir(tmp_path) as scratch:
+            (scratch.path / "logos").mkdir()
+            (scratch.path / "logos" / "a.png").write_bytes(b"png")
+            (scratch.path / "resume.pdf").write_bytes(b"%PDF")
+
+            scratch.publish("logos")
+            final = scratch.publish("resume.pdf", "Ann_CV.pdf")
+
+        assert final.read_bytes() == b"%PDF"
+        assert (tmp_path / "logos" / "a.png").read_bytes() == b"png"
+        assert not scratch.path.exists()
+
+    def test_clean_keeps_running_builds(self, tmp_path: Path):
+        """Cleaning removes outputs and abandoned scratch dirs only."""
+        (tmp_path / "old.pdf").write_bytes(b"old")
+        abandoned = tmp_path / ".build-crashed"
+        abandoned.mkdir()
+        (abandoned / ".lock").touch()
+
+        with ScratchDir(tmp_path) as scratch:
+            clean_output_dir(tmp_path)
+
+            assert scratch.path.is_dir()
+            assert not abandoned.exists()
+            assert not (tmp_path / "old.pdf").exists()
+
+    def test_concurrent_builds_into_same_directory(self, tmp_path: Path):
+        """Parallel cleaning builds leave complete outputs and no scratch dirs."""
+        output = tmp_path / "build"
+        errors = []
+
+        def build(name: str) -> None:
+            try:
+                for _ in range(5):
+                    builder_for(name, output).build_all()
+            except Exception as e:  # pragma: no cover - reported below
+                errors.append(e)
+
+        threads = [
+            threading.Thread(target=build, args=(name,)) for name in ("Ann", "Bob")
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        data = json.loads((output / "resume.json").read_text(encoding="utf-8"))
+        assert data["basics"]["name"] in {"Ann", "Bob"}
+        assert "</html>" in (output / "index.html").read_text(encoding="utf-8")
+        assert not list(output.glob(".build-*"))
@@ -0,0 +1,73 @@
+"""Tests for PDF post-processing."""
+
+from pathlib import Path
+
+import pytest
+
+from resume_ats import pdfopt
+from resume_ats.exceptions import BuildError
+
+
+@pytest.mark.unit
+class TestOptimizePdf:
+    """Backend selection and caching; the backends themselves are external."""
+
+    @pytest.fixture
+    def pdf(self, tmp_path: Path) -> Path:
+        """Stand-in for a compiled PDF."""
+        path = tmp_path / "resume.pdf"
+        path.write_bytes(b"%PDF-1.5 " + b"x" * 1000)
+        return path
+
+    def test_missing_backend(self, pdf: Path, monkeypatch: pytest.MonkeyPatch):
+        """Without pikepdf or qpdf the error names both."""
+        monkeypatch.setattr(pdfopt, "available_backend", lambda: None)
+
+        with pytest.raises(BuildError, match="pikepdf.*qpdf"):
+            pdfopt.optimize_pdf(pdf, cache=pdf.parent / "cache")
+
+    def test_result_is_cached(
+        self, pdf: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Identical input reuses the cached output instead of rewriting."""
+        calls = []
+
+        def fake_qpdf(source: Path, destination: Path) -> None:
+            calls.append(source)
+            destination.write_bytes(b"%PDF-1.5 linearized")
+
+        monkeypatch.setattr(pdfopt, "available_backend", lambda: "qpdf")
+        monkeypatch.setattr(pdfopt, "_optimize_with_qpdf", fake_qpdf)
+        cache = tmp_path / "cache"
+        cache.mkdir()
+        original = pdf.read_bytes()
+
+        first = pdfopt.optimize_pdf(pdf, cache=cache)
+        assert first.size_before == 1009 and first.size_after == 19
+        assert not first.cached
+
+        pdf.write_bytes(original)
+        out = tmp_path / "out.pdf"
+        second = pdfopt.optimize_pdf(pdf, out, cache=cache)
+
+        assert second.cached and len(calls) == 1
+        assert out.read_bytes() == b"%PDF-1.5 linearized"
+        assert pdf.read_bytes() == original
+
+    def test_backend_failure_leaves_no_temp_files(
+        self, pdf: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        """A failing backend raises BuildError and leaves the cache clean."""
+
+        def broken(source: Path, destination: Path) -> None:
+            destination.write_bytes(b"partial")
+            raise RuntimeError("damaged xref")
+
+        monkeypatch.setattr(pdfopt, "available_backend", lambda: "pikepdf")
+        monkeypatch.setattr(pdfopt, "_optimize_with_pikepdf", broken)
+        cache = tmp_path / "cache"
+        cache.mkdir()
+
+        with pytest.raises(BuildError, match="damaged xref"):
+            pdfopt.optimize_pdf(pdf, cache=cache)
+        assert list(cache.iterdir()) == []
@@ -0,0 +1,58 @@
+"""Tests for the pre-warmed worker pool."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from resume_ats import metrics
+from resume_ats.models import BuildConfig, ResumeData
+from resume_ats.pool import WarmPool
+
+ROOT = Path(__file__).parent.parent
+
+
+@pytest.mark.unit
+class TestWarmPool:
+    """Batch builds on forked workers."""
+
+    def test_build_stream_keeps_order(self, tmp_path: Path):
+        """Results come back in stream order, across recycled workers."""
+        config = BuildConfig(
+            template_dir=ROOT / "templates", output_dir=tmp_path, formats=["json"]
+        )
+        resumes = [
+            (i, ResumeData(basics={"name": f"User {i}", "email": "a@example.com"}))
+            for i in range(7)
+        ]
+
+        with WarmPool(ROOT / "templates", processes=2, max_jobs_per_worker=2) as pool:
+            items = list(pool.build_stream(iter(resumes), config))
+
+        assert [item.index for item in items] == list(range(7))
+        for item in items:
+            assert item.error is None
+            data = json.loads(Path(item.outputs["json"]).read_text(encoding="utf-8"))
+            assert data["basics"]["name"] == item.name
+
+    def test_worker_metrics_reach_the_parent(self, tmp_path: Path):
+        """Builds recorded in the workers are merged into the parent registry."""
+        config = BuildConfig(
+            template_dir=ROOT / "templates", output_dir=tmp_path, formats=["html"]
+        )
+        resumes = [
+            (i, ResumeData(basics={"name": f"User {i}", "email": "a@example.com"}))
+            for i in range(5)
+        ]
+        metrics.enable()
+        metrics.REGISTRY.drain()
+        try:
+            with WarmPool(ROOT / "templates", processes=2) as pool:
+                list(pool.build_stream(iter(resumes), config))
+            snapshot = metrics.REGISTRY.drain()
+        finally:
+            metrics.REGISTRY.enabled = False
+
+        assert snapshot["resume_builds"] == {("html", "success"): 5}
+        (counts, _), *_ = snapshot["resume_render_duration_seconds"].values()
+        assert sum(counts) == 5
@@ -0,0 +1,69 @@
+"""Tests for the PDF-free ATS precheck."""
+
+from pathlib import Path
+
+import pytest
+
+from resume_ats import ResumeBuilder
+from resume_ats.models import BuildConfig
+from resume_ats.precheck import latex_to_text, precheck, render_ats_text
+
+ROOT = Path(__file__).parent.parent
+
+
+@pytest.mark.unit
+class TestLatexToText:
+    """Unit tests for the LaTeX to ATS text conversion."""
+
+    def test_header_and_escapes(self):
+        """Header fields come first and filter escapes are undone."""
+        tex = r"""
+\name{Jane}{Doe}
+\address{Paris}
+\email{jane@example.com}
+\begin{document}
+\makecvheader[C]
+\vspace{1mm}
+{\color{accent}\rule{\linewidth}{2pt}}
+\begin{itemize}[leftmargin=0.6em]
+\item {\color{textdark}\small \textbf{R\&D} at 100\% with \href{https://x.y}{https://x.y}}
+\end{itemize}
+\end{document}
+"""
+        text = latex_to_text(tex)
+
+        assert text.splitlines() == [
+            "Jane Doe",
+            "Paris",
+            "jane@example.com",
+            "R&D at 100% with https://x.y",
+        ]
+
+
+@pytest.mark.ats
+class TestPrecheck:
+    """Precheck against the real templates and resume."""
+
+    @pytest.fixture
+    def builder(self) -> ResumeBuilder:
+        """Builder loaded with the repository resume."""
+        resume_path = ROOT / "resume.yml"
+        if not resume_path.exists():
+            pytest.skip("resume.yml not found")
+        config = BuildConfig(template_dir=ROOT / "templates")
+        return ResumeBuilder.from_yaml(resume_path, config)
+
+    def test_rendered_text_has_no_latex(self, builder: ResumeBuilder):
+        """The predicted text contains no LaTeX markup."""
+        text = render_ats_text(builder)
+
+        assert text.startswith(builder.data.basics.name)
+        assert "\\" not in text
+        assert "**" not in text
+
+    def test_precheck_predicts_pass(self, builder: ResumeBuilder):
+        """The precheck validates the resume fields without a PDF."""
+        report = precheck(builder)
+
+        assert report.passed, report.fields
+        assert {"render", "name", "skills"} <= set(report.timings)
@@ -0,0 +1,183 @@
+"""Tests for the LaTeX package and font preflight."""
+
+import json
+from pathlib import Path
+from typing import List, Sequence
+
+import pytest
+from typer.testing import CliRunner
+
+from resume_ats import ResumeBuilder, preflight
+from resume_ats.cli import app
+from resume_ats.core import iter_resumes
+from resume_ats.exceptions import PreflightError
+from resume_ats.models import BuildConfig
+
+ROOT = Path(__file__).parent.parent
+
+
+@pytest.fixture
+def tex(monkeypatch: pytest.MonkeyPatch) -> List[Sequence[str]]:
+    """Fake TeX installation with every file but the FontAwesome fonts."""
+    calls: List[Sequence[str]] = []
+
+    def run(args: Sequence[str]) -> str:
+        calls.append(list(args))
+        if args[0] == "kpsewhich":
+            names = [a for a in args[1:] if "FontAwesome" not in a]
+            return "".join(f"/texmf/{name}\n" for name in names)
+        if args[0] == "fc-list":
+            return "Inter,Inter Regular\t/fonts/Inter.ttf\n"
+        return ""
+
+    monkeypatch.setattr(preflight, "_run", run)
+    monkeypatch.setattr(preflight, "installation_key", lambda: "texlive-test")
+    monkeypatch.setattr(preflight, "_verified", set())
+    return calls
+
+
+@pytest.mark.unit
+class TestRequirements:
+    """Requirements are read from the template files."""
+
+    def test_template_requirements(self):
+        """Packages, including comma lists, and the fonts they load."""
+        names = [r.name for r in preflight.requirements(ROOT / "templates")]
+
+        assert names[0] == "array.sty"
+        for name in ("fontspec.sty", "graphicx.sty", "Roboto-Regular.otf"):
+            assert name in names
+        assert "FontAwesome5Free-Solid-900.otf" in names
+        assert len(names) == len(set(names))
+
+    def test_fontspec_and_comments(self, tmp_path: Path):
+        """Fontspec families are fonts; commented-out lines are ignored."""
+        (tmp_path / "awesomecv.tex.j2").write_text(
+            "\\usepackage[quiet]{fontspec}\n"
+            "% \\usepackage{unused}\n"
+            "\\setmainfont[Scale=0.9]{Inter}\n"
+            "\\newfontfamily\\mono{ {{- font -}} }\n",
+            encoding="utf-8",
+        )
+
+        requirements = preflight.requirements(tmp_path)
+
+        assert [(r.kind, r.name) for r in requirements] == [
+            ("package", "fontspec.sty"),
+            ("font", "Inter"),
+        ]
+
+
+@pytest.mark.unit
+class TestPreflight:
+    """Resolution, caching and failing fast."""
+
+    def test_resolves_and_caches(self, tmp_path: Path, tex: List[Sequence[str]]):
+        """One kpsewhich call resolves the files; a rerun uses the cache."""
+        templates = ROOT / "templates"
+        report = preflight.preflight(templates, cache=tmp_path)
+
+        assert [r.name for r in report.missing] == [
+            "FontAwesome5Free-Solid-900.otf",
+            "FontAwesome5Brands-Regular-400.otf",
+        ]
+        assert report.cached == 0
+        assert [c[0] for c in tex] == ["kpsewhich"]
+        cached = json.loads((tmp_path / "texlive-test.json").read_text())
+        assert cached["fontspec.sty"] == "/texmf/fontspec.sty"
+        assert "FontAwesome5Free-Solid-900.otf" not in cached
+
+        tex.clear()
+        again = preflight.preflight(templates, cache=tmp_path)
+
+        # Only the missing fonts are looked up again
+        assert tex == [["kpsewhich", *(r.name for r in report.missing)]]
+        assert again.cached == len(report.requirements) - 2
+
+    def test_font_families(self, tmp_path: Path, tex: List[Sequence[str]], monkeypatch):
+        """Bare family names are resolved with fontconfig."""
+        (tmp_path / "awesomecv.tex.j2").write_text(
+            "\\setmainfont{inter}\\setsansfont{Nope Sans}", encoding="utf-8"
+        )
+        monkeypatch.setattr(preflight.shutil, "which", lambda name: name)
+
+        report = preflight.preflight(tmp_path, cache=tmp_path)
+
+        assert [(r.name, r.path) for r in report.requirements] == [
+            ("inter", "/fonts/Inter.ttf"),
+            ("Nope Sans", None),
+        ]
+
+    def test_missing_fails_batch_before_building(
+        self, tmp_path: Path, tex: List[Sequence[str]], monkeypatch
+    ):
+        """The stream raises before the first resume is built."""
+        monkeypatch.setenv("RESUME_ATS_CACHE_DIR", str(tmp_path / "cache"))
+        config = BuildConfig(
+            template_dir=ROOT / "templates",
+            output_dir=tmp_path / "out",
+            preflight=True,
+        )
+        builder = ResumeBuilder(config)
+        monkeypatch.setattr(builder, "build_all", lambda: pytest.fail("built"))
+        source = tmp_path / "resumes.jsonl"
+        source.write_text(
+            json.dumps({"basics": {"name": "Ann Poe", "email": "a@example.com"}}),
+            encoding="utf-8",
+        )
+
+        with pytest.raises(PreflightError, match="FontAwesome5Free-Solid-900.otf"):
+            next(builder.build_stream(iter_resumes(source)))
+
+    def test_success_is_remembered(
+        self, tmp_path: Path, tex: List[Sequence[str]], monkeypatch
+    ):
+        """Once passed, later checks in the process run no command."""
+        monkeypatch.setenv("RESUME_ATS_CACHE_DIR", str(tmp_path / "cache"))
+        (tmp_path / "awesomecv.tex.j2").write_text(
+            "\\usepackage{fontspec}", encoding="utf-8"
+        )
+
+        preflight.require_preflight(tmp_path)
+        tex.clear()
+        preflight.require_preflight(tmp_path)
+
+        assert tex == []
+
+    def test_no_installation(self, monkeypatch: pytest.MonkeyPatch):
+        """Without xelatex and kpsewhich the preflight fails clearly."""
+        monkeypatch.setattr(preflight.shutil, "which", lambda name: None)
+
+        with pytest.raises(PreflightError, match="TeX installation not found"):
+            preflight.installation_key()
+
+
+@pytest.mark.unit
+class TestCommands:
+    """The CLI only requires TeX for PDF builds."""
+
+    @pytest.mark.parametrize("flags", [[], ["--preflight"]])
+    def test_html_build_without_tex(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, flags: List[str]
+    ):
+        """An HTML-only build runs no preflight, even when asked for one."""
+        monkeypatch.setattr(preflight.shutil, "which", lambda name: None)
+        monkeypatch.setattr(preflight, "_verified", set())
+
+        result = CliRunner().invoke(
+            app,
+            [
+                "build",
+                str(ROOT / "resume.yml"),
+                "--format",
+                "html",
+                "--templates",
+                str(ROOT / "templates"),
+                "--output",
+                str(tmp_path),
+                *flags,
+            ],
+        )
+
+        assert result.exit_code == 0, result.output
+        assert list(tmp_path.glob("*.html"))
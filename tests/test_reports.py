@@ -0,0 +1,140 @@
+"""Tests for machine-readable validation reports."""
+
+import json
+import xml.etree.ElementTree as ET
+from pathlib import Path
+from typing import List
+
+import pytest
+from conftest import make_pdf
+from typer.testing import CliRunner
+
+from resume_ats.cli import app
+from resume_ats.models import FieldResult, ValidationReport
+from resume_ats.reports import ReportWriter
+
+RESUME = Path(__file__).parent.parent / "resume.yml"
+
+
+@pytest.mark.unit
+class TestReportWriter:
+    """Unit tests for ReportWriter."""
+
+    @pytest.fixture
+    def report(self) -> ValidationReport:
+        """Report with one failing field and timings."""
+        return ValidationReport(
+            source="build/Test_User_CV.pdf",
+            fields=[
+                FieldResult(name="Name", expected="A", found="A", passed=True),
+                FieldResult(name="Email", expected="a@b.c", found="", passed=False),
+            ],
+            skills_expected=4,
+            skills_found=3,
+            skills_matched=2,
+            coverage=0.5,
+            passed=False,
+            timings={"text": 0.25, "name": 0.001, "email": 0.002},
+        )
+
+    def test_jsonl_appends_across_runs(self, report: ValidationReport, tmp_path: Path):
+        """Each run appends its reports to the same JSON Lines file."""
+        path = tmp_path / "fleet.jsonl"
+        for _ in range(2):
+            with ReportWriter("jsonl", path) as writer:
+                writer.write(report)
+
+        lines = path.read_text(encoding="utf-8").splitlines()
+        assert len(lines) == 2
+        record = json.loads(lines[0])
+        assert record["coverage"] == 0.5
+        assert record["timings"]["text"] == 0.25
+        assert record["fields"][1] == {
+            "name": "Email",
+            "expected": "a@b.c",
+            "found": "",
+            "passed": False,
+        }
+
+    def test_json_document(self, report: ValidationReport, tmp_path: Path):
+        """JSON output is a single array of reports."""
+        path = tmp_path / "report.json"
+        with ReportWriter("json", path) as writer:
+            writer.write(report)
+            writer.write(report)
+
+        assert len(json.loads(path.read_text(encoding="utf-8"))) == 2
+
+    def test_junit_document(self, report: ValidationReport, tmp_path: Path):
+        """JUnit output has a suite per resume and a failure per failed field."""
+        path = tmp_path / "report.xml"
+        with ReportWriter("junit", path) as writer:
+            writer.write(report)
+
+        root = ET.parse(path).getroot()
+        assert root.get("tests") == "2"
+        assert root.get("failures") == "1"
+        suite = root.find("testsuite")
+        assert suite is not None
+        assert suite.get("name") == "build/Test_User_CV.pdf"
+        cases = suite.findall("testcase")
+        assert [c.get("name") for c in cases] == ["Name", "Email"]
+        assert cases[1].find("failure") is not None
+        assert cases[1].get("time") == "0.002000"
+
+    def test_unknown_format(self):
+        """Unknown formats are rejected."""
+        with pytest.raises(ValueError):
+            ReportWriter("csv")
+
+
+@pytest.mark.unit
+class TestValidateCommand:
+    """Reports of the validate command."""
+
+    @pytest.fixture
+    def pdfs(self, tmp_path: Path) -> List[Path]:
+        """A readable resume PDF and a corrupt one."""
+        broken = tmp_path / "broken.pdf"
+        broken.write_bytes(b"%PDF-1.4\nnot really a PDF")
+        readable = make_pdf(
+            tmp_path / "resume.pdf", [["Test User", "test@example.com"]]
+        )
+        return [readable, broken]
+
+    def test_unreadable_pdf_is_reported(self, pdfs: List[Path], tmp_path: Path):
+        """A PDF that cannot be read is a failed entry, not a missing one."""
+        result = CliRunner().invoke(
+            app,
+            ["validate", str(RESUME), *map(str, pdfs), "--report", "json"],
+        )
+
+        assert result.exit_code == 1
+        reports = json.loads(result.stdout)
+        assert [r["source"] for r in reports] == [str(p) for p in pdfs]
+        assert reports[0]["error"] is None
+        assert not reports[1]["passed"] and reports[1]["error"]
+        assert "broken.pdf" in result.stderr
+
+    def test_junit_error(self, pdfs: List[Path], tmp_path: Path):
+        """The unreadable PDF becomes a JUnit error."""
+        path = tmp_path / "report.xml"
+        CliRunner().invoke(
+            app,
+            [
+                "validate",
+                str(RESUME),
+                *map(str, pdfs),
+                "--report",
+                "junit",
+                "--report-file",
+                str(path),
+            ],
+        )
+
+        root = ET.parse(path).getroot()
+        assert root.get("errors") == "1"
+        suite = root.findall("testsuite")[1]
+        assert suite.get("errors") == "1"
+        (case,) = suite.findall("testcase")
+        assert case.find("error") is not None
@@ -0,0 +1,119 @@
+"""Tests for the searchable resume index."""
+
+import os
+from pathlib import Path
+from typing import List
+
+import pytest
+
+import resume_ats.search
+from resume_ats.exceptions import ExtractionError, SearchError
+from resume_ats.models import CVData
+from resume_ats.search import ResumeIndex
+
+RESUMES = {
+    "ops.pdf": "Jane Doe\njane@example.com\nDevOps Engineer\nKubernetes Terraform",
+    "java.pdf": "John Roe\njohn@example.com\nBackend Engineer\nJava Kubernetes",
+    "data.pdf": "Ann Poe\nann@example.com\nData Scientist\nPython Terraform",
+}
+
+
+@pytest.mark.unit
+class TestResumeIndex:
+    """Unit tests for ResumeIndex."""
+
+    @pytest.fixture
+    def extracted(self, monkeypatch: pytest.MonkeyPatch) -> List[Path]:
+        """Record extractions; the PDF 'content' is plain text."""
+        calls: List[Path] = []
+
+        class FakeExtractor:
+            def __init__(self, pdf_path: Path) -> None:
+                calls.append(pdf_path)
+                self.text = pdf_path.read_text(encoding="utf-8")
+
+            def extract_all(self) -> CVData:
+                name, email, position, skills = self.text.splitlines()
+                return CVData(
+                    name=name, email=email, position=position, skills=skills.split()
+                )
+
+        monkeypatch.setattr(resume_ats.search, "CVExtractor", FakeExtractor)
+        return calls
+
+    @pytest.fixture
+    def corpus(self, tmp_path: Path) -> Path:
+        """Directory of fake resumes."""
+        root = tmp_path / "pdfs"
+        root.mkdir()
+        for name, text in RESUMES.items():
+            (root / name).write_text(text, encoding="utf-8")
+        return root
+
+    def names(self, index: ResumeIndex, query: str) -> List[str]:
+        return sorted(Path(hit.path).name for hit in index.search(query))
+
+    def test_boolean_queries(self, corpus: Path, tmp_path: Path, extracted):
+        """FTS5 boolean operators select the expected resumes."""
+        with ResumeIndex(tmp_path / "index.db") as index:
+            stats = index.add([corpus])
+
+            assert stats.indexed == 3
+            assert self.names(index, "kubernetes AND terraform NOT java") == ["ops.pdf"]
+            assert self.names(index, "terraform") == ["data.pdf", "ops.pdf"]
+            assert self.names(index, "position:engineer") == ["java.pdf", "ops.pdf"]
+            hit = index.search("scientist")[0]
+            assert hit.name == "Ann Poe"
+            assert "[Scientist]" in hit.snippet
+
+    def test_reindex_is_incremental(self, corpus: Path, tmp_path: Path, extracted):
+        """Only new content is extracted again."""
+        database = tmp_path / "index.db"
+        with ResumeIndex(database) as index:
+            index.add([corpus])
+        assert len(extracted) == 3
+
+        (corpus / "copy.pdf").write_bytes((corpus / "ops.pdf").read_bytes())
+        ops = corpus / "java.pdf"
+        ops.write_text(RESUMES["java.pdf"].replace("Java", "Scala"), "utf-8")
+        stat = ops.stat()
+        os.utime(ops, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        with ResumeIndex(database) as index:
+            stats = index.add([corpus])
+
+            assert (stats.indexed, stats.reused, stats.unchanged) == (1, 1, 2)
+            assert len(extracted) == 4
+            assert len(index) == 3
+            assert self.names(index, "java") == []
+            assert self.names(index, "scala") == ["java.pdf"]
+
+    def test_prune_removes_deleted_files(self, corpus: Path, tmp_path: Path, extracted):
+        """Pruning forgets files that were deleted."""
+        with ResumeIndex(tmp_path / "index.db") as index:
+            index.add([corpus])
+            (corpus / "data.pdf").unlink()
+
+            assert index.add([corpus], prune=True).removed == 1
+            assert self.names(index, "python") == []
+
+    def test_extraction_failures_are_reported(self, tmp_path: Path, monkeypatch):
+        """A broken file does not abort the run."""
+
+        def broken(pdf_path: Path) -> None:
+            raise ExtractionError(f"Could not extract text from {pdf_path}")
+
+        monkeypatch.setattr(resume_ats.search, "CVExtractor", broken)
+        pdf = tmp_path / "broken.pdf"
+        pdf.write_bytes(b"not a pdf")
+
+        with ResumeIndex(tmp_path / "index.db") as index:
+            stats = index.add([pdf])
+
+        assert list(stats.failed) == [str(pdf.resolve())]
+
+    def test_invalid_query(self, tmp_path: Path):
+        """Syntax errors surface as SearchError."""
+        with ResumeIndex(tmp_path / "index.db") as index:
+            with pytest.raises(SearchError):
+                index.search("AND OR (")
@@ -0,0 +1,105 @@
+"""Tests for static site generation."""
+
+import gzip
+import json
+from pathlib import Path
+
+import pytest
+
+from resume_ats import ResumeBuilder
+from resume_ats.models import BuildConfig, ResumeData
+from resume_ats.site import SiteBuilder, minify_css, minify_html
+
+ROOT = Path(__file__).parent.parent
+
+
+def resume(name: str, logo: str) -> ResumeData:
+    """Resume with one job showing a logo."""
+    return ResumeData(
+        basics={"name": name, "email": "a@example.com", "location": {"city": "Paris"}},
+        work=[
+            {
+                "company": "ACME",
+                "position": "Engineer",
+                "startDate": "2020",
+                "logo": logo,
+            }
+        ],
+    )
+
+
+@pytest.mark.unit
+class TestMinify:
+    """Unit tests for the HTML and CSS minifiers."""
+
+    def test_minify_html_keeps_inline_spacing(self):
+        """Whitespace between block tags goes, spacing inside text stays."""
+        html = "<!-- c -->\n<div>\n  <p><strong>A:</strong>\n   <span>b</span></p>\n</div>\n"
+
+        assert (
+            minify_html(html) == "<div><p><strong>A:</strong> <span>b</span></p></div>"
+        )
+
+    def test_minify_css(self):
+        """Comments, spaces and trailing semicolons are removed."""
+        css = "/* x */\nh1 { color: red; margin: 0 auto; }\na > b , i { x: y; }\n"
+
+        assert minify_css(css) == "h1{color: red;margin: 0 auto}a>b,i{x: y}"
+
+
+@pytest.mark.unit
+class TestSiteBuilder:
+    """Site builds against the repository templates."""
+
+    @pytest.fixture
+    def logos(self, tmp_path: Path) -> Path:
+        """Directory with one logo."""
+        logos = tmp_path / "logos"
+        logos.mkdir()
+        (logos / "acme.png").write_bytes(b"\x89PNG fake logo")
+        return logos
+
+    def test_shared_assets_are_published_once(self, tmp_path: Path, logos: Path):
+        """Pages link content-hashed shared assets and get compressed siblings."""
+        output = tmp_path / "site"
+        builder = SiteBuilder(output, template_dir=ROOT / "templates", logos_dir=logos)
+
+        manifest = builder.build(
+            enumerate([resume("Ann Poe", "acme.png"), resume("Bob Roe", "acme.png")])
+        )
+
+        assets = sorted(p.name for p in (output / "assets").iterdir())
+        assert len([a for a in assets if a.endswith(".png")]) == 1
+        assert len([a for a in assets if a.endswith(".css")]) == 1
+        css_name = next(a for a in assets if a.endswith(".css"))
+        logo_name = next(a for a in assets if a.endswith(".png"))
+
+        page = output / "000001_Bob_Roe" / "index.html"
+        html = page.read_text(encoding="utf-8")
+        assert f'href="../assets/{css_name}"' in html
+        assert f'src="../assets/{logo_name}"' in html
+        assert "<style>" not in html and "\n" not in html
+        compressed = (output / "000001_Bob_Roe" / "index.html.gz").read_bytes()
+        assert gzip.decompress(compressed) == page.read_bytes()
+
+        on_disk = json.loads((output / "manifest.json").read_text(encoding="utf-8"))
+        assert set(on_disk) == set(manifest)
+        entry = manifest["000001_Bob_Roe/index.html"]
+        assert entry.size == page.stat().st_size
+        assert "gzip" in entry.encodings
+        assert entry.etag.startswith('"')
+        assert manifest[f"assets/{logo_name}"].encodings == []
+
+    def test_single_html_build_inlines_styles(self, tmp_path: Path):
+        """The standalone HTML build stays self-contained, without logos."""
+        config = BuildConfig(
+            template_dir=ROOT / "templates", output_dir=tmp_path, formats=["html"]
+        )
+        builder = ResumeBuilder.from_data(resume("Ann Poe", "acme.png"), config)
+
+        builder.build_all()
+
+        html = (tmp_path / "index.html").read_text(encoding="utf-8")
+        assert "<style>" in html and "--accent" in html
+        assert "<img" not in html
+        assert not (tmp_path / "logos").exists()
@@ -0,0 +1,147 @@
+"""Tests for the spool directory job queue."""
+
+import json
+import multiprocessing
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from resume_ats.exceptions import SpoolError
+from resume_ats.models import ResumeData
+from resume_ats.spool import Spool, SpoolWorker
+
+ROOT = Path(__file__).parent.parent
+
+
+def resume(name: str) -> ResumeData:
+    """Minimal resume."""
+    return ResumeData(basics={"name": name, "email": "a@example.com"})
+
+
+def work(spool_dir: Path, worker_id: str) -> None:
+    """Worker process draining the spool."""
+    spool = Spool(spool_dir)
+    SpoolWorker(spool, ROOT / "templates", worker_id).run(
+        poll_interval=0.05, exit_when_idle=True
+    )
+
+
+@pytest.mark.unit
+class TestSpool:
+    """Claims, leases and results."""
+
+    def test_workers_share_a_spool(self, tmp_path: Path):
+        """Several worker processes build every job exactly once."""
+        spool = Spool(tmp_path)
+        ids = [spool.submit(resume(f"User {i}"), ["json", "html"]) for i in range(12)]
+
+        context = multiprocessing.get_context("fork")
+        workers = [
+            context.Process(target=work, args=(tmp_path, f"w{i}")) for i in range(3)
+        ]
+        for process in workers:
+            process.start()
+        for process in workers:
+            process.join(60)
+            assert process.exitcode == 0
+
+        statuses = [spool.status(job_id) for job_id in ids]
+        assert all(s.state == "done" for s in statuses)
+        assert not list((tmp_path / "running").iterdir())
+        for i, status in enumerate(statuses):
+            data = json.loads((tmp_path / status.outputs["json"]).read_text())
+            assert data["basics"]["name"] == f"User {i}"
+
+    def test_expired_lease_is_requeued(self, tmp_path: Path):
+        """A job claimed by a dead worker goes back to pending."""
+        spool = Spool(tmp_path, lease=60)
+        job_id = spool.submit(resume("Ann Poe"), ["json"])
+
+        job = spool.claim()
+        assert job is not None and job.id == job_id
+        assert spool.claim() is None
+        assert spool.reclaim_expired() == 0
+
+        stale = time.time() - 120
+        os.utime(tmp_path / "running" / f"{job_id}.{job.token}.json", (stale, stale))
+        assert spool.reclaim_expired() == 1
+        assert spool.status(job_id).state == "pending"
+
+    def test_claim_starts_the_lease(self, tmp_path: Path):
+        """A job that waited in pending longer than the lease is not reclaimed."""
+        spool = Spool(tmp_path, lease=60)
+        job_id = spool.submit(resume("Ann Poe"), ["json"])
+        stale = time.time() - 120
+        os.utime(tmp_path / "pending" / f"{job_id}.json", (stale, stale))
+
+        assert spool.claim() is not None
+        assert spool.reclaim_expired() == 0
+        assert spool.status(job_id).state == "running"
+
+    def test_stalled_worker_does_not_touch_the_new_claim(self, tmp_path: Path):
+        """Two workers race for a reclaimed job; only the live claim counts."""
+        spool = Spool(tmp_path, lease=60)
+        job_id = spool.submit(resume("Ann Poe"), ["json"])
+        stalled = SpoolWorker(spool, ROOT / "templates", "stalled")
+        live = SpoolWorker(spool, ROOT / "templates", "live")
+
+        old = spool.claim()
+        assert old is not None
+        old_status = stalled._build(old, spool.work_dir(old))
+        stale = time.time() - 120
+        os.utime(tmp_path / "running" / f"{job_id}.{old.token}.json", (stale, stale))
+        assert spool.reclaim_expired() == 1
+
+        new = spool.claim()
+        assert new is not None and new.id == job_id and new.token != old.token
+        new_lease = tmp_path / "running" / f"{job_id}.{new.token}.json"
+        os.utime(new_lease, (stale, stale))
+        new_status = live._build(new, spool.work_dir(new))
+
+        # The stalled worker can neither renew nor publish over the new claim
+        assert not spool.heartbeat(old)
+        assert new_lease.stat().st_mtime == pytest.approx(stale)
+        assert not spool.complete(old, old_status)
+        assert spool.status(job_id).state == "running"
+        assert spool.work_dir(new).is_dir()
+
+        assert spool.complete(new, new_status)
+        status = spool.status(job_id)
+        assert status.state == "done" and status.worker == "live"
+        assert not list((tmp_path / "running").iterdir())
+
+    def test_lost_lease_discards_results(self, tmp_path: Path):
+        """A worker whose job was reclaimed does not publish it."""
+        spool = Spool(tmp_path, lease=60)
+        job_id = spool.submit(resume("Ann Poe"), ["json"])
+        worker = SpoolWorker(spool, ROOT / "templates", "slow")
+
+        original = worker._build
+
+        def build_then_lose_lease(job, work_dir):
+            status = original(job, work_dir)
+            os.rename(
+                tmp_path / "running" / f"{job.id}.{job.token}.json",
+                tmp_path / "pending" / f"{job_id}.json",
+            )
+            return status
+
+        worker._build = build_then_lose_lease
+        assert worker.run_once() is None
+        assert spool.status(job_id).state == "pending"
+        assert not (tmp_path / "done" / job_id).exists()
+
+    def test_failed_build_and_unknown_job(self, tmp_path: Path):
+        """Build errors are recorded next to the job."""
+        spool = Spool(tmp_path)
+        job_id = spool.submit(resume("Ann Poe"), ["html"])
+        worker = SpoolWorker(spool, tmp_path / "no-templates", "w")
+
+        status = worker.run_once()
+
+        assert status is not None and status.state == "failed"
+        assert spool.status(job_id).error == status.error
+        with pytest.raises(SpoolError):
+            spool.status("missing")
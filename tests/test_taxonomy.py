@@ -0,0 +1,105 @@
+"""Tests for the skill taxonomy and its compiled index."""
+
+import mmap
+import time
+from pathlib import Path
+
+import pytest
+import yaml
+
+from resume_ats.exceptions import TaxonomyError
+from resume_ats.taxonomy import (
+    SkillTaxonomy,
+    build_index,
+    default_taxonomy,
+    tokenize,
+)
+
+
+@pytest.mark.unit
+class TestSkillTaxonomy:
+    """Unit tests for SkillTaxonomy."""
+
+    @pytest.fixture
+    def taxonomy_file(self, tmp_path: Path) -> Path:
+        """Small taxonomy source file."""
+        source = tmp_path / "skills.yml"
+        source.write_text(
+            yaml.safe_dump(
+                {
+                    "skills": [
+                        {"id": "kubernetes", "name": "Kubernetes", "aliases": ["k8s"]},
+                        {"id": "ci/cd", "name": "CI/CD", "aliases": ["cicd"]},
+                        {"id": "machine learning", "aliases": ["ml"]},
+                        {"id": "learning"},
+                    ]
+                }
+            ),
+            encoding="utf-8",
+        )
+        return source
+
+    def test_tokenize_normalizes_separators(self):
+        """Slashes are split out so spacing variants tokenize identically."""
+        assert tokenize("CI / CD") == tokenize("ci/cd") == ["ci", "/", "cd"]
+        assert tokenize("Node.js and C++.") == ["node.js", "and", "c++"]
+
+    def test_aliases_map_to_canonical_id(self, taxonomy_file: Path, tmp_path: Path):
+        """Aliases and spacing variants resolve to the canonical ID."""
+        taxonomy = SkillTaxonomy.load(taxonomy_file, cache=tmp_path / "cache")
+
+        assert len(taxonomy) == 4
+        assert taxonomy.lookup("K8s") == "kubernetes"
+        assert taxonomy.lookup("ci / cd") == "ci/cd"
+        assert taxonomy.lookup("unknown") is None
+        assert taxonomy.display_name("kubernetes") == "Kubernetes"
+
+    def test_find_prefers_longest_match(self, taxonomy_file: Path, tmp_path: Path):
+        """Multi-token aliases win over their sub-terms."""
+        taxonomy = SkillTaxonomy.load(taxonomy_file, cache=tmp_path / "cache")
+
+        found = taxonomy.find("Machine Learning on k8s with CI / CD")
+        assert found == ["ci/cd", "kubernetes", "machine learning"]
+
+    def test_compiled_index_is_cached(self, taxonomy_file: Path, tmp_path: Path):
+        """The index is compiled once and reused while the source is unchanged."""
+        cache = tmp_path / "cache"
+        SkillTaxonomy.load(taxonomy_file, cache=cache)
+        (index_path,) = cache.glob("*.idx")
+        mtime = index_path.stat().st_mtime_ns
+
+        SkillTaxonomy.load(taxonomy_file, cache=cache)
+        assert list(cache.glob("*.idx")) == [index_path]
+        assert index_path.stat().st_mtime_ns == mtime
+
+    def test_large_taxonomy_loads_quickly(self, tmp_path: Path):
+        """A cached 50k-term index memory-maps in milliseconds."""
+        entries = [
+            {"id": f"skill-{i}", "aliases": [f"alias {i}"]} for i in range(50_000)
+        ]
+        index_path = tmp_path / "big.idx"
+        index_path.write_bytes(build_index(entries))
+
+        start = time.perf_counter()
+        with index_path.open("rb") as f:
+            taxonomy = SkillTaxonomy(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+        elapsed = time.perf_counter() - start
+
+        assert taxonomy.lookup("alias 49999") == "skill-49999"
+        assert elapsed < 0.1
+
+    def test_invalid_entry_raises(self):
+        """Entries without an id are rejected."""
+        with pytest.raises(TaxonomyError):
+            SkillTaxonomy.from_entries([{"name": "No id"}])
+
+    def test_bundled_taxonomy(self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path):
+        """The bundled taxonomy covers the common DevOps vocabulary."""
+        monkeypatch.setenv("RESUME_ATS_CACHE_DIR", str(tmp_path))
+        default_taxonomy.cache_clear()
+        try:
+            taxonomy = default_taxonomy()
+            assert taxonomy.lookup("golang") == "go"
+            assert taxonomy.lookup("GitLab CI") == "gitlab ci"
+        finally:
+            default_taxonomy.cache_clear()
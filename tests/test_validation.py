@@ -0,0 +1,104 @@
+"""Tests for ATS validation and indexed skill matching."""
+
+import pytest
+
+from resume_ats.models import CVData, ResumeData
+from resume_ats.validation import SkillMatcher, expected_skills, validate_cv
+
+
+@pytest.mark.unit
+class TestSkillMatcher:
+    """Unit tests for SkillMatcher."""
+
+    @pytest.fixture
+    def matcher(self) -> SkillMatcher:
+        """Matcher over a typical extracted skill list."""
+        return SkillMatcher(
+            ["kubernetes", "github actions", "go", "postgresql", "terraform"]
+        )
+
+    def test_exact_match(self, matcher: SkillMatcher):
+        """Identical names match exactly."""
+        match = matcher.match("Terraform")
+        assert match.match_type == "exact"
+        assert match.matched == "terraform"
+
+    def test_alias_match_is_exact(self, matcher: SkillMatcher):
+        """Taxonomy aliases resolve to the same canonical skill."""
+        assert matcher.match("k8s").match_type == "exact"
+        assert matcher.match("Golang").matched == "go"
+
+    def test_partial_match(self, matcher: SkillMatcher):
+        """Containment in either direction is a partial match."""
+        match = matcher.match("GitHub")
+        assert match.match_type == "partial"
+        assert match.matched == "github actions"
+
+        assert matcher.match("postgresql 15").match_type == "partial"
+
+    def test_partial_threshold(self):
+        """Partial matches below the length ratio threshold are rejected."""
+        matcher = SkillMatcher(["github actions"], partial_threshold=0.8)
+        assert matcher.match("github").match_type == "missing"
+
+    def test_fuzzy_match(self, matcher: SkillMatcher):
+        """Small misspellings are caught as fuzzy matches."""
+        match = matcher.match("kubernetis")
+        assert match.match_type == "fuzzy"
+        assert match.matched == "kubernetes"
+        assert 0.85 <= match.score < 1.0
+
+    def test_missing(self, matcher: SkillMatcher):
+        """Unrelated skills are reported missing."""
+        assert matcher.match("Photoshop").match_type == "missing"
+
+
+@pytest.mark.unit
+class TestValidateCV:
+    """Unit tests for validate_cv."""
+
+    @pytest.fixture
+    def resume(self) -> ResumeData:
+        """Resume with categorized skills."""
+        return ResumeData(
+            basics={
+                "name": "Test User",
+                "email": "test@example.com",
+                "label": "DevOps Engineer",
+            },
+            skills=[
+                {"name": "Cloud", "keywords": ["**Terraform**", "AWS (EC2, S3)"]},
+                "Docker",
+            ],
+        )
+
+    def test_expected_skills_cleanup(self, resume: ResumeData):
+        """Markdown and annotations are stripped from expected skills."""
+        assert expected_skills(resume) == ["terraform", "aws", "docker"]
+
+    def test_validate_passes(self, resume: ResumeData):
+        """Matching extraction passes every field."""
+        cv = CVData(
+            name="Test User",
+            email="test@example.com",
+            position="DevOps Engineer",
+            skills=["terraform", "docker"],
+        )
+        report = validate_cv(resume, cv)
+
+        assert report.passed
+        assert [f.name for f in report.fields] == [
+            "Name",
+            "Email",
+            "Position",
+            "Skills",
+        ]
+        assert [m.match_type for m in report.skills] == ["exact", "missing", "exact"]
+
+    def test_validate_fails_on_wrong_email(self, resume: ResumeData):
+        """A wrong email fails the report."""
+        cv = CVData(name="Test User", email="x@y.z", position="DevOps Engineer")
+        report = validate_cv(resume, cv)
+
+        assert not report.passed
+        assert not report.fields[1].passed